@@ -51,6 +51,7 @@ def main():
     # Set application information
     app.setApplicationName("MAYA AI")
     app.setApplicationDisplayName("MAYA AI")
+    app.setOrganizationName("MAYA AI")  # Used by QSettings
     
     # Set application style
     app.setStyle('Fusion')
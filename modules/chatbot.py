@@ -1,5 +1,5 @@
 from typing import List, Dict, Any, Optional
-from groq import Groq
+from groq import Groq, AuthenticationError
 from .config import get_api_key
 
 class Chatbot:
@@ -80,3 +80,30 @@ class Chatbot:
         """Clear the conversation history while keeping the system message."""
         self.messages = [self.messages[0]]  # Keep only the system message
         self.conversation_history = []
+
+
+def validate_api_key(api_key: str, model: str = 'llama-3.3-70b-versatile') -> bool:
+    """
+    Check an API key against Groq with a single-token request.
+    
+    Args:
+        api_key: The key to check
+        model: Model to send the request to
+        
+    Returns:
+        bool: False if Groq rejects the key, True otherwise
+        
+    Raises:
+        Exception: If the check fails for any other reason (e.g. no network),
+                   in which case the key's validity is unknown
+    """
+    client = Groq(api_key=api_key)
+    try:
+        client.chat.completions.create(
+            messages=[{"role": "user", "content": "ping"}],
+            model=model,
+            max_tokens=1
+        )
+    except AuthenticationError:
+        return False
+    return True
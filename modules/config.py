@@ -18,6 +18,8 @@ def load_config(config_file: str = 'config.json') -> Dict[str, Any]:
         'max_tokens': 2000,
         'max_messages': 20,
         'temperature': 0.7,
+        'chat_scrollback': 1500,  # Lines kept in the chat window; older ones are in the transcript
+        'ocr_max_side': 3300,  # Longest side, in pixels, of images sent to OCR (Tesseract at 300 DPI)
         'messages': [
             {
                 'role': 'system',
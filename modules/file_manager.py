@@ -4,8 +4,31 @@ File manager module for handling file operations in the MAYA AI Chatbot.
 
 import os
 import json
+import shutil
 from pathlib import Path
 
+# orjson parses and writes JSON several times faster than the json module;
+# fall back to json when it is not installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _loads(data: bytes):
+    """Parse UTF-8 JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj) -> bytes:
+    """Serialise obj as indented UTF-8 JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
 
 class FileManager:
     """Manages file operations for the chatbot application."""
@@ -33,8 +56,7 @@ class FileManager:
         """Load data from a JSON file."""
         try:
             if path.exists():
-                with open(path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return _loads(path.read_bytes())
             return {}
         except Exception as e:
             print(f"Error loading {path}: {e}")
@@ -43,13 +65,32 @@ class FileManager:
     def save_json(self, path: Path, data: dict) -> bool:
         """Save data to a JSON file."""
         try:
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            path.write_bytes(_dumps(data))
             return True
         except Exception as e:
             print(f"Error saving {path}: {e}")
             return False
     
+    def get_todos_path(self, legacy_path: str = "todos.json") -> Path:
+        """
+        Get the path to the todo list file, bringing over an older list.
+        
+        The list used to be kept in the working directory. If the data
+        directory has no list yet, that file is copied in, and left where
+        it was, so upgrading does not lose it.
+        
+        Args:
+            legacy_path: Where the todo list used to be saved
+        """
+        path = self.get_data_path("todos.json")
+        legacy = Path(legacy_path)
+        if not path.exists() and legacy.is_file():
+            try:
+                shutil.copy2(legacy, path)
+            except OSError as e:
+                print(f"Error copying {legacy} to {path}: {e}")
+        return path
+    
     def load_todos(self) -> dict:
         """Load todo list data."""
         path = self.get_data_path("todos.json")
@@ -60,6 +101,28 @@ class FileManager:
         path = self.get_data_path("todos.json")
         return self.save_json(path, data)
     
+    def get_transcript_path(self) -> Path:
+        """Get the path to the chat transcript file."""
+        return self.get_data_path("transcript.txt")
+    
+    def append_transcript(self, text: str, max_bytes: int = 5 * 1024 * 1024) -> bool:
+        """
+        Append text to the chat transcript.
+        
+        When the transcript grows past max_bytes it is rotated to
+        transcript.1.txt (replacing any older rotation) and a new one started.
+        """
+        path = self.get_transcript_path()
+        try:
+            if path.exists() and path.stat().st_size > max_bytes:
+                path.replace(path.with_name("transcript.1.txt"))
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(text)
+            return True
+        except Exception as e:
+            print(f"Error writing transcript {path}: {e}")
+            return False
+    
     def load_voice_settings(self) -> dict:
         """Load voice settings."""
         path = self.get_data_path("voice_settings.json")
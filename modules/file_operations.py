@@ -251,6 +251,7 @@ class FileManager:
         try:
             stat_info = os.stat(file_path)
             return {
+                'path': file_path,
                 'size': stat_info.st_size,
                 'created': datetime.fromtimestamp(stat_info.st_ctime).strftime('%Y-%m-%d %H:%M:%S'),
                 'modified': datetime.fromtimestamp(stat_info.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
@@ -9,14 +9,15 @@ from typing import Optional, List, Dict, Any
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLineEdit, QListWidget, QPushButton,
     QLabel, QComboBox, QCheckBox, QSplitter, QTextEdit, QFileIconProvider,
-    QTreeView, QAbstractItemView, QSizePolicy, QFrame
+    QTreeView, QAbstractItemView, QSizePolicy, QFrame, QWidget
 )
-from PyQt6.QtCore import Qt, QSize, QDir, QModelIndex, pyqtSignal
+from PyQt6.QtCore import Qt, QSize, QDir, QModelIndex, QFileInfo, QThreadPool, pyqtSignal
 from PyQt6.QtGui import QFileSystemModel
 from PyQt6.QtGui import QIcon, QTextCursor, QTextCharFormat, QTextFormat, QColor, QPixmap
 
 from .file_operations import FileManager
 from .styles import get_styles
+from .workers import BatchWorker
 
 
 class FileSearchDialog(QDialog):
@@ -39,6 +40,7 @@ class FileSearchDialog(QDialog):
         self.current_file = None
         self.search_results = []
         self.icon_provider = QFileIconProvider()
+        self._search_worker = None  # Search running on the thread pool, if any
         
         self.setup_ui()
         self.apply_styles()
@@ -181,6 +183,7 @@ class FileSearchDialog(QDialog):
         if not search_text and not self.search_content_check.isChecked():
             return
         
+        self.cancel_search()
         self.results_list.clear()
         self.search_results = []
         
@@ -201,17 +204,33 @@ class FileSearchDialog(QDialog):
         # Prepare file filters
         file_types = [file_type] if file_type != "*" else None
         
-        # Perform the search
-        results = FileManager.find_files(
+        # Walk the directory tree on the thread pool; results arrive in batches
+        worker = BatchWorker(
+            FileManager.find_files,
             root_dir=search_dir,
             pattern=f"*{search_text}*" if not search_in_content else "*",
             content_search=search_text if search_in_content else None,
             file_types=file_types,
             max_depth=10
         )
+        worker.signals.batch_ready.connect(self.add_search_results)
+        worker.signals.finished.connect(self.on_search_finished)
+        worker.signals.error.connect(self.on_search_finished)
+        self._search_worker = worker
+        QThreadPool.globalInstance().start(worker)
+    
+    def cancel_search(self):
+        """Stop the running search, if any."""
+        if self._search_worker is not None:
+            self._search_worker.cancel()
+            self._search_worker = None
+    
+    def add_search_results(self, batch: List[Dict[str, Any]]):
+        """Display a batch of results from the running search."""
+        if self._search_worker is None or self.sender() is not self._search_worker.signals:
+            return  # Batch from a search that has been cancelled
         
-        # Display results
-        for file_info in results:
+        for file_info in batch:
             self.search_results.append(file_info)
             
             # Create a list item with icon and text
@@ -219,8 +238,14 @@ class FileSearchDialog(QDialog):
             self.results_list.addItem(item_text)
             
             # Set icon based on file type
-            icon = self.icon_provider.icon(file_info['path'])
+            icon = self.icon_provider.icon(QFileInfo(file_info['path']))
             self.results_list.item(self.results_list.count() - 1).setIcon(icon)
+    
+    def on_search_finished(self, *args):
+        """Handle the end of a search."""
+        if self._search_worker is None or self.sender() is not self._search_worker.signals:
+            return
+        self._search_worker = None
         
         # Update status
         status = f"Found {len(self.search_results)} results"
@@ -292,6 +317,11 @@ class FileSearchDialog(QDialog):
             self.file_selected.emit(self.current_file)
             self.accept()
     
+    def done(self, result):
+        """Stop any running search when the dialog closes."""
+        self.cancel_search()
+        super().done(result)
+    
     def get_selected_file(self) -> Optional[str]:
         """Get the currently selected file path."""
         return self.current_file
@@ -1,44 +1,224 @@
 import os
+import hashlib
+import importlib
 import logging
-import sys
-from PyQt6.QtWidgets import (QWidget, QMainWindow, QMenuBar, QMenu, QStatusBar,
-                            QVBoxLayout, QTextBrowser, QTextEdit, QPushButton, QApplication,
+import re
+import time
+from functools import partial
+from pathlib import Path
+from PyQt6.QtWidgets import (QWidget, QMainWindow, QMenuBar, QMenu,
+                            QVBoxLayout, QPlainTextEdit, QTextEdit, QPushButton, QApplication,
                             QMessageBox, QProgressBar, QHBoxLayout, QFileDialog,
-                            QInputDialog, QComboBox, QDialog, QGridLayout, QDockWidget,
-                            QLabel, QVBoxLayout, QHBoxLayout, QApplication, QTabWidget)
-from PyQt6.QtCore import Qt, QEvent, pyqtSignal, QUrl, QCoreApplication, QPropertyAnimation, QAbstractAnimation, QTimer, QObject
-from PyQt6.QtGui import (QDesktopServices, QAction, QIcon, QPixmap, QKeySequence,
-                        QKeyEvent, QTextCursor)
-from typing import Optional, Tuple, Dict, Any, List, TYPE_CHECKING
+                            QInputDialog, QDialog, QDialogButtonBox, QDockWidget,
+                            QLabel, QTabWidget, QCheckBox)
+from PyQt6.QtCore import Qt, QEvent, pyqtSignal, QUrl, QTimer, QThreadPool, QSettings
+from PyQt6.QtGui import (QDesktopServices, QAction, QPixmap, QImage, QKeySequence,
+                        QKeyEvent, QTextCursor, QTextCharFormat, QTextDocumentFragment,
+                        QFont)
+from typing import Optional, Tuple, Dict, List, NamedTuple, Callable, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .screen_reader import ScreenReader
+    from .screen_manipulation import ScreenCapture
+    from .voice import VoiceAssistant
+
+logger = logging.getLogger(__name__)
 
 # Local imports
 from .file_manager import FileManager
 from .web_browser import WebBrowser
-from .settings_dialog import SettingsDialog
 from .config import load_config
 from .styles import get_styles
 from .utils import get_greeting
-from .todo import TodoList, TodoWidget
-from .voice import VoiceAssistant
-from .file_search_dialog import FileSearchDialog
-from .terminal import TerminalEmulator
-from .screen_manipulation import ScreenCapture
-from .screen_capture_dialog import ScreenCaptureDialog, ScreenCaptureToolbar
+from .todo import TodoList, TodoReminders, TodoWidget
 from .vscode_integration import VSCodeIntegration
 from .theme_manager import ThemeManager
+from .workers import FileLoader, Worker
 
-from .file_manager import FileManager
-from .web_browser import WebBrowser
-from .settings_dialog import SettingsDialog
-from .config import load_config
-from .styles import get_styles
-from .utils import get_greeting
-from .todo import TodoList, TodoWidget
-from .voice import VoiceAssistant
-from .file_search_dialog import FileSearchDialog
+# "AI" as a whole word, rewritten to "Maya" in user messages
+_AI_RE = re.compile(r'\bAI\b')
+
+# Lines from the bottom within which the chat still auto-scrolls
+# (QPlainTextEdit scrolls by line, not by pixel)
+_AUTOSCROLL_SLACK = 2
+
+class _MenuAction(NamedTuple):
+    """One entry in a menu spec table."""
+    text: str
+    handler: str  # Name of the ChatWindow slot to connect
+    shortcut: Optional[str] = None
+    tip: Optional[str] = None  # Status tip and tooltip
+    name: Optional[str] = None  # Object name, for accessibility
+    attr: Optional[str] = None  # Keep the action on the window as this attribute; makes it checkable
+    args: tuple = ()  # Arguments passed to the slot
+
+
+class _ButtonSpec(NamedTuple):
+    """One of the buttons beside the input box."""
+    attr: str  # Attribute the button is stored under on the window
+    text: str
+    handler: str  # Name of the ChatWindow slot to connect
+    shortcut: str
+    tooltip: str  # Includes the shortcut, so it is not formatted per button
+
+
+_BUTTONS = (
+    _ButtonSpec('send_button', '&Send', 'send_message', 'Ctrl+Return', 'Send message (Ctrl+Return)'),
+    _ButtonSpec('save_button', '&Save Chat', 'save_chat', 'Ctrl+S', 'Save chat to file (Ctrl+S)'),
+    _ButtonSpec('open_button', '&Open File', 'open_file', 'Ctrl+O', 'Open chat file (Ctrl+O)'),
+    _ButtonSpec('clear_button', 'C&lear Chat', 'clear_chat', 'Ctrl+L', 'Clear chat history (Ctrl+L)'),
+    _ButtonSpec('web_search_button', '&Web Search', 'web_search', 'Ctrl+W', 'Search the web (Ctrl+W)'),
+)
+
+
+class _ChatEntry(NamedTuple):
+    """One piece of text appended to the chat display, kept for "Load earlier messages"."""
+    prefix: Optional[QTextDocumentFragment]  # Speaker label, if any
+    text: Optional[str]  # None for content that cannot be re-inserted (opened files)
+    char_format: Optional[QTextCharFormat]
+    blocks: int  # Number of text blocks (lines) it occupies
+
+
+# Messages re-inserted per click of "Load earlier messages"
+_EARLIER_BATCH = 200
+
+# Most lines and characters of a file shown when it is opened from the file search
+_PREVIEW_LINES = 500
+_PREVIEW_CHARS = 256 * 1024
+
+# Longest line shown in the chat; layout time grows sharply with line length
+_MAX_LINE_CHARS = 10000
+
+
+def _crop_long_lines(text: str, max_line: int = _MAX_LINE_CHARS) -> str:
+    """
+    Shorten lines longer than max_line, noting how much of each was cut.
+    
+    Args:
+        text: Text to display
+        max_line: Most characters kept per line
+        
+    Returns:
+        str: The text, with the same number of lines
+    """
+    if len(text) <= max_line:
+        return text
+    return '\n'.join(
+        f"{line[:max_line]} … ({len(line) - max_line} more chars)" if len(line) > max_line else line
+        for line in text.split('\n'))
+
+
+def _read_preview(file_path: str) -> str:
+    """
+    Read the head of a text file for display in the chat.
+    
+    Stops after _PREVIEW_LINES lines or _PREVIEW_CHARS characters, whichever
+    comes first, so the cost does not grow with the file.
+    
+    Args:
+        file_path: Path of the file to read
+        
+    Returns:
+        str: The preview, ending with a note if the file was cut short
+    """
+    # One bounded read; iterating by line would read a huge line whole first
+    with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+        head = f.read(_PREVIEW_CHARS + 1)
+    truncated = len(head) > _PREVIEW_CHARS
+    
+    # Keep the first _PREVIEW_LINES lines; anything after them means more follows
+    lines = head[:_PREVIEW_CHARS].split('\n', _PREVIEW_LINES)
+    if len(lines) > _PREVIEW_LINES:
+        truncated = truncated or bool(lines.pop())
+    preview = '\n'.join(lines).rstrip('\n')
+    if not truncated:
+        return preview
+    size = os.path.getsize(file_path)
+    return preview + f"\n… (truncated, {size} bytes total)"
+
+
+# Menu spec tables: (title, object name, actions); None adds a separator
+_FILE_MENU = ('&File', 'fileMenu', (
+    _MenuAction('&Search Files...', 'show_file_search', 'Ctrl+Shift+F',
+                'Search for files in your project', 'searchFilesAction'),
+    None,
+    _MenuAction('&Settings', 'show_settings', ',',
+                'Configure application settings', 'settingsAction'),
+    _MenuAction('Open Full &Transcript', 'open_transcript', None,
+                'Open the full chat transcript', 'openTranscriptAction'),
+    _MenuAction('Show &To-Do List', 'toggle_todo_list', None,
+                'Show/Hide the To-Do List', 'todoAction', 'todo_action'),
+    None,
+    _MenuAction('E&xit', 'close', 'Ctrl+Q', 'Exit the application', 'exitAction'),
+))
+
+_VOICE_MENU = ('&Voice', 'voiceMenu', (
+    _MenuAction('Enable Voice Control', 'toggle_voice_control', 'Ctrl+Shift+V',
+                'Toggle Voice Control', 'toggleVoiceAction', 'toggle_voice_action'),
+))
+
+_HELP_MENU = ('&Help', 'helpMenu', (
+    _MenuAction('&Features', 'show_features', None,
+                'View features and roadmap', 'featuresAction'),
+    _MenuAction('&About', 'show_about', None, 'About MAYA AI Chatbot', 'aboutAction'),
+))
+
+_ACCESSIBILITY_MENU = ('&Accessibility', 'accessibilityMenu', (
+    _MenuAction('Enable &Screen Reader', 'toggle_screen_reader', 'Ctrl+Alt+R',
+                'Toggle Screen Reader', 'screenReaderAction', 'screen_reader_action'),
+    _MenuAction('Read &Current Element', 'read_current_element', 'Ctrl+Alt+C',
+                'Read Current Element', 'readCurrentAction'),
+    _MenuAction('Read from Cu&rsor', 'read_from_cursor', 'Ctrl+Alt+Space',
+                'Read from Cursor', 'readFromCursorAction'),
+    None,
+    ('Text &Size', 'textSizeMenu', (
+        _MenuAction('Zoom &In', 'increase_text_size', 'Ctrl++',
+                    'Increase Text Size', 'increaseTextAction'),
+        _MenuAction('Zoom &Out', 'decrease_text_size', 'Ctrl+-',
+                    'Decrease Text Size', 'decreaseTextAction'),
+        _MenuAction('&Reset Zoom', 'reset_text_size', 'Ctrl+0',
+                    'Reset Text Size', 'resetZoomAction'),
+    )),
+))
+
+_VSCODE_MENU = ('&VS Code', 'vscodeMenu', (
+    _MenuAction('&Open File...', 'open_in_vscode', 'Ctrl+Shift+O',
+                'Open a file in VS Code', 'vscodeOpenFileAction'),
+    _MenuAction('Open &Folder...', 'open_folder_in_vscode', None,
+                'Open a folder in VS Code', 'vscodeOpenFolderAction'),
+    None,
+    _MenuAction('Command &Palette', 'show_vscode_command_palette', 'Ctrl+Shift+P',
+                'Show VS Code Command Palette', 'vscodeCommandPaletteAction'),
+    None,
+    _MenuAction('Install &Extension...', 'install_vscode_extension', None,
+                'Install a VS Code extension', 'vscodeInstallExtensionAction'),
+    _MenuAction('List &Extensions', 'list_vscode_extensions', None,
+                'List installed VS Code extensions', 'vscodeListExtensionsAction'),
+))
+
+_SETTINGS_MENU = ('&Settings', 'settingsMenu', (
+    ('&Theme', 'themeMenu', (
+        _MenuAction('&Light', 'apply_theme', args=('light',)),
+        _MenuAction('&Dark', 'apply_theme', args=('dark',)),
+        _MenuAction('&System', 'apply_theme', args=('system',)),
+    )),
+    None,
+    _MenuAction('&Character Settings...', 'show_character_settings'),
+))
+
+# Chat file dialogs skip symlink resolution and per-folder icon lookups,
+# which stat every entry and make dialogs slow on large or network folders
+_FILE_DIALOG_OPTIONS = (QFileDialog.Option.DontResolveSymlinks |
+                        QFileDialog.Option.DontUseCustomDirectoryIcons)
+
+# Search engines offered by the web search dialog
+_SEARCH_ENGINES = ('Google', 'Bing', 'DuckDuckGo', 'YouTube')
+
+# Modules imported on first use that _warm_up can load ahead of time
+# when MAYA_WARMUP=1 is set
+_WARMUP_MODULES = ('modules.voice', 'modules.screen_manipulation',
+                   'modules.screen_capture_dialog', 'modules.file_search_dialog',
+                   'modules.settings_dialog')
 
 class CustomTextEdit(QTextEdit):
     """Custom QTextEdit that sends message on Enter and inserts newline on Shift+Enter."""
@@ -63,23 +243,42 @@ class CustomTextEdit(QTextEdit):
 class ChatWindow(QMainWindow):
     """Main chat window UI."""
     
+    # Engine list in the form QInputDialog.getItem takes, built once
+    _SEARCH_ENGINES_QT = list(_SEARCH_ENGINES)
+    
     def __init__(self, parent=None, screen_reader: Optional['ScreenReader'] = None):
         super().__init__(parent)
         self.chatbot = None
-        self.file_manager = FileManager()
+        self.file_manager = None  # Created on first use, see _get_file_manager
         self.web_browser = WebBrowser()
         self.current_file = None
         self.config = load_config()
         self.screen_reader = screen_reader
+        # Mirror of screen_reader.is_enabled(), kept current through state_changed,
+        # so focus events and reading shortcuts can bail out on a plain attribute
+        self._screen_reader_enabled = bool(screen_reader and screen_reader.is_enabled())
+        if screen_reader is not None:
+            screen_reader.state_changed.connect(self._on_screen_reader_state_changed)
+        
+        # Config values read on hot paths; the config is loaded once per window
+        self._max_tokens = self.config.get('max_tokens', 2000)  # Default to 2000 if not set
+        self._chat_scrollback = self.config.get('chat_scrollback', 1500)
+        self._ocr_max_side = self.config.get('ocr_max_side', 3300)
         
         # Initialize theme manager
         self.theme_manager = ThemeManager(QApplication.instance())
         
-        # Initialize screen capture variables
-        self.api_key = os.getenv('GROQ_API_KEY')  # Get API key from environment
-        
-        # Initialize screen capture
-        self.screen_capture = ScreenCapture()
+        # Cached API key; refreshed from the environment when settings are saved
+        self._api_key = os.getenv('GROQ_API_KEY')
+        # Fingerprint of the key the current chatbot was created with
+        self._validated_key_fingerprint = None
+        # Result of checking each key with Groq, keyed by fingerprint
+        self._api_key_cache: Dict[str, bool] = {}
+        self._pending_key_checks = set()
+        
+        # Screen capture pulls in mss, OpenCV and Tesseract; created on first
+        # use, see _get_screen_capture
+        self.screen_capture = None
         self.last_capture = None
         
         # Initialize VS Code integration
@@ -97,9 +296,73 @@ class ChatWindow(QMainWindow):
         # Initialize zoom level
         self.current_zoom = 1.0
         
+        # Speaker prefixes are parsed once and reused for every message
+        self._user_prefix = QTextDocumentFragment.fromHtml("<b>You:</b> ")
+        self._maya_prefix = QTextDocumentFragment.fromHtml("<b>Maya:</b> ")
+        self._plain_format = QTextCharFormat()
+        self._bold_format = QTextCharFormat()
+        self._bold_format.setFontWeight(QFont.Weight.Bold)
+        
+        # (minute, greeting) of the last greeting shown
+        self._greeting_cache = None
+        
+        # Index of the search engine chosen last, offered as the default next time
+        self._last_engine_idx = 0
+        
+        # Thread pool for blocking calls (chat requests, web searches)
+        self.pool = QThreadPool.globalInstance()
+        # True while a chat request is waiting for its response
+        self._in_flight = False
+        
+        # Dialogs built on first use and reused afterwards
+        self._settings_dialog = None
+        self._file_search_dialog = None
+        
+        # Confirmation boxes built by confirm(), reused on later calls, and
+        # the action to run for each open one if the user answers Yes
+        self._confirm_dialogs: Dict[str, QMessageBox] = {}
+        self._confirm_actions: Dict[str, Callable[[], None]] = {}
+        # Set once the user has agreed to exit; see closeEvent
+        self._close_confirmed = False
+        
+        # Folder of the last chat file saved or opened
+        self._last_dir = ""
+        
+        # Background loader for open_file, if one is running
+        self._file_loader = None
+        
+        # OCR requests waiting to be run together, with the callback for each result
+        self._ocr_queue: List[Tuple[QPixmap, Callable[[str], None]]] = []
+        self._ocr_timer = QTimer(self)
+        self._ocr_timer.setSingleShot(True)
+        self._ocr_timer.setInterval(30)
+        self._ocr_timer.timeout.connect(self._flush_ocr)
+        # OCR batches running on the thread pool
+        self._ocr_batches = 0
+        
+        # Recognised speech is sent once no newer text has arrived for 300 ms
+        self._pending_speech = ""
+        self._speech_debounce = QTimer(self)
+        self._speech_debounce.setSingleShot(True)
+        self._speech_debounce.setInterval(300)
+        self._speech_debounce.timeout.connect(self._commit_speech)
+        
+        # Spoken name of each widget that has had focus, keyed by id(widget)
+        self._a11y_names: Dict[int, str] = {}
+        
+        # Auto-scroll requests are coalesced to at most one per frame
+        self._scroll_timer = QTimer(self)
+        self._scroll_timer.setSingleShot(True)
+        self._scroll_timer.setInterval(16)
+        self._scroll_timer.timeout.connect(self._do_autoscroll)
+        
         # Set up the user interface
         self.init_ui()
         
+        # Optionally load the lazily imported modules once the window is up
+        if os.getenv('MAYA_WARMUP') == '1':
+            QTimer.singleShot(500, self._warm_up)
+        
         # Check for API key and initialize chatbot if available
         if self.check_api_key():
             self.init_chatbot()
@@ -107,13 +370,60 @@ class ChatWindow(QMainWindow):
             # If no API key, prompt user to enter it in settings
             self.show_settings()
     
+    def run_in_background(self, fn, *args, on_result=None, on_error=None):
+        """
+        Run a blocking call on the thread pool and hand its outcome back to the GUI thread.
+        
+        Args:
+            fn: Function to call
+            *args: Arguments for fn
+            on_result: Called with fn's return value
+            on_error: Called with the error message if fn raises
+        """
+        worker = Worker(fn, *args)
+        if on_result:
+            worker.signals.result.connect(on_result)
+        if on_error:
+            worker.signals.error.connect(on_error)
+        self.pool.start(worker)
+    
+    def _warm_up(self):
+        """
+        Import the voice and screen capture modules on the thread pool, so the
+        first use of those features does not stall on loading them.
+        """
+        def import_all():
+            for name in _WARMUP_MODULES:
+                importlib.import_module(name)
+        
+        self.run_in_background(
+            import_all,
+            on_result=lambda _: self._status.showMessage("Ready", 2000),
+            on_error=lambda e: logger.warning(f"Warm-up failed: {e}"))
+    
     def init_ui(self):
         """
         Initialize the main window UI.
         
         This method sets up the central widget, layout, menu bar, status bar, 
-        chat display, input area, buttons, and progress bar.
+        chat display, input area, buttons, and progress bar. Repainting is
+        suspended while the widgets are built so the window is laid out and
+        painted once instead of after every addition.
         """
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_ui()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+    
+    def _build_ui(self):
+        """Create the widgets, layouts, menus and status bar for init_ui."""
+        # Fetch the bars once; they are used on every status update
+        self._status = self.statusBar()
+        self._menubar = self.menuBar()
+        self._clipboard = QApplication.clipboard()
+        
         # Create central widget and tab widget
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -128,45 +438,60 @@ class ChatWindow(QMainWindow):
         self.chat_layout = QVBoxLayout(self.chat_tab)
         self.tab_widget.addTab(self.chat_tab, "Chat")
         
-        # Create terminal tab
+        # Create terminal tab; the shell is started when the tab is first opened
         self.terminal_tab = QWidget()
         self.terminal_layout = QVBoxLayout(self.terminal_tab)
-        self.terminal = TerminalEmulator()
-        self.terminal_layout.addWidget(self.terminal)
+        self.terminal = None
+        self._terminal_placeholder = QLabel("Loading terminal...")
+        self._terminal_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.terminal_layout.addWidget(self._terminal_placeholder)
         self.tab_widget.addTab(self.terminal_tab, "Terminal")
+        self.tab_widget.currentChanged.connect(self._init_terminal_tab)
         
         # Set layout for the chat tab
         layout = self.chat_layout
         
-        # Initialize Todo List
-        self.todo_list = TodoList()
+        # Initialize Todo List; reminders fire from startup, while the
+        # widget showing the list is only built when the dock is first opened
+        self.todo_list = TodoList(str(self._get_file_manager().get_todos_path()))
+        self.todo_reminders = TodoReminders(self.todo_list, self)
         
-        # Initialize voice assistant
-        self.voice_assistant = VoiceAssistant()
-        self.voice_assistant.speech_recognized.connect(self.on_speech_recognized)
-        self.voice_assistant.wake_word_detected.connect(self.on_wake_word_detected)
-        self.voice_assistant.error_occurred.connect(self.on_voice_error)
-        self.voice_assistant.listening_changed.connect(self.on_listening_changed)
-        
-        # Set up video for voice mode
-        self._setup_voice_video()
-        self.voice_assistant.listen_in_background()
+        # Voice assistant opens the microphone, so it is only created once
+        # voice control is turned on (see _ensure_voice_assistant)
+        self.voice_assistant = None
         
         # Create menu bar and status bar
         self.create_menu_bar()
-        self.statusBar().showMessage("Ready")
+        self._status.showMessage("Ready")
         
         # Voice status indicator
         self.voice_status_label = QLabel()
         self.voice_status_label.setFixedSize(16, 16)
         self.voice_status_label.setToolTip("Voice status")
-        self.update_voice_status(False)
         
         # Add voice status to status bar
-        self.statusBar().addPermanentWidget(self.voice_status_label)
+        self._status.addPermanentWidget(self.voice_status_label)
         
         # Chat display area (takes most of the space)
-        self.chat_display = QTextBrowser()
+        # Shown when older messages have been pruned from the display
+        self.load_earlier_button = QPushButton("Load earlier messages")
+        self.load_earlier_button.setObjectName("loadEarlierButton")  # For accessibility
+        self.load_earlier_button.clicked.connect(self.load_earlier_messages)
+        self.load_earlier_button.setVisible(False)
+        layout.addWidget(self.load_earlier_button)
+        
+        # Plain-text widget: the chat is append-only, so the rich-text layout
+        # engine of QTextBrowser is not needed
+        self.chat_display = QPlainTextEdit()
+        self.chat_display.setReadOnly(True)
+        self.chat_display.setUndoRedoEnabled(False)  # Read-only log, nothing to undo
+        # Bound scrollback; every exchange is also written to the transcript file,
+        # and everything appended is kept in self._history for load_earlier_messages
+        self.chat_display.setMaximumBlockCount(self._chat_scrollback)
+        self._history: List[_ChatEntry] = []
+        self._history_blocks = 0
+        # Read on every response for auto-scrolling
+        self._chat_scrollbar = self.chat_display.verticalScrollBar()
         self.chat_display.setObjectName("chatDisplay")  # For accessibility
         self.chat_display.setAccessibleDescription("Displays the conversation history")
         self.chat_display.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
@@ -174,7 +499,8 @@ class ChatWindow(QMainWindow):
         
         # Create Todo Dock Widget
         self.todo_dock = QDockWidget("To-Do List", self)
-        self.todo_dock.setWidget(TodoWidget(self.todo_list))
+        self.todo_dock.setWidget(QWidget())  # Real TodoWidget is built when first shown
+        self._todo_widget = None
         self.todo_dock.setFeatures(QDockWidget.DockWidgetFeature.DockWidgetMovable | 
                                   QDockWidget.DockWidgetFeature.DockWidgetFloatable)
         self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.todo_dock)
@@ -193,45 +519,29 @@ class ChatWindow(QMainWindow):
         # Buttons
         button_layout = QVBoxLayout()
         
-        # Configure buttons with accessibility and keyboard navigation
-        def create_button(text, slot, shortcut=None, tooltip=None):
-            btn = QPushButton(text)
-            btn.clicked.connect(slot)
-            if shortcut:
-                btn.setShortcut(shortcut)
-            if tooltip:
-                btn.setToolTip(f"{tooltip} ({shortcut.toString() if shortcut else 'No shortcut'})")
-            btn.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
-            return btn
-        
-        # Create buttons with consistent styling and keyboard shortcuts
-        self.send_button = create_button("&Send", self.send_message, 
-                                       QKeySequence("Ctrl+Return"), "Send message")
-        self.save_button = create_button("&Save Chat", self.save_chat, 
-                                       QKeySequence("Ctrl+S"), "Save chat to file")
-        self.open_button = create_button("&Open File", self.open_file, 
-                                       QKeySequence("Ctrl+O"), "Open chat file")
-        self.clear_button = create_button("C&lear Chat", self.clear_chat, 
-                                        QKeySequence("Ctrl+L"), "Clear chat history")
-        self.web_search_button = create_button("&Web Search", self.web_search, 
-                                              QKeySequence("Ctrl+W"), "Search the web")
-        
-        # Add buttons to layout
-        for btn in [self.send_button, self.save_button, self.open_button, 
-                   self.clear_button, self.web_search_button]:
+        # Create buttons from the spec table, with keyboard shortcuts and
+        # accessible tooltips; properties go to the constructor in one call
+        buttons = []
+        for spec in _BUTTONS:
+            btn = QPushButton(spec.text, shortcut=QKeySequence(spec.shortcut),
+                              toolTip=spec.tooltip, focusPolicy=Qt.FocusPolicy.StrongFocus)
+            btn.clicked.connect(getattr(self, spec.handler))
+            setattr(self, spec.attr, btn)
             button_layout.addWidget(btn)
-            
-        # Set tab order for keyboard navigation
-        self.setTabOrder(self.input_box, self.send_button)
-        self.setTabOrder(self.send_button, self.save_button)
-        self.setTabOrder(self.save_button, self.open_button)
-        self.setTabOrder(self.open_button, self.clear_button)
-        self.setTabOrder(self.clear_button, self.web_search_button)
-        self.setTabOrder(self.web_search_button, self.chat_display)
+            buttons.append(btn)
+        
+        # Keep the buttons together so styling does not have to search for them
+        self._buttons = tuple(buttons)
         
         input_layout.addLayout(button_layout)
         layout.addLayout(input_layout)
         
+        # Set tab order for keyboard navigation, now that the widgets are in the window
+        previous = self.input_box
+        for widget in self._buttons + (self.chat_display,):
+            self.setTabOrder(previous, widget)
+            previous = widget
+        
         # Progress bar
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
@@ -246,15 +556,49 @@ class ChatWindow(QMainWindow):
         # Install event filter for focus tracking
         self.installEventFilter(self)
         
+        # Style everything while updates are still suspended
+        self.apply_styles()
+        
+    def _init_terminal_tab(self, index: int):
+        """Create the terminal emulator the first time its tab is shown."""
+        if self.tab_widget.widget(index) is not self.terminal_tab:
+            return
+        self.tab_widget.currentChanged.disconnect(self._init_terminal_tab)
+        
+        from .terminal import TerminalEmulator
+        self.terminal = TerminalEmulator()
+        self.terminal_layout.replaceWidget(self._terminal_placeholder, self.terminal)
+        self._terminal_placeholder.deleteLater()
+        self._terminal_placeholder = None
+        self.terminal.setFocus()
+    
     def eventFilter(self, obj, event):
         """Handle focus change events for screen reader announcements."""
-        if event.type() == QEvent.Type.FocusIn and self.screen_reader and self.screen_reader.is_enabled():
+        # Most sessions run without a screen reader; check that before the event
+        if self._screen_reader_enabled and event.type() == QEvent.Type.FocusIn:
             widget = QApplication.focusWidget()
             if widget:
-                name = widget.accessibleName() or widget.accessibleDescription() or "No description available"
-                if name:
-                    self.screen_reader.speak(name)
+                self.screen_reader.speak(self._a11y_name(widget))
         return super().eventFilter(obj, event)
+    
+    def _a11y_name(self, widget: QWidget) -> str:
+        """
+        Return the text announced when a widget gains focus, looked up once per widget.
+        
+        Args:
+            widget: The focused widget
+            
+        Returns:
+            str: Its accessible name, or description, or a placeholder
+        """
+        key = id(widget)
+        name = self._a11y_names.get(key)
+        if name is None:
+            name = widget.accessibleName() or widget.accessibleDescription() or "No description available"
+            self._a11y_names[key] = name
+            # Forget the entry when the widget goes, before its id can be reused
+            widget.destroyed.connect(lambda _=None, key=key: self._a11y_names.pop(key, None))
+        return name
         
     def create_menu_bar(self):
         """
@@ -262,65 +606,12 @@ class ChatWindow(QMainWindow):
         Adds File, Voice, Accessibility, and Help menus with various options.
         """
         # Get the main menu bar from the main window
-        menubar = self.menuBar()
+        menubar = self._menubar
         menubar.setObjectName("menuBar")  # For accessibility
         
-        # Create File menu with keyboard shortcut (Alt+F)
-        file_menu = menubar.addMenu('&File')
-        file_menu.setObjectName("fileMenu")  # For accessibility
-        
-        # Add File Search option
-        search_action = QAction('&Search Files...', self)
-        search_action.setShortcut(QKeySequence('Ctrl+Shift+F'))
-        search_action.triggered.connect(self.show_file_search)
-        search_action.setStatusTip('Search for files in your project')
-        search_action.setObjectName("searchFilesAction")  # For accessibility
-        search_action.setToolTip('Search for files in your project')
-        file_menu.addAction(search_action)
-        
-        # Add separator
-        file_menu.addSeparator()
-        
-        # Add Settings option to File menu
-        settings_action = QAction('&Settings', self)  # & indicates keyboard shortcut (Alt+S)
-        settings_action.triggered.connect(self.show_settings)
-        settings_action.setStatusTip('Configure application settings')
-        settings_action.setShortcut(',')
-        settings_action.setObjectName("settingsAction")  # For accessibility
-        settings_action.setToolTip('Configure application settings')
-        file_menu.addAction(settings_action)
-        
-        # Add To-Do List toggle
-        self.todo_action = QAction('Show &To-Do List', self, checkable=True)
-        self.todo_action.triggered.connect(self.toggle_todo_list)
-        self.todo_action.setStatusTip('Show/Hide the To-Do List')
-        self.todo_action.setObjectName("todoAction")  # For accessibility
-        self.todo_action.setToolTip("Toggle To-Do List")
-        file_menu.addAction(self.todo_action)
-        
-        # Add separator
-        file_menu.addSeparator()
-        
-        # Add Exit option to File menu with keyboard shortcut
-        exit_action = QAction('E&xit', self)  # Alt+X shortcut
-        exit_action.setShortcut('Ctrl+Q')  # Additional shortcut
-        exit_action.triggered.connect(self.close)  # Connect to close handler
-        exit_action.setStatusTip('Exit the application')  # Tooltip
-        exit_action.setObjectName("exitAction")  # For accessibility
-        exit_action.setToolTip("Exit Application")
-        file_menu.addAction(exit_action)
-        
-        # Voice menu
-        voice_menu = menubar.addMenu('&Voice')
-        voice_menu.setObjectName("voiceMenu")  # For accessibility
-        
-        # Toggle voice listening
-        self.toggle_voice_action = QAction('Enable Voice Control', self, checkable=True, checked=True)
-        self.toggle_voice_action.triggered.connect(self.toggle_voice_control)
-        self.toggle_voice_action.setShortcut('Ctrl+Shift+V')
-        self.toggle_voice_action.setObjectName("toggleVoiceAction")  # For accessibility
-        self.toggle_voice_action.setToolTip("Toggle Voice Control")
-        voice_menu.addAction(self.toggle_voice_action)
+        # File and Voice menus
+        self._add_menu(menubar, _FILE_MENU)
+        self._add_menu(menubar, _VOICE_MENU)
         
         # Add Accessibility menu if screen reader is available
         if self.screen_reader:
@@ -328,200 +619,151 @@ class ChatWindow(QMainWindow):
         
         # Add VS Code menu if available
         if self.vscode.is_available:
-            vscode_menu = menubar.addMenu('&VS Code')
-            vscode_menu.setObjectName("vscodeMenu")
-            
-            # Open File in VS Code
-            open_file_action = QAction('&Open File...', self)
-            open_file_action.triggered.connect(self.open_in_vscode)
-            open_file_action.setShortcut('Ctrl+Shift+O')
-            open_file_action.setObjectName("vscodeOpenFileAction")
-            open_file_action.setToolTip("Open a file in VS Code")
-            vscode_menu.addAction(open_file_action)
-            
-            # Open Folder in VS Code
-            open_folder_action = QAction('Open &Folder...', self)
-            open_folder_action.triggered.connect(self.open_folder_in_vscode)
-            open_folder_action.setObjectName("vscodeOpenFolderAction")
-            open_folder_action.setToolTip("Open a folder in VS Code")
-            vscode_menu.addAction(open_folder_action)
-            
-            # Add separator
-            vscode_menu.addSeparator()
-            
-            # VS Code Command Palette
-            command_palette_action = QAction('Command &Palette', self)
-            command_palette_action.triggered.connect(self.show_vscode_command_palette)
-            command_palette_action.setShortcut('Ctrl+Shift+P')
-            command_palette_action.setObjectName("vscodeCommandPaletteAction")
-            command_palette_action.setToolTip("Show VS Code Command Palette")
-            vscode_menu.addAction(command_palette_action)
-            
-            # Add separator
-            vscode_menu.addSeparator()
-            
-            # Install Extension
-            install_extension_action = QAction('Install &Extension...', self)
-            install_extension_action.triggered.connect(self.install_vscode_extension)
-            install_extension_action.setObjectName("vscodeInstallExtensionAction")
-            install_extension_action.setToolTip("Install a VS Code extension")
-            vscode_menu.addAction(install_extension_action)
+            self._add_menu(menubar, _VSCODE_MENU)
+        
+        # Help and Settings menus
+        self._add_menu(menubar, _HELP_MENU)
+        self._add_menu(menubar, _SETTINGS_MENU)
+    
+    def _add_menu(self, parent: Union[QMenuBar, QMenu], spec: Tuple[str, str, tuple]) -> QMenu:
+        """
+        Build a menu from a spec table such as _FILE_MENU.
+        
+        Args:
+            parent: Menu bar or menu to add the menu to
+            spec: (title, object name, actions); None in actions adds a
+                separator and a nested spec adds a submenu
             
-            # List Extensions
-            list_extensions_action = QAction('List &Extensions', self)
-            list_extensions_action.triggered.connect(self.list_vscode_extensions)
-            list_extensions_action.setObjectName("vscodeListExtensionsAction")
-            list_extensions_action.setToolTip("List installed VS Code extensions")
-            vscode_menu.addAction(list_extensions_action)
-        
-        # Add Help menu
-        help_menu = menubar.addMenu('&Help')
-        help_menu.setObjectName("helpMenu")  # For accessibility
-        
-        # Add Features option to Help menu
-        features_action = QAction('&Features', self)
-        features_action.triggered.connect(self.show_features)
-        features_action.setStatusTip('View features and roadmap')
-        features_action.setObjectName("featuresAction")  # For accessibility
-        features_action.setToolTip("View features and roadmap")
-        help_menu.addAction(features_action)
-        
-        # Add About option
-        about_action = QAction('&About', self)
-        about_action.triggered.connect(self.show_about)
-        about_action.setObjectName("aboutAction")  # For accessibility
-        about_action.setToolTip("About MAYA AI Chatbot")
-        help_menu.addAction(about_action)
-        
-        # Settings menu
-        settings_menu = menubar.addMenu("&Settings")
-        
-        # Theme submenu
-        theme_menu = settings_menu.addMenu("&Theme")
-        
-        # Add theme actions
-        light_theme_action = QAction("&Light", self)
-        light_theme_action.triggered.connect(lambda: self.apply_theme("light"))
-        theme_menu.addAction(light_theme_action)
-        
-        dark_theme_action = QAction("&Dark", self)
-        dark_theme_action.triggered.connect(lambda: self.apply_theme("dark"))
-        theme_menu.addAction(dark_theme_action)
-        
-        system_theme_action = QAction("&System", self)
-        system_theme_action.triggered.connect(lambda: self.apply_theme("system"))
-        theme_menu.addAction(system_theme_action)
-        
-        # Add separator
-        settings_menu.addSeparator()
-        
-        # Character settings action
-        char_action = QAction("&Character Settings...", self)
-        char_action.triggered.connect(self.show_character_settings)
-        settings_menu.addAction(char_action)
-        
-        # Add separator
-        settings_menu.addSeparator()
-        
-        # Settings action
-        settings_action = QAction("&Preferences...", self)
-        settings_action.triggered.connect(self.show_settings)
-        settings_menu.addAction(settings_action)
+        Returns:
+            QMenu: The new menu
+        """
+        title, object_name, actions = spec
+        menu = parent.addMenu(title)
+        menu.setObjectName(object_name)  # For accessibility
+        for entry in actions:
+            if entry is None:
+                menu.addSeparator()
+                continue
+            if not isinstance(entry, _MenuAction):
+                self._add_menu(menu, entry)
+                continue
+            # Set the properties through the constructor in one call
+            properties = {'checkable': entry.attr is not None}
+            if entry.shortcut:
+                properties['shortcut'] = QKeySequence(entry.shortcut)
+            if entry.tip:
+                properties['statusTip'] = properties['toolTip'] = entry.tip
+            if entry.name:
+                properties['objectName'] = entry.name  # For accessibility
+            action = QAction(entry.text, self, **properties)
+            slot = getattr(self, entry.handler)
+            action.triggered.connect(partial(slot, *entry.args) if entry.args else slot)
+            if entry.attr:
+                setattr(self, entry.attr, action)
+            menu.addAction(action)
+        return menu
     
     def check_api_key(self) -> bool:
         """
         Check if the Groq API key is set and valid.
         
+        A key Groq has already rejected is reported as invalid. A key that has
+        not been checked yet is assumed valid and checked on the thread pool;
+        see _on_api_key_checked.
+        
+        Returns:
+            bool: True if API key exists, is not empty and is not known to be invalid
+        """
+        if not (self._api_key and self._api_key.strip()):  # Check if key exists and is not just whitespace
+            return False
+        
+        fingerprint = self._key_fingerprint(self._api_key)
+        if fingerprint in self._api_key_cache:
+            return self._api_key_cache[fingerprint]
+        
+        if fingerprint not in self._pending_key_checks:
+            from .chatbot import validate_api_key
+            self._pending_key_checks.add(fingerprint)
+            self.run_in_background(
+                validate_api_key,
+                self._api_key.strip(),
+                self.config.get('model', 'llama-3.3-70b-versatile'),
+                on_result=lambda valid: self._on_api_key_checked(fingerprint, valid),
+                on_error=lambda error: self._pending_key_checks.discard(fingerprint))
+        return True
+    
+    def _on_api_key_checked(self, fingerprint: str, valid: bool):
+        """
+        Record the result of a background API key check.
+        
+        Args:
+            fingerprint: Fingerprint of the key that was checked
+            valid: Whether Groq accepted the key
+        """
+        self._pending_key_checks.discard(fingerprint)
+        self._api_key_cache[fingerprint] = valid
+        if fingerprint != self._key_fingerprint(self._api_key):
+            return  # The key has been changed since
+        
+        if valid:
+            if self.chatbot is None:
+                self.init_chatbot()
+        else:
+            self.chatbot = None
+            self._validated_key_fingerprint = None
+            self._status.showMessage("Invalid API key")
+            self._show_message(
+                QMessageBox.Icon.Warning,
+                "Error",
+                "Invalid API key. Please check your settings.")
+    
+    @staticmethod
+    def _key_fingerprint(api_key: Optional[str]) -> Optional[str]:
+        """
+        Get a short hash of an API key, so keys can be compared without storing them.
+        
+        Args:
+            api_key: The API key, or None
+            
         Returns:
-            bool: True if API key exists and is not empty, False otherwise
+            Optional[str]: Hex digest of the stripped key, or None if there is no key
         """
-        api_key = os.getenv('GROQ_API_KEY')
-        return bool(api_key and api_key.strip())  # Check if key exists and is not just whitespace
+        if not api_key:
+            return None
+        return hashlib.blake2b(api_key.strip().encode(), digest_size=8).hexdigest()
     
     def create_accessibility_menu(self, menubar):
         """Create the Accessibility menu with screen reader controls."""
         if not self.screen_reader:
             return
             
-        accessibility_menu = menubar.addMenu('&Accessibility')
-        accessibility_menu.setObjectName("accessibilityMenu")  # For accessibility
-        
-        # Screen reader toggle
-        self.screen_reader_action = QAction('Enable &Screen Reader', self, checkable=True)
-        self.screen_reader_action.setShortcut('Ctrl+Alt+R')
-        self.screen_reader_action.toggled.connect(self.toggle_screen_reader)
+        self._add_menu(menubar, _ACCESSIBILITY_MENU)
+        # triggered only fires for the user, so this does not re-enable the reader
         self.screen_reader_action.setChecked(self.screen_reader.is_enabled())
-        self.screen_reader_action.setObjectName("screenReaderAction")  # For accessibility
-        self.screen_reader_action.setToolTip("Toggle Screen Reader")
-        accessibility_menu.addAction(self.screen_reader_action)
-        
-        # Read current element
-        read_current_action = QAction('Read &Current Element', self)
-        read_current_action.setShortcut('Ctrl+Alt+C')
-        read_current_action.triggered.connect(self.read_current_element)
-        read_current_action.setObjectName("readCurrentAction")  # For accessibility
-        read_current_action.setToolTip("Read Current Element")
-        accessibility_menu.addAction(read_current_action)
-        
-        # Read from cursor
-        read_from_cursor_action = QAction('Read from Cu&rsor', self)
-        read_from_cursor_action.setShortcut('Ctrl+Alt+Space')
-        read_from_cursor_action.triggered.connect(self.read_from_cursor)
-        read_from_cursor_action.setObjectName("readFromCursorAction")  # For accessibility
-        read_from_cursor_action.setToolTip("Read from Cursor")
-        accessibility_menu.addAction(read_from_cursor_action)
-        
-        # Add separator
-        accessibility_menu.addSeparator()
-        
-        # Text size controls
-        text_size_menu = accessibility_menu.addMenu('Text &Size')
-        text_size_menu.setObjectName("textSizeMenu")  # For accessibility
-        
-        # Increase text size
-        increase_text_action = QAction('Zoom &In', self)
-        increase_text_action.setShortcut('Ctrl+Plus')
-        increase_text_action.triggered.connect(self.increase_text_size)
-        increase_text_action.setObjectName("increaseTextAction")  # For accessibility
-        increase_text_action.setToolTip("Increase Text Size")
-        text_size_menu.addAction(increase_text_action)
-        
-        # Decrease text size
-        decrease_text_action = QAction('Zoom &Out', self)
-        decrease_text_action.setShortcut('Ctrl+Minus')
-        decrease_text_action.triggered.connect(self.decrease_text_size)
-        decrease_text_action.setObjectName("decreaseTextAction")  # For accessibility
-        decrease_text_action.setToolTip("Decrease Text Size")
-        text_size_menu.addAction(decrease_text_action)
-        
-        # Reset zoom
-        reset_zoom_action = QAction('&Reset Zoom', self)
-        reset_zoom_action.setShortcut('Ctrl+0')
-        reset_zoom_action.triggered.connect(self.reset_text_size)
-        reset_zoom_action.setObjectName("resetZoomAction")  # For accessibility
-        reset_zoom_action.setToolTip("Reset Text Size")
-        text_size_menu.addAction(reset_zoom_action)
     
     def toggle_screen_reader(self, enabled: bool):
         """Toggle screen reader on/off."""
         if self.screen_reader:
             self.screen_reader.set_enabled(enabled)
             status = "enabled" if enabled else "disabled"
-            self.statusBar().showMessage(f"Screen reader {status}", 3000)
+            self._status.showMessage(f"Screen reader {status}", 3000)
+    
+    def _on_screen_reader_state_changed(self, enabled: bool):
+        """Track whether the screen reader is on (and has a working engine)."""
+        self._screen_reader_enabled = self.screen_reader.is_enabled()
     
     def read_current_element(self):
         """Read the currently focused element."""
-        if not self.screen_reader or not self.screen_reader.is_enabled():
+        if not self._screen_reader_enabled:
             return
             
         focused = QApplication.focusWidget()
         if focused:
-            text = focused.accessibleName() or focused.accessibleDescription() or "No description available"
-            self.screen_reader.speak(text)
+            self.screen_reader.speak(self._a11y_name(focused))
     
     def read_from_cursor(self):
         """Read text from the cursor position."""
-        if not self.screen_reader or not self.screen_reader.is_enabled():
+        if not self._screen_reader_enabled:
             return
             
         focused = QApplication.focusWidget()
@@ -555,7 +797,7 @@ class ChatWindow(QMainWindow):
         self.current_zoom = 1.0
         
         # Update status bar
-        self.statusBar().showMessage("Text size reset to default", 2000)
+        self._status.showMessage("Text size reset to default", 2000)
     
     def adjust_text_size(self, factor):
         """
@@ -583,17 +825,21 @@ class ChatWindow(QMainWindow):
         self.current_zoom = factor
         
         # Update status bar with new size
-        self.statusBar().showMessage(f"Text size: {new_chat_size}pt", 2000)
+        self._status.showMessage(f"Text size: {new_chat_size}pt", 2000)
     
     def show_file_search(self):
         """Show the file search dialog."""
         try:
-            dialog = FileSearchDialog(self, os.getcwd())
-            dialog.file_selected.connect(self.open_file_from_search)
-            dialog.exec()
+            # Built once and kept, so later searches open instantly
+            if self._file_search_dialog is None:
+                from .file_search_dialog import FileSearchDialog
+                self._file_search_dialog = FileSearchDialog(self, os.getcwd())
+                self._file_search_dialog.file_selected.connect(self.open_file_from_search)
+            # open() returns at once; results arrive through file_selected
+            self._file_search_dialog.open()
         except Exception as e:
-            QMessageBox.critical(
-                self,
+            self._show_message(
+                QMessageBox.Icon.Critical,
                 "Error",
                 f"Failed to open file search: {str(e)}"
             )
@@ -604,13 +850,15 @@ class ChatWindow(QMainWindow):
         try:
             if os.path.isfile(file_path):
                 self.current_file = file_path
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                self.chat_display.append(f"<b>File: {os.path.basename(file_path)}</b>\n{content}")
-                self.statusBar().showMessage(f"Opened: {file_path}", 3000)
+                # Show the head of the file only; the rest is never read
+                content = _read_preview(file_path)
+                self._append_entries(
+                    (None, f"File: {os.path.basename(file_path)}", self._bold_format),
+                    (None, content, self._plain_format))
+                self._status.showMessage(f"Opened: {file_path}", 3000)
         except Exception as e:
-            QMessageBox.critical(
-                self,
+            self._show_message(
+                QMessageBox.Icon.Critical,
                 "Error",
                 f"Failed to open file: {str(e)}"
             )
@@ -649,7 +897,8 @@ class ChatWindow(QMainWindow):
         msg.setTextFormat(Qt.TextFormat.RichText)
         msg.setText(features_text)
         msg.setStandardButtons(QMessageBox.StandardButton.Ok)
-        msg.exec()
+        msg.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        msg.open()
     
     def show_about(self):
         """Show the about dialog."""
@@ -663,25 +912,66 @@ class ChatWindow(QMainWindow):
     
     def show_settings(self):
         """
-        Display the settings dialog and handle the result.
-        If settings are accepted and API key is valid, (re)initialize the chatbot.
+        Display the settings dialog.
+        The result is handled by _on_settings_finished once the dialog closes.
         """
-        dialog = SettingsDialog(self, self.voice_assistant, self.theme_manager)
-        dialog.settings_updated.connect(self.on_settings_updated)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
+        # Built once and kept; reload() refreshes it before each showing
+        if self._settings_dialog is None:
+            from .settings_dialog import SettingsDialog
+            self._settings_dialog = SettingsDialog(self, self.voice_assistant, self.theme_manager)
+            self._settings_dialog.settings_updated.connect(self.on_settings_updated)
+            self._settings_dialog.finished.connect(self._on_settings_finished)
+        else:
+            self._settings_dialog.reload(self.voice_assistant)
+        # Window-modal without a nested event loop
+        self._settings_dialog.open()
+    
+    def _on_settings_finished(self, result: int):
+        """
+        If settings were accepted and the API key is valid, (re)initialize the chatbot.
+        
+        Args:
+            result: The dialog's result code
+        """
+        if result == QDialog.DialogCode.Accepted.value:
             if self.check_api_key():
-                # Reinitialize chatbot if API key is valid
-                self.init_chatbot()
+                # Reinitialize chatbot only if the API key actually changed
+                if (self.chatbot is None or
+                        self._key_fingerprint(self._api_key) != self._validated_key_fingerprint):
+                    self.init_chatbot()
             else:
-                QMessageBox.warning(
-                    self,
+                self._show_message(
+                    QMessageBox.Icon.Warning,
                     "Error",
                     "Invalid API key. Please check your settings.")
     
+    def apply_theme(self, theme_name: str):
+        """
+        Apply one of the themes known to the theme manager.
+        
+        Args:
+            theme_name: Name of the theme to apply
+        """
+        if not self.theme_manager.load_theme(theme_name):
+            self._status.showMessage(f"Theme not available: {theme_name}", 3000)
+    
+    def show_character_settings(self):
+        """Show the character settings dialog."""
+        from .character_dialog import CharacterDialog
+        try:
+            assistant = self._ensure_voice_assistant()
+        except Exception as e:
+            self._show_message(QMessageBox.Icon.Critical, "Voice Error", f"Failed to start the voice assistant: {str(e)}")
+            logger.error(f"Voice assistant setup failed: {str(e)}")
+            return
+        dialog = CharacterDialog(assistant, self)
+        dialog.exec()
+    
     def on_settings_updated(self, settings):
         """Handle settings updates from the settings dialog."""
-        # Voice settings are already applied in the dialog
-        pass
+        # Voice settings are already applied in the dialog; the dialog has
+        # also just written the API key to the environment, so re-read it
+        self._api_key = os.getenv('GROQ_API_KEY')
     
     def init_chatbot(self):
         """
@@ -691,30 +981,177 @@ class ChatWindow(QMainWindow):
         try:
             from .chatbot import Chatbot
             self.chatbot = Chatbot(self.config)  # Initialize chatbot with config
+            self._validated_key_fingerprint = self._key_fingerprint(self._api_key)
             self.show_greeting()  # Show welcome message
-            self.statusBar().showMessage("Connected to Groq API")  # Update status
+            self._status.showMessage("Connected to Groq API")  # Update status
         except Exception as e:
             # Show error if chatbot initialization fails
             error_msg = f"Failed to initialize chatbot: {str(e)}"
-            QMessageBox.critical(self, "Error", error_msg)
+            self._show_message(QMessageBox.Icon.Critical, "Error", error_msg)
     
     def show_greeting(self):
         """
         Display a greeting message with the current time in the chat display.
         The greeting is formatted in bold for better visibility.
         """
-        greeting = get_greeting()  # Get formatted greeting with time
-        self.chat_display.append(f"<b>{greeting}</b>")  # Display in bold
+        # The greeting only changes with the time of day, so reuse it within a minute
+        minute = int(time.time() // 60)
+        if self._greeting_cache and self._greeting_cache[0] == minute:
+            greeting = self._greeting_cache[1]
+        else:
+            greeting = get_greeting()  # Get formatted greeting with time
+            self._greeting_cache = (minute, greeting)
+        
+        self._append_entry(None, greeting, self._bold_format)  # Display in bold
+    
+    def _end_cursor(self) -> QTextCursor:
+        """
+        Get a cursor on a new, empty block at the end of the chat display.
+        
+        The cursor has an edit block open so everything inserted through it
+        is laid out in one pass; callers must call endEditBlock() when done.
+        
+        Returns:
+            QTextCursor: Cursor positioned where the next line should go
+        """
+        document = self.chat_display.document()
+        cursor = QTextCursor(document)
+        cursor.beginEditBlock()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        if not document.isEmpty():
+            cursor.insertBlock()
+        return cursor
+    
+    def _append_message(self, prefix: QTextDocumentFragment, text: str):
+        """
+        Append a chat message to the end of the chat display.
+        
+        The speaker prefix is a pre-parsed fragment and the message body is
+        inserted as plain text, so neither goes through the HTML parser and
+        markup typed by the user is shown literally.
+        
+        Args:
+            prefix: Pre-parsed speaker label (e.g. "You:")
+            text: Message body
+        """
+        self._append_entry(prefix, text, self._plain_format)
+    
+    def _append_entry(self, prefix: Optional[QTextDocumentFragment], text: str,
+                      char_format: QTextCharFormat):
+        """
+        Append a line of text to the chat display and record it in the history.
+        
+        Args:
+            prefix: Pre-parsed label to insert before the text, or None
+            text: Text to insert
+            char_format: Format for the text
+        """
+        self._append_entries((prefix, text, char_format))
+    
+    def _append_entries(self, *entries):
+        """
+        Append several (prefix, text, char_format) lines in one edit block,
+        so the document is laid out once for all of them.
+        """
+        entries = [(prefix, _crop_long_lines(text), char_format)
+                   for prefix, text, char_format in entries]
+        cursor = self._end_cursor()
+        for i, (prefix, text, char_format) in enumerate(entries):
+            if i:
+                cursor.insertBlock()
+            if prefix is not None:
+                cursor.insertFragment(prefix)
+            cursor.insertText(text, char_format)
+        cursor.endEditBlock()
+        for prefix, text, char_format in entries:
+            self._record_entry(_ChatEntry(prefix, text, char_format, text.count('\n') + 1))
+    
+    def _record_entry(self, entry: _ChatEntry):
+        """Add an entry to the history and show the button if lines have been pruned."""
+        self._history.append(entry)
+        self._history_blocks += entry.blocks
+        self._update_load_earlier_button()
+    
+    def _reset_history(self):
+        """Forget the history and restore the configured scrollback limit."""
+        self._history = []
+        self._history_blocks = 0
+        self.chat_display.setMaximumBlockCount(self._chat_scrollback)
+        self._update_load_earlier_button()
+    
+    def _update_load_earlier_button(self):
+        """Show "Load earlier messages" only when history is missing from the display."""
+        hidden = self._history_blocks - self.chat_display.blockCount()
+        self.load_earlier_button.setVisible(hidden > 0)
+    
+    def load_earlier_messages(self):
+        """
+        Put back up to _EARLIER_BATCH history entries pruned from the top of the chat.
+        
+        The entry cut in half by pruning is replaced whole, the scrollback
+        limit is raised to fit, and the view stays on the lines the user was
+        reading.
+        """
+        document = self.chat_display.document()
+        hidden = self._history_blocks - document.blockCount()
+        if hidden <= 0:
+            return
+        
+        # Find the first entry that is at least partly on screen
+        first, pruned = 0, 0
+        while pruned + self._history[first].blocks <= hidden:
+            pruned += self._history[first].blocks
+            first += 1
+        end = first + 1 if pruned < hidden else first  # Re-insert a partial entry whole
+        start = end
+        while start > 0 and end - start < _EARLIER_BATCH and self._history[start - 1].text is not None:
+            start -= 1
+        remove = pruned + self._history[first].blocks - hidden if end > first else 0
+        if start == end:
+            return  # Nothing before this point can be re-inserted
+        
+        scrollbar = self._chat_scrollbar
+        position = scrollbar.value()
+        self.chat_display.setMaximumBlockCount(0)
+        
+        cursor = QTextCursor(document)
+        cursor.beginEditBlock()
+        if remove:
+            # Drop what is left of the partially pruned entry
+            if remove < document.blockCount():
+                cursor.movePosition(QTextCursor.MoveOperation.NextBlock,
+                                    QTextCursor.MoveMode.KeepAnchor, remove)
+            else:
+                cursor.movePosition(QTextCursor.MoveOperation.End,
+                                    QTextCursor.MoveMode.KeepAnchor)
+            cursor.removeSelectedText()
+        added = 0
+        for entry in self._history[start:end]:
+            if entry.prefix is not None:
+                cursor.insertFragment(entry.prefix)
+            cursor.insertText(entry.text, entry.char_format)
+            cursor.insertBlock()
+            added += entry.blocks
+        cursor.endEditBlock()
+        
+        self.chat_display.setMaximumBlockCount(document.blockCount())
+        scrollbar.setValue(position + added - remove)
+        self._update_load_earlier_button()
     
     def send_message(self):
         """
         Process and send the user's message to the chatbot.
         Handles input validation, displays the message, and shows the response.
         """
+        # Only one request at a time; Enter, the Send button and voice input
+        # can all call this while a response is still pending
+        if self._in_flight:
+            return
+        
         # Check if chatbot is properly initialized
         if not self.chatbot:
-            QMessageBox.warning(
-                self,
+            self._show_message(
+                QMessageBox.Icon.Warning,
                 "Error",
                 "Chatbot not initialized. Please check your API key."
             )
@@ -723,71 +1160,94 @@ class ChatWindow(QMainWindow):
         # Get and validate user input
         user_input = self.input_box.toPlainText().strip()
         if not user_input:
-            QMessageBox.warning(
-                self,
+            self._show_message(
+                QMessageBox.Icon.Warning,
                 "Empty Message",
                 "Please enter a message."
             )
             return
             
-        # Replace 'AI' with 'Maya' in the user input
-        user_input = user_input.replace('AI', 'Maya')
+        # Replace 'AI' with 'Maya' in the user input, as a whole word only
+        # ("AIRPORT" is left alone); the substring test skips the regex
+        # for the usual message that has no "AI" at all
+        if 'AI' in user_input:
+            user_input = _AI_RE.sub('Maya', user_input)
         
         # Check message length against config limit
-        max_length = self.config.get('max_tokens', 2000)  # Default to 2000 if not set
+        max_length = self._max_tokens
         if len(user_input) > max_length:
-            QMessageBox.warning(
-                self,
+            self._show_message(
+                QMessageBox.Icon.Warning,
                 "Message Too Long",
                 f"Message exceeds maximum length of {max_length} characters."
             )
             return
         
-        try:
-            # Display user's message in the chat
-            self.chat_display.append(f"<b>You:</b> {user_input}")
-            self.input_box.clear()  # Clear input field
-            
-            # Disable send button and show progress bar
-            self.send_button.setEnabled(False)
-            self.progress_bar.setVisible(True)
-            
-            # Process the message (this might take some time)
-            QCoreApplication.processEvents()  # Update UI
-            
-            # Get and display the AI's response
-            response = self.chatbot.get_response(user_input)
-            self.chat_display.append(f"<b>Maya:</b> {response}")
-            
-            # Auto-scroll to the latest message
-            self.chat_display.verticalScrollBar().setValue(
-                self.chat_display.verticalScrollBar().maximum()
-            )
-            
-        except Exception as e:
-            # Show error in status bar and message box
-            error_msg = f"Error: {str(e)}"
-            self.statusBar().showMessage(error_msg)
-            QMessageBox.critical(
-                self,
-                "Error",
-                f"Failed to get response: {str(e)}"
-            )
-        finally:
-            # Re-enable the send button and hide progress bar
-            self.send_button.setEnabled(True)
+        # Display user's message in the chat
+        self._append_message(self._user_prefix, user_input)
+        self.input_box.clear()  # Clear input field
+        
+        # Disable send button and show a busy indicator; the event loop stays
+        # free while the request runs, so it animates without processEvents()
+        self._in_flight = True
+        self.send_button.setEnabled(False)
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setVisible(True)
+        
+        # Get the AI's response on the thread pool so the UI keeps painting
+        self.run_in_background(
+            self.chatbot.get_response, user_input,
+            on_result=lambda response: self._on_response(user_input, response),
+            on_error=self._on_response_error)
+    
+    def _on_response(self, user_input: str, response: str):
+        """Display the AI's response once the request completes."""
+        # Only follow new messages if the user has not scrolled up to read
+        scrollbar = self._chat_scrollbar
+        at_bottom = scrollbar.maximum() - scrollbar.value() <= _AUTOSCROLL_SLACK
+        
+        self._append_message(self._maya_prefix, response)
+        self._get_file_manager().append_transcript(f"You: {user_input}\nMaya: {response}\n")
+        
+        # Auto-scroll to the latest message
+        if at_bottom:
+            self._scroll_timer.start()
+        self._finish_request()
+    
+    def _do_autoscroll(self):
+        """Scroll the chat to the bottom once the pending appends are laid out."""
+        scrollbar = self._chat_scrollbar
+        scrollbar.setValue(scrollbar.maximum())
+    
+    def _on_response_error(self, error: str):
+        """Report a failed chat request."""
+        # Show error in status bar and message box
+        error_msg = f"Error: {error}"
+        self._status.showMessage(error_msg)
+        self._finish_request()
+        self._show_message(
+            QMessageBox.Icon.Critical,
+            "Error",
+            f"Failed to get response: {error}"
+        )
+    
+    def _finish_request(self):
+        """Re-enable the send button and hide the progress bar."""
+        self._in_flight = False
+        self.send_button.setEnabled(True)
+        if not self._ocr_batches:
             self.progress_bar.setVisible(False)
-            self.input_box.setFocus()  # Return focus to input field
+        self.input_box.setFocus()  # Return focus to input field
     
     def save_chat(self):
         """
         Save the current chat conversation to a text file.
         Prompts the user to choose a save location and handles file operations.
         """
-        # Check if there's any content to save
-        if not self.chat_display.toPlainText().strip():
-            QMessageBox.warning(
-                self,
+        # Check if there's any content to save (without copying the text out)
+        if self.chat_display.document().isEmpty():
+            self._show_message(
+                QMessageBox.Icon.Warning,
                 "Empty Chat",
                 "No chat content to save."
             )
@@ -797,28 +1257,41 @@ class ChatWindow(QMainWindow):
         file_path, _ = QFileDialog.getSaveFileName(
             self,  # Parent window
             "Save Chat",  # Dialog title
-            "",  # Start directory (empty for default)
-            "Text Files (*.txt);;All Files (*)"  # File filters
+            self._last_dir,  # Start in the folder used last time
+            "Text Files (*.txt);;All Files (*)",  # File filters
+            options=_FILE_DIALOG_OPTIONS
         )
         
         # If user selected a file path
         if file_path:
-            try:
-                # Ensure .txt extension if not provided
-                if not file_path.lower().endswith('.txt'):
-                    file_path += '.txt'
-                
-                # Write chat content to file
+            self._last_dir = os.path.dirname(file_path)
+            # Ensure .txt extension if not provided
+            if not file_path.lower().endswith('.txt'):
+                file_path += '.txt'
+            
+            # Snapshot the chat here, once; the document may only be read on the
+            # GUI thread, while the write itself runs on the thread pool
+            content = self.chat_display.toPlainText()
+            
+            def write_chat():
                 with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(self.chat_display.toPlainText())
-                
-                # Confirm save to user
-                self.statusBar().showMessage(f"Chat saved to {file_path}")
-                
-            except Exception as e:
-                # Handle file operation errors
-                error_msg = f"Failed to save chat: {str(e)}"
-                QMessageBox.critical(self, "Error", error_msg)
+                    f.write(content)
+                return file_path
+            
+            self._status.showMessage(f"Saving chat to {file_path}...")
+            self.run_in_background(write_chat,
+                                   on_result=self._on_chat_saved,
+                                   on_error=self._on_chat_save_failed)
+    
+    def _on_chat_saved(self, file_path: str):
+        """Confirm a completed save to the user."""
+        self._status.showMessage(f"Chat saved to {file_path}")
+    
+    def _on_chat_save_failed(self, error: str):
+        """Handle file operation errors while saving."""
+        self._status.clearMessage()
+        error_msg = f"Failed to save chat: {error}"
+        self._show_message(QMessageBox.Icon.Critical, "Error", error_msg)
     
     def open_file(self):
         """
@@ -829,57 +1302,137 @@ class ChatWindow(QMainWindow):
         file_path, _ = QFileDialog.getOpenFileName(
             self,  # Parent window
             "Open Chat File",  # Dialog title
-            "",  # Start directory (empty for default)
-            "Text Files (*.txt);;All Files (*)"  # File filters
+            self._last_dir,  # Start in the folder used last time
+            "Text Files (*.txt);;All Files (*)",  # File filters
+            options=_FILE_DIALOG_OPTIONS
         )
         
-        # If user selected a file
+        # If user selected a file, stream it in on a background thread
         if file_path:
-            try:
-                # Read file content with UTF-8 encoding
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Display file content in chat display
-                self.chat_display.setPlainText(content)
-                
-                # Update status bar
-                self.statusBar().showMessage(f"Opened {file_path}")
-                
-            except Exception as e:
-                # Handle file operation errors
-                error_msg = f"Failed to open file: {str(e)}"
-                QMessageBox.critical(self, "Error", error_msg)
+            self._last_dir = os.path.dirname(file_path)
+            self._start_file_load(file_path)
+    
+    def _start_file_load(self, file_path: str):
+        """
+        Replace the chat display contents with a file, loaded in chunks.
+        
+        Repainting is suspended and the block limit lifted until the loader
+        reports that it is done; see _end_file_load.
+        
+        Args:
+            file_path: Path of the text file to load
+        """
+        if self._file_loader is not None:
+            self._file_loader.requestInterruption()
+            self._end_file_load()
+        
+        document = self.chat_display.document()
+        self.chat_display.clear()
+        self._reset_history()
+        self._saved_block_limit = document.maximumBlockCount()
+        document.setMaximumBlockCount(0)
+        self.chat_display.setUpdatesEnabled(False)
+        
+        loader = FileLoader(file_path, parent=self)
+        loader.chunk_ready.connect(self._on_file_chunk)
+        loader.progress.connect(self.progress_bar.setValue)
+        loader.load_finished.connect(self._on_file_loaded)
+        loader.load_failed.connect(self._on_file_load_failed)
+        loader.finished.connect(loader.deleteLater)
+        self._file_loader = loader
+        self._status.showMessage(f"Opening {file_path}...")
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+        loader.start()
+    
+    def _on_file_chunk(self, chunk: str):
+        """Append a chunk of file text emitted by the loader."""
+        if self.sender() is not self._file_loader:
+            return  # Chunk from a load that has been superseded
+        cursor = QTextCursor(self.chat_display.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(chunk, self._plain_format)
+    
+    def _on_file_loaded(self, file_path: str):
+        """Finish a successful file load."""
+        if self.sender() is not self._file_loader:
+            return
+        self._end_file_load()
+        self._status.showMessage(f"Opened {file_path}")
+    
+    def _on_file_load_failed(self, error: str):
+        """Finish a failed file load and report the error."""
+        if self.sender() is not self._file_loader:
+            return
+        self._end_file_load()
+        self._show_message(QMessageBox.Icon.Critical, "Error", f"Failed to open file: {error}")
+    
+    def _end_file_load(self):
+        """Restore the block limit and repainting after a file load."""
+        self._file_loader = None
+        # The file is kept as one history entry that cannot be re-inserted
+        self._record_entry(_ChatEntry(None, None, None, self.chat_display.blockCount()))
+        self.chat_display.document().setMaximumBlockCount(self._saved_block_limit)
+        self.chat_display.setUpdatesEnabled(True)
+        self.progress_bar.setVisible(False)
 
+    def _get_file_manager(self) -> FileManager:
+        """Get the file manager, creating its data directories on first use."""
+        if self.file_manager is None:
+            self.file_manager = FileManager()
+        return self.file_manager
+    
+    def open_transcript(self):
+        """Open the full chat transcript in the system's text viewer."""
+        path = self._get_file_manager().get_transcript_path()
+        if not path.exists():
+            self._show_message(QMessageBox.Icon.Information, "Transcript", "No chat transcript has been saved yet.")
+            return
+        QDesktopServices.openUrl(QUrl.fromLocalFile(str(path)))
+    
     # Screen Capture Methods
+    def _get_screen_capture(self) -> 'ScreenCapture':
+        """
+        Create the screen capture helper on first use.
+        
+        Returns:
+            ScreenCapture: The window's screen capture helper
+        """
+        if self.screen_capture is None:
+            from .screen_manipulation import ScreenCapture
+            self.screen_capture = ScreenCapture()
+        return self.screen_capture
+    
     def capture_full_screen(self):
         """Capture the entire screen."""
         try:
-            self.last_capture = self.screen_capture.capture_screen()
+            self.last_capture = self._get_screen_capture().capture_screen()
             if self.last_capture:
                 self.show_capture_result(self.last_capture)
         except Exception as e:
-            QMessageBox.critical(self, "Capture Error", f"Failed to capture screen: {str(e)}")
+            self._show_message(QMessageBox.Icon.Critical, "Capture Error", f"Failed to capture screen: {str(e)}")
             logger.error(f"Screen capture failed: {str(e)}")
     
     def capture_region(self):
         """Open region selection dialog for screen capture."""
         try:
+            from .screen_capture_dialog import ScreenCaptureDialog
             dialog = ScreenCaptureDialog(self)
             dialog.capture_completed.connect(self.on_capture_completed)
             dialog.exec()
         except Exception as e:
-            QMessageBox.critical(self, "Capture Error", f"Failed to capture region: {str(e)}")
+            self._show_message(QMessageBox.Icon.Critical, "Capture Error", f"Failed to capture region: {str(e)}")
             logger.error(f"Region capture failed: {str(e)}")
     
     def capture_active_window(self):
         """Capture the currently active window."""
         try:
-            self.last_capture = self.screen_capture.capture_active_window()
+            self.last_capture = self._get_screen_capture().capture_active_window()
             if self.last_capture:
                 self.show_capture_result(self.last_capture)
         except Exception as e:
-            QMessageBox.critical(self, "Capture Error", f"Failed to capture active window: {str(e)}")
+            self._show_message(QMessageBox.Icon.Critical, "Capture Error", f"Failed to capture active window: {str(e)}")
             logger.error(f"Active window capture failed: {str(e)}")
     
     def on_capture_completed(self, pixmap, metadata):
@@ -894,18 +1447,33 @@ class ChatWindow(QMainWindow):
             dialog = QDialog(self)
             dialog.setWindowTitle("Screenshot")
             dialog.setMinimumSize(800, 600)
+            # The capture is only referenced by this dialog's slots, so it is
+            # released when WA_DeleteOnClose deletes the dialog and its toolbar
+            dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
             
             layout = QVBoxLayout()
             
-            # Image label
+            # Image label; a fast nearest-neighbour preview is shown at once and
+            # replaced by the smooth one once the dialog is up
             image_label = QLabel()
             image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            # Fixed size and unscaled contents: the pixmap is scaled once here,
+            # never again on resize, and never through a QImage
+            image_label.setFixedSize(780, 500)
+            image_label.setScaledContents(False)
             image_label.setPixmap(pixmap.scaled(780, 500, 
                                              Qt.AspectRatioMode.KeepAspectRatio,
-                                             Qt.TransformationMode.SmoothTransformation))
+                                             Qt.TransformationMode.FastTransformation))
+            smooth_timer = QTimer(dialog)  # Dies with the dialog if it closes first
+            smooth_timer.setSingleShot(True)
+            smooth_timer.timeout.connect(lambda: image_label.setPixmap(
+                pixmap.scaled(780, 500, Qt.AspectRatioMode.KeepAspectRatio,
+                              Qt.TransformationMode.SmoothTransformation)))
+            smooth_timer.start(50)
             
             # Toolbar
-            toolbar = ScreenCaptureToolbar()
+            from .screen_capture_dialog import ScreenCaptureToolbar
+            toolbar = ScreenCaptureToolbar(dialog)
             toolbar.capture_requested.connect(self.capture_region)
             toolbar.save_requested.connect(lambda: self.save_screenshot(pixmap))
             toolbar.copy_requested.connect(lambda: self.copy_to_clipboard(pixmap))
@@ -920,7 +1488,7 @@ class ChatWindow(QMainWindow):
             dialog.exec()
             
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to display capture: {str(e)}")
+            self._show_message(QMessageBox.Icon.Critical, "Error", f"Failed to display capture: {str(e)}")
             logger.error(f"Error showing capture result: {str(e)}")
     
     def save_screenshot(self, pixmap):
@@ -937,28 +1505,99 @@ class ChatWindow(QMainWindow):
                 if not file_path.lower().endswith(('.png', '.jpg', '.jpeg')):
                     file_path += '.png'
                     
-                if pixmap.save(file_path):
-                    QMessageBox.information(self, "Success", f"Screenshot saved to {file_path}")
+                from .screen_manipulation import save_quality
+                if pixmap.save(file_path, None, save_quality(file_path)):
+                    self._show_message(QMessageBox.Icon.Information, "Success", f"Screenshot saved to {file_path}")
                 else:
-                    QMessageBox.warning(self, "Error", "Failed to save screenshot")
+                    self._show_message(QMessageBox.Icon.Warning, "Error", "Failed to save screenshot")
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to save screenshot: {str(e)}")
+            self._show_message(QMessageBox.Icon.Critical, "Error", f"Failed to save screenshot: {str(e)}")
             logger.error(f"Screenshot save failed: {str(e)}")
     
-    def copy_to_clipboard(self, pixmap):
-        """Copy the screenshot to the clipboard."""
+    def copy_to_clipboard(self, payload: Union[QPixmap, str]):
+        """
+        Copy a screenshot or text to the clipboard.
+        
+        Args:
+            payload: Screenshot or text to copy
+        """
         try:
-            clipboard = QApplication.clipboard()
-            clipboard.setPixmap(pixmap)
-            self.statusBar().showMessage("Screenshot copied to clipboard", 3000)
+            if isinstance(payload, QPixmap):
+                self._clipboard.setPixmap(payload)
+                self._status.showMessage("Screenshot copied to clipboard", 3000)
+            else:
+                self._clipboard.setText(payload)
+                self._status.showMessage("Text copied to clipboard", 3000)
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to copy to clipboard: {str(e)}")
+            self._show_message(QMessageBox.Icon.Critical, "Error", f"Failed to copy to clipboard: {str(e)}")
             logger.error(f"Clipboard copy failed: {str(e)}")
     
     def extract_text_from_image(self, pixmap):
-        """Extract text from the screenshot using OCR."""
+        """
+        Extract text from the screenshot using OCR.
+        
+        Requests made within a few milliseconds of each other are queued and
+        recognised in one batch; the text is shown by _show_ocr_text.
+        """
+        self._ocr_queue.append((pixmap, self._show_ocr_text))
+        self._ocr_timer.start()
+    
+    def _flush_ocr(self):
+        """Run OCR for every queued request and hand each result to its callback."""
+        queued, self._ocr_queue = self._ocr_queue, []
+        if not queued:
+            return
+        # Recognition runs on the thread pool; QPixmap may only be used on
+        # the GUI thread, so the worker is given QImages
+        images = [self._ocr_image(pixmap) for pixmap, _ in queued]
+        callbacks = [callback for _, callback in queued]
+        screen_capture = self._get_screen_capture()
+        
+        self._ocr_batches += 1
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setVisible(True)
+        self._status.showMessage("Extracting text...")
+        self.run_in_background(
+            screen_capture.ocr_text_batch, images,
+            on_result=lambda texts: self._on_ocr_done(callbacks, texts),
+            on_error=self._on_ocr_error)
+    
+    def _ocr_image(self, pixmap: QPixmap) -> QImage:
+        """
+        Convert a capture for OCR, shrinking it if its longest side exceeds ocr_max_side.
+        
+        Pixels beyond the resolution the OCR engine works at only cost time.
+        """
+        image = pixmap.toImage()
+        if max(image.width(), image.height()) > self._ocr_max_side:
+            image = image.scaled(self._ocr_max_side, self._ocr_max_side,
+                                 Qt.AspectRatioMode.KeepAspectRatio,
+                                 Qt.TransformationMode.SmoothTransformation)
+        return image
+    
+    def _on_ocr_done(self, callbacks: List[Callable[[str], None]], texts: List[str]):
+        """Hand each OCR result to the callback of the request it belongs to."""
+        self._end_ocr_batch()
+        for callback, text in zip(callbacks, texts):
+            callback(text)
+    
+    def _on_ocr_error(self, error: str):
+        """Report a failed OCR batch."""
+        self._end_ocr_batch()
+        self._show_message(QMessageBox.Icon.Critical, "OCR Error", 
+                           f"Failed to extract text: {error}")
+        logger.error(f"OCR extraction failed: {error}")
+    
+    def _end_ocr_batch(self):
+        """Hide the busy indicator once no OCR batch or chat request is pending."""
+        self._ocr_batches -= 1
+        self._status.clearMessage()
+        if not self._ocr_batches and not self._in_flight:
+            self.progress_bar.setVisible(False)
+    
+    def _show_ocr_text(self, text: str):
+        """Show text extracted by OCR in a dialog."""
         try:
-            text = self.screen_capture.ocr_text(pixmap)
             if text:
                 # Show extracted text in a dialog
                 dialog = QDialog(self)
@@ -977,7 +1616,7 @@ class ChatWindow(QMainWindow):
                                             QDialogButtonBox.StandardButton.Copy)
                 button_box.accepted.connect(dialog.accept)
                 button_box.button(QDialogButtonBox.StandardButton.Copy).clicked.connect(
-                    lambda: self.copy_to_clipboard_text(text))
+                    lambda: self.copy_to_clipboard(text))
                 
                 # Add widgets to layout
                 layout.addWidget(text_edit)
@@ -986,41 +1625,95 @@ class ChatWindow(QMainWindow):
                 dialog.setLayout(layout)
                 dialog.exec()
             else:
-                QMessageBox.information(self, "No Text Found", 
-                                     "No text could be extracted from the image.")
+                self._show_message(QMessageBox.Icon.Information, "No Text Found", 
+                                   "No text could be extracted from the image.")
         except Exception as e:
-            QMessageBox.critical(self, "OCR Error", 
-                               f"Failed to extract text: {str(e)}")
-            logger.error(f"OCR extraction failed: {str(e)}")
+            self._show_message(QMessageBox.Icon.Critical, "OCR Error", 
+                               f"Failed to show extracted text: {str(e)}")
+            logger.error(f"Showing OCR text failed: {str(e)}")
+    
+    def confirm(self, key: str, title: str, text: str, on_yes: Callable[[], None]):
+        """
+        Ask a yes/no question that the user can choose not to be asked again.
+        
+        The box is window-modal but opened with open(), not exec(), so queued
+        signals from workers and the voice thread keep being delivered while
+        it is up. The answer to "Don't ask again" is stored in QSettings under
+        ui/confirm_<key>, and each question's message box is built once and
+        reused.
+        
+        Args:
+            key: Name of the question, used for the setting and the cached box
+            title: Dialog title
+            text: Question to ask
+            on_yes: Called if the user confirms; called at once if they asked
+                not to be asked again
+        """
+        if not QSettings().value(f"ui/confirm_{key}", True, type=bool):
+            on_yes()
+            return
+        
+        box = self._confirm_dialogs.get(key)
+        if box is None:
+            box = QMessageBox(QMessageBox.Icon.Question, title, text,
+                              QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                              self)
+            box.setDefaultButton(QMessageBox.StandardButton.No)
+            box.setCheckBox(QCheckBox("Don't ask again", box))
+            box.finished.connect(lambda result, key=key: self._on_confirm_finished(key))
+            self._confirm_dialogs[key] = box
+        elif box.isVisible():
+            return
+        box.checkBox().setChecked(False)
+        self._confirm_actions[key] = on_yes
+        box.open()
+    
+    def _show_message(self, icon: QMessageBox.Icon, title: str, text: str):
+        """
+        Show an information, warning or error message without blocking.
+        
+        Like confirm(), the box is opened with open() rather than exec(), so
+        the event loop keeps running while it is up.
+        
+        Args:
+            icon: Icon to show
+            title: Dialog title
+            text: Message to show
+        """
+        box = QMessageBox(icon, title, text, QMessageBox.StandardButton.Ok, self)
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        box.open()
+    
+    def _on_confirm_finished(self, key: str):
+        """
+        Run the pending action of a confirm() box if the user answered Yes.
+        
+        Args:
+            key: Name of the question that was answered
+        """
+        box = self._confirm_dialogs[key]
+        on_yes = self._confirm_actions.pop(key, None)
+        if box.standardButton(box.clickedButton()) != QMessageBox.StandardButton.Yes:
+            return
+        if box.checkBox().isChecked():
+            QSettings().setValue(f"ui/confirm_{key}", False)
+        if on_yes is not None:
+            on_yes()
     
-    def copy_to_clipboard_text(self, text):
-        """Copy text to the clipboard."""
-        try:
-            clipboard = QApplication.clipboard()
-            clipboard.setText(text)
-            self.statusBar().showMessage("Text copied to clipboard", 3000)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to copy text: {str(e)}")
-            logger.error(f"Text copy failed: {str(e)}")
-
     def clear_chat(self):
         """
         Clear the chat display after user confirmation.
         Preserves the greeting message after clearing.
         """
-        # Ask for confirmation before clearing
-        reply = QMessageBox.question(
-            self,  # Parent window
-            "Clear Chat",  # Dialog title
-            "Are you sure you want to clear the chat?",  # Message
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,  # Buttons
-            QMessageBox.StandardButton.No  # Default button
-        )
-        
         # Clear only if user confirms
-        if reply == QMessageBox.StandardButton.Yes:
-            self.chat_display.clear()  # Clear the display
-            self.show_greeting()  # Show fresh greeting
+        self.confirm("clear_chat", "Clear Chat", "Are you sure you want to clear the chat?",
+                     self._do_clear_chat)
+    
+    def _do_clear_chat(self):
+        """Clear the chat display and show a fresh greeting."""
+        self.chat_display.clear()  # Clear the display
+        self._reset_history()
+        self.show_greeting()  # Show fresh greeting
     
     def web_search(self):
         """
@@ -1030,31 +1723,39 @@ class ChatWindow(QMainWindow):
         # Get and validate user input
         user_input = self.input_box.toPlainText().strip()
         if not user_input:
-            QMessageBox.warning(self, "Empty Query", "Please enter a search query.")
+            self._show_message(QMessageBox.Icon.Warning, "Empty Query", "Please enter a search query.")
             return
         
-        # Define available search engines and show selection dialog
-        engines = ['Google', 'Bing', 'DuckDuckGo', 'YouTube']
+        # Show search engine selection dialog
         engine, ok = QInputDialog.getItem(
             self,                           # Parent widget
             "Select Search Engine",         # Dialog title
             "Choose your preferred search engine:",  # Dialog message
-            engines,                        # List of items to show
-            0,                              # Default selected index
+            self._SEARCH_ENGINES_QT,        # List of items to show
+            self._last_engine_idx,          # Default to the last engine used
             False                           # Not editable
         )
         
         # If user selected an engine and clicked OK
         if ok and engine:
-            try:
-                # Perform the search using the selected engine
-                self.web_browser.search(user_input, engine)
-                # Clear the input box after successful search
-                self.input_box.clear()
-            except Exception as e:
-                # Show error message if search fails
-                error_msg = f"Failed to perform search: {str(e)}"
-                QMessageBox.critical(self, "Error", error_msg)
+            self._last_engine_idx = _SEARCH_ENGINES.index(engine)
+            # webbrowser.open can block while it launches the browser, so run
+            # the search on the thread pool
+            self.run_in_background(self.web_browser.search_web, user_input, engine,
+                                   on_result=self._on_search_done,
+                                   on_error=self._on_search_error)
+            # Clear the input box; the query has been handed off
+            self.input_box.clear()
+    
+    def _on_search_done(self, opened):
+        """Report a web search that could not open the browser."""
+        if not opened:
+            self._on_search_error("could not open the web browser")
+    
+    def _on_search_error(self, error: str):
+        """Show an error message if the search fails."""
+        error_msg = f"Failed to perform search: {error}"
+        self._show_message(QMessageBox.Icon.Critical, "Error", error_msg)
     
     def toggle_todo_list(self, checked):
         """
@@ -1063,22 +1764,69 @@ class ChatWindow(QMainWindow):
         Args:
             checked: Whether the action is checked
         """
+        if checked and self._todo_widget is None:
+            self._todo_widget = TodoWidget(self.todo_list, reminders=self.todo_reminders)
+            self.todo_dock.setWidget(self._todo_widget)
         self.todo_dock.setVisible(checked)
         self.todo_action.setText('Hide &To-Do List' if checked else 'Show &To-Do List')
     
     # Voice Assistant Methods
     def on_wake_word_detected(self):
         """Handle wake word detection."""
-        self.statusBar().showMessage("Wake word detected! How can I help you?", 3000)
+        self._status.showMessage("Wake word detected! How can I help you?", 3000)
         self.update_voice_status(True)
         
     def on_speech_recognized(self, text):
-        """Handle recognized speech."""
-        self.statusBar().showMessage(f"Recognized: {text}", 3000)
-        self.input_box.setPlainText(text)
-        self.send_message()
+        """
+        Handle recognized speech.
+        
+        The text is held until the recogniser has been quiet for a moment, so
+        a burst of hypotheses for one utterance sends a single message.
+        """
+        self._status.showMessage(f"Recognized: {text}", 3000)
+        self._pending_speech = text
+        self._speech_debounce.start()
+    
+    def _commit_speech(self):
+        """Send the latest recognized speech as a message."""
+        text, self._pending_speech = self._pending_speech, ""
+        if text:
+            self.input_box.setPlainText(text)
+            self.send_message()
+        
+    def _ensure_voice_assistant(self) -> 'VoiceAssistant':
+        """
+        Create the voice assistant on first use.
         
-    def _setup_voice_video(self):
+        Returns:
+            VoiceAssistant: The window's voice assistant
+        """
+        if self.voice_assistant is None:
+            # Imported here: speech_recognition and pyttsx3 load the audio stack
+            from .voice import VoiceAssistant
+            assistant = VoiceAssistant()
+            # The signals are emitted from the listening thread; queue them
+            # so the slots always run on the GUI thread
+            queued = Qt.ConnectionType.QueuedConnection
+            assistant.speech_recognized.connect(self.on_speech_recognized, queued)
+            assistant.wake_word_detected.connect(self.on_wake_word_detected, queued)
+            assistant.error_occurred.connect(self.on_voice_error, queued)
+            assistant.listening_changed.connect(self.on_listening_changed, queued)
+            
+            # Set up video for voice mode
+            self._setup_voice_video(assistant)
+            
+            # Decode the status icons once; update_voice_status just swaps them
+            self._pix_mic_on = QPixmap("resources/icons/voice_on.png")
+            self._pix_mic_off = QPixmap("resources/icons/voice_off.png")
+            self._last_mic_state = None
+            
+            # Only kept once fully set up, so a failure here is retried next time
+            self.voice_assistant = assistant
+            self.update_voice_status(False)
+        return self.voice_assistant
+    
+    def _setup_voice_video(self, assistant: 'VoiceAssistant'):
         """Set up the video player for voice mode."""
         # Look for video file in resources
         video_extensions = ['.mp4', '.webm', '.mov']
@@ -1102,12 +1850,12 @@ class ChatWindow(QMainWindow):
             print("Please add a video file (MP4, WebM, or MOV) to enable video during voice mode.")
             print(f"Expected location: {video_dir.absolute()}")
         else:
-            self.voice_assistant.set_video_file(video_file)
+            assistant.set_video_file(video_file)
     
     def on_voice_error(self, error_msg):
         """Handle voice assistant errors."""
-        QMessageBox.warning(self, "Voice Error", error_msg)
-        self.statusBar().showMessage(error_msg, 5000)
+        self._show_message(QMessageBox.Icon.Warning, "Voice Error", error_msg)
+        self._status.showMessage(error_msg, 5000)
     
     def on_listening_changed(self, is_listening):
         """Update UI when listening state changes."""
@@ -1115,11 +1863,14 @@ class ChatWindow(QMainWindow):
     
     def update_voice_status(self, is_listening):
         """Update the voice status indicator."""
+        if is_listening == self._last_mic_state:
+            return  # Already showing this state
+        self._last_mic_state = is_listening
         if is_listening:
-            self.voice_status_label.setPixmap(QPixmap("resources/icons/voice_on.png"))
+            self.voice_status_label.setPixmap(self._pix_mic_on)
             self.voice_status_label.setToolTip("Voice control is active")
         else:
-            self.voice_status_label.setPixmap(QPixmap("resources/icons/voice_off.png"))
+            self.voice_status_label.setPixmap(self._pix_mic_off)
             self.voice_status_label.setToolTip("Voice control is inactive")
     
     # VS Code Integration Methods
@@ -1130,9 +1881,9 @@ class ChatWindow(QMainWindow):
         
         if file_path:
             if self.vscode.open_file(file_path):
-                self.statusBar().showMessage(f"Opened {file_path} in VS Code", 3000)
+                self._status.showMessage(f"Opened {file_path} in VS Code", 3000)
             else:
-                QMessageBox.warning(self, "Error", "Failed to open file in VS Code")
+                self._show_message(QMessageBox.Icon.Warning, "Error", "Failed to open file in VS Code")
     
     def open_folder_in_vscode(self):
         """Open a folder in VS Code."""
@@ -1141,16 +1892,16 @@ class ChatWindow(QMainWindow):
         
         if folder_path:
             if self.vscode.open_folder(folder_path):
-                self.statusBar().showMessage(f"Opened {folder_path} in VS Code", 3000)
+                self._status.showMessage(f"Opened {folder_path} in VS Code", 3000)
             else:
-                QMessageBox.warning(self, "Error", "Failed to open folder in VS Code")
+                self._show_message(QMessageBox.Icon.Warning, "Error", "Failed to open folder in VS Code")
     
     def show_vscode_command_palette(self):
         """Show the VS Code command palette."""
         if self.vscode.execute_command("workbench.action.quickOpen"):
-            self.statusBar().showMessage("VS Code command palette opened", 2000)
+            self._status.showMessage("VS Code command palette opened", 2000)
         else:
-            QMessageBox.warning(self, "Error", "Failed to open VS Code command palette")
+            self._show_message(QMessageBox.Icon.Warning, "Error", "Failed to open VS Code command palette")
     
     def install_vscode_extension(self):
         """Install a VS Code extension."""
@@ -1160,10 +1911,10 @@ class ChatWindow(QMainWindow):
         
         if ok and extension_id:
             if self.vscode.install_extension(extension_id):
-                QMessageBox.information(self, "Success", 
+                self._show_message(QMessageBox.Icon.Information, "Success", 
                     f"Successfully installed extension: {extension_id}")
             else:
-                QMessageBox.warning(self, "Error", 
+                self._show_message(QMessageBox.Icon.Warning, "Error", 
                     f"Failed to install extension: {extension_id}")
     
     def list_vscode_extensions(self):
@@ -1171,8 +1922,8 @@ class ChatWindow(QMainWindow):
         extensions = self.vscode.list_extensions()
         
         if not extensions:
-            QMessageBox.information(self, "VS Code Extensions", 
-                                 "No extensions found or VS Code is not available.")
+            self._show_message(QMessageBox.Icon.Information, "VS Code Extensions", 
+                               "No extensions found or VS Code is not available.")
             return
         
         # Create a dialog to display extensions
@@ -1210,174 +1961,58 @@ class ChatWindow(QMainWindow):
     def toggle_voice_control(self, enabled):
         """Enable or disable voice control."""
         if enabled:
-            self.voice_assistant.listen_in_background()
-            self.statusBar().showMessage("Voice control enabled", 2000)
+            try:
+                self._ensure_voice_assistant().listen_in_background()
+            except Exception as e:
+                self.toggle_voice_action.setChecked(False)
+                self._show_message(QMessageBox.Icon.Critical, "Voice Error", f"Failed to start voice control: {str(e)}")
+                logger.error(f"Voice assistant setup failed: {str(e)}")
+                return
+            self._status.showMessage("Voice control enabled", 2000)
         else:
-            self.voice_assistant.stop()
-            self.statusBar().showMessage("Voice control disabled", 2000)
+            if self.voice_assistant is not None:
+                self.voice_assistant.stop()
+            self._status.showMessage("Voice control disabled", 2000)
     
     def closeEvent(self, event):
         """
         Handle the window close event.
-        Shows a confirmation dialog before closing the application.
+        Shows a confirmation dialog before closing the application, unless
+        the user has ticked "Don't ask again".
+        
+        The first close is always ignored; once the user confirms,
+        _confirm_close closes the window again and this time it is accepted.
         
         Args:
             event: The close event
         """
-        # Show confirmation dialog
-        reply = QMessageBox.question(
-            self,                           # Parent widget
-            "Exit MAYA",                    # Dialog title
-            "Are you sure you want to exit?",  # Dialog message
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,  # Buttons
-            QMessageBox.StandardButton.No  # Default button
-        )
-        
-        # Process user's choice
-        if reply == QMessageBox.StandardButton.Yes:
-            # Save todo list before closing
-            if hasattr(self, 'todo_list'):
-                self.todo_list.save()
-            # Stop voice assistant
-            if hasattr(self, 'voice_assistant'):
-                self.voice_assistant.stop()
-            # Close the application
-            event.accept()
-        else:
-            # Cancel the close event
+        if not self._close_confirmed:
             event.ignore()
+            self.confirm("exit", "Exit MAYA", "Are you sure you want to exit?",
+                         self._confirm_close)
+            return
+        
+        self._close_confirmed = False
+        # Save todo list before closing
+        if hasattr(self, 'todo_list'):
+            self.todo_list.save()
+        # Stop voice assistant
+        if self.voice_assistant is not None:
+            self.voice_assistant.stop()
+        # Close the application
+        event.accept()
+    
+    def _confirm_close(self):
+        """Close the window now that the user has agreed to exit."""
+        self._close_confirmed = True
+        # Deferred: close() is ignored while a closeEvent is being handled
+        QTimer.singleShot(0, self.close)
     
     def apply_styles(self):
         """
-        Apply CSS styles and animations to all UI components.
-        Loads styles from the styles module and sets up button hover effects.
+        Apply CSS styles to all UI components.
+        Button hover and pressed effects come from the :hover/:pressed rules
+        in the stylesheet, so no per-button event handlers are needed.
         """
         # Apply the combined CSS styles from the styles module
         self.setStyleSheet(get_styles())
-        
-        # Add hover effects to all buttons in the window
-        for btn in self.findChildren(QPushButton):
-            # Set up enter and leave event handlers for hover effect
-            btn.enterEvent = lambda e, b=btn: self.animate_button(b, True)
-            btn.leaveEvent = lambda e, b=btn: self.animate_button(b, False)
-    
-    def animate_button(self, button, hover):
-        """
-        Create a hover animation effect for buttons.
-        
-        Args:
-            button: The button widget to animate
-            hover: Boolean indicating if the mouse is entering (True) or leaving (False) the button
-        """
-        # Create a property animation for the button's geometry
-        animation = QPropertyAnimation(button, b"geometry")
-        animation.setDuration(150)  # Animation duration in milliseconds
-        
-        # Adjust button size based on hover state
-        if hover:
-            # Expand button slightly on hover
-            animation.setEndValue(button.geometry().adjusted(-2, -2, 2, 2))
-        else:
-            # Return to original size when not hovering
-            animation.setEndValue(button.geometry().adjusted(2, 2, -2, -2))
-        
-        # Start the animation and clean up when done
-        animation.start(QAbstractAnimation.DeletionPolicy.DeleteWhenStopped)
-        # Buttons in a horizontal layout below the input box
-        button_layout = QHBoxLayout()
-        button_layout.setSpacing(10)
-        
-        # Create and add buttons to the horizontal layout
-        buttons = [
-            ("Send", self.send_message, 100),
-            ("Save Chat", self.save_chat, 100),
-            ("Open File", self.open_file, 100),
-            ("Clear Chat", self.clear_chat, 100),
-            ("Web Search", self.web_search, 100)
-        ]
-        
-        for text, handler, width in buttons:
-            button = QPushButton(text)
-            button.clicked.connect(handler)
-            if width:
-                button.setMinimumWidth(width)
-            button_layout.addWidget(button)
-        
-        # Add stretch to distribute buttons evenly
-        button_layout.addStretch()
-        
-        # Create a container widget for the button layout
-        button_container = QWidget()
-        button_container.setLayout(button_layout)
-        
-        # Add button container to grid (below input box, full width)
-        main_grid.addWidget(button_container, 2, 0, 1, 3)  # Row 2, Column 0-2, spans 3 columns
-        
-        # Progress bar at the bottom
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setVisible(False)
-        main_grid.addWidget(self.progress_bar, 3, 0, 1, 3)  # Row 3, Column 0-2, spans 3 columns
-        
-        # Set stretch factors
-        main_grid.setRowStretch(0, 1)  # Chat display expands
-        main_grid.setRowStretch(1, 0)  # Input area fixed height
-        main_grid.setRowStretch(2, 0)  # Input area fixed height
-        main_grid.setRowStretch(3, 0)  # Progress bar fixed height
-        
-        # Settings action
-        settings_action = QAction('&Settings', self)
-        settings_action.setShortcut('Ctrl+,')
-        settings_action.triggered.connect(self.show_settings)
-        file_menu.addAction(settings_action)
-
-        # Toggle Todo List action
-        self.toggle_todo_action = QAction('Show &To-Do List', self, checkable=True)
-        self.toggle_todo_action.setShortcut('Ctrl+T')
-        self.toggle_todo_action.toggled.connect(self.toggle_todo_list)
-        file_menu.addAction(self.toggle_todo_action)
-
-        # Screen Capture menu
-        capture_menu = menubar.addMenu('&Capture')
-        
-        # Full screen capture
-        full_screen_action = QAction('Capture &Full Screen', self)
-        full_screen_action.setShortcut('Ctrl+Shift+F')
-        full_screen_action.triggered.connect(self.capture_full_screen)
-        capture_menu.addAction(full_screen_action)
-        
-        # Region capture
-        region_action = QAction('Capture &Region', self)
-        region_action.setShortcut('Ctrl+Shift+R')
-        region_action.triggered.connect(self.capture_region)
-        capture_menu.addAction(region_action)
-        
-        # Active window capture
-        window_action = QAction('Capture &Active Window', self)
-        window_action.setShortcut('Ctrl+Shift+W')
-        window_action.triggered.connect(self.capture_active_window)
-        capture_menu.addAction(window_action)
-        
-        capture_menu.addSeparator()
-        
-        # Terminal menu
-        terminal_menu = menubar.addMenu('&Terminal')
-
-        # New terminal tab action
-        new_terminal_action = QAction('&New Terminal', self)
-        new_terminal_action.setShortcut('Ctrl+Shift+T')
-        new_terminal_action.triggered.connect(self.add_terminal_tab)
-        terminal_menu.addAction(new_terminal_action)
-
-        # Close terminal tab action
-        close_terminal_action = QAction('&Close Terminal', self)
-        close_terminal_action.setShortcut('Ctrl+W')
-        close_terminal_action.triggered.connect(self.close_terminal_tab)
-        terminal_menu.addAction(close_terminal_action)
-
-        # Voice control toggle
-        self.voice_control_action = QAction('Enable &Voice Control', self, checkable=True)
-        self.voice_control_action.setShortcut('Ctrl+Shift+V')
-        self.voice_control_action.toggled.connect(self.toggle_voice_control)
-        file_menu.addAction(self.voice_control_action)
-
-        # Exit action
\ No newline at end of file
@@ -6,43 +6,67 @@ Handles system notifications and reminders for the To-Do List.
 import sys
 import os
 import json
+import heapq
 from pathlib import Path
 import threading
 import time
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QObject
-from PyQt6.QtWidgets import QMessageBox, QSystemTrayIcon, QMenu, QApplication
+from PyQt6.QtWidgets import QMessageBox, QSystemTrayIcon, QMenu, QApplication, QMainWindow
 from PyQt6.QtGui import QIcon
 
+# Tray icon image, resolved once at import
+_ICON_PATH = Path(__file__).resolve().parent.parent / 'resources' / 'icons' / 'app_icon.png'
+
+# Longest the reminder timer sleeps, so edits made outside the app are picked up;
+# the app's own edits call reload() as they are saved
+_MAX_WAIT_MS = 60 * 1000  # 1 minute
+
 
 class Notifier(QObject):
     """
     Handles system notifications and reminders for the To-Do List.
     """
     reminder_triggered = pyqtSignal(dict)  # Signal for when a reminder is triggered
+    todos_saved = pyqtSignal()  # The todo file was written, e.g. to record a notification
+    
+    # Decoded tray icon, shared by every Notifier
+    _tray_icon_image: Optional[QIcon] = None
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.app = QApplication.instance()
         self.tray_icon = None
+        # Created on first use, see _get_file_manager
+        self._file_manager = None
+        # Last todo data read or written, and the file's mtime at that point
+        self._todos_cache: Optional[Dict[str, Any]] = None
+        self._todos_mtime: Optional[int] = None
+        # (fire time, position, todo) for every pending reminder, earliest first
+        self._heap: List[Tuple[datetime, int, dict]] = []
+        # Todo data the heap entries point into
+        self._heap_source: Optional[Dict[str, Any]] = None
+        # One-shot timer armed for the earliest reminder
         self.timer = QTimer()
+        self.timer.setSingleShot(True)
         self.timer.timeout.connect(self.check_reminders)
-        self.timer.start(60000)  # Check every minute
+        self.schedule_reminders()
 
     def init_tray_icon(self):
         """Initialize the system tray icon."""
         if not self.tray_icon:
             self.tray_icon = QSystemTrayIcon()
             
-            # Load icon from filesystem
-            icon_path = os.path.join(os.path.dirname(__file__), '..', 'resources', 'icons', 'app_icon.png')
-            if os.path.exists(icon_path):
-                self.tray_icon.setIcon(QIcon(icon_path))
-            else:
-                # Fallback to system icon if file not found
-                self.tray_icon.setIcon(QApplication.windowIcon())
+            # Load icon from filesystem the first time only
+            if Notifier._tray_icon_image is None:
+                if _ICON_PATH.exists():
+                    Notifier._tray_icon_image = QIcon(str(_ICON_PATH))
+                else:
+                    # Fallback to system icon if file not found
+                    Notifier._tray_icon_image = QApplication.windowIcon()
+            self.tray_icon.setIcon(Notifier._tray_icon_image)
             
             # Create the system tray menu
             menu = QMenu()
@@ -69,20 +93,74 @@ class Notifier(QObject):
         if self.app:
             self.app.quit()
 
-    def check_reminders(self):
-        """Check for upcoming reminders and show notifications."""
-        # Get current time
-        now = datetime.now()
-        
-        # Load todos from file
+    def schedule_reminders(self):
+        """Bring the reminder queue up to date with the saved todos and arm the timer."""
         todos = self.load_todos()
-        if not todos:
-            return
+        # The heap holds the parsed fire times; the dates are only parsed
+        # again when load_todos returns different data (the file changed)
+        if todos is not self._heap_source:
+            self._heap_source = todos
+            self._heap = []
+            if todos:
+                for position, todo in enumerate(todos.get("todos", [])):
+                    fire_time = self.next_fire_time(todo)
+                    if fire_time is not None:
+                        self._heap.append((fire_time, position, todo))
+                heapq.heapify(self._heap)
+        
+        # Sleep until the earliest reminder, but never longer than _MAX_WAIT_MS
+        delay = _MAX_WAIT_MS
+        if self._heap:
+            wait = (self._heap[0][0] - datetime.now()).total_seconds() * 1000
+            delay = max(0, min(delay, int(wait)))
+        self.timer.start(delay)
+
+    def reload(self):
+        """Re-read the todo file, even if its mtime looks unchanged, and re-plan."""
+        self._todos_mtime = None
+        self.schedule_reminders()
 
-        # Check each todo for reminders
-        for todo in todos.get("todos", []):
+    def check_reminders(self):
+        """Show notifications for the reminders that are due, then re-arm the timer."""
+        now = datetime.now()
+        while self._heap and self._heap[0][0] <= now:
+            _, _, todo = heapq.heappop(self._heap)
             if self.should_notify(todo, now):
                 self.show_notification(todo)
+        
+        # Pick up any edits to the file and re-arm for the next reminder
+        self.schedule_reminders()
+
+    def next_fire_time(self, todo: dict) -> Optional[datetime]:
+        """
+        Work out when should_notify will first be True for a todo item.
+        
+        Args:
+            todo: The todo item to check
+            
+        Returns:
+            datetime: When to notify, or None if the item needs no notification
+        """
+        if todo.get("completed", False) or todo.get("notified", False):
+            return None
+
+        times = []
+        # Due date reminders start an hour before the due time
+        due_date = todo.get("due_date")
+        if due_date:
+            try:
+                times.append(datetime.fromisoformat(due_date) - timedelta(hours=1))
+            except ValueError:
+                pass
+
+        reminder = todo.get("reminder")
+        if reminder:
+            try:
+                times.append(datetime.fromisoformat(reminder))
+            except ValueError:
+                pass
+
+        return min(times) if times else None
 
     def should_notify(self, todo: dict, now: datetime) -> bool:
         """
@@ -138,10 +216,19 @@ class Notifier(QObject):
         # Update the todo as notified
         todos = self.load_todos()
         if todos:
-            todos["todos"] = [self.mark_notified(t, todo) for t in todos["todos"]]
+            if todos is self._heap_source:
+                # The todo is an entry of this very list; flag it in place
+                todo["notified"] = True
+            else:
+                # The file was reloaded since the heap was built; find it by content
+                for t in todos.get("todos", []):
+                    self.mark_notified(t, todo)
             self.save_todos(todos)
 
-        # Show notification
+        # Fired once per reminder, as it is now recorded as notified
+        self.reminder_triggered.emit(todo)
+
+        # Show notification; the app shows its own box when it handles the signal
         if self.tray_icon:
             self.tray_icon.showMessage(
                 "MAYA Reminder",
@@ -149,7 +236,7 @@ class Notifier(QObject):
                 QSystemTrayIcon.MessageIcon.Information,
                 5000  # 5 seconds
             )
-        else:
+        elif not self.receivers(self.reminder_triggered):
             QMessageBox.information(
                 None,
                 "MAYA Reminder",
@@ -158,7 +245,10 @@ class Notifier(QObject):
 
     def mark_notified(self, todo: dict, target: dict) -> dict:
         """
-        Mark a todo item as notified if it matches the target.
+        Mark a todo item as notified if it is, or matches, the target.
+        
+        The identity check settles the common case with one pointer compare;
+        the field comparison is only reached for copies read from the file.
         
         Args:
             todo: Todo item to check
@@ -167,9 +257,10 @@ class Notifier(QObject):
         Returns:
             dict: Updated todo item
         """
-        if todo.get("title") == target.get("title") and \
-           todo.get("due_date") == target.get("due_date") and \
-           todo.get("reminder") == target.get("reminder"):
+        if todo is target or (
+                todo.get("title") == target.get("title") and
+                todo.get("due_date") == target.get("due_date") and
+                todo.get("reminder") == target.get("reminder")):
             todo["notified"] = True
         return todo
 
@@ -181,9 +272,13 @@ class Notifier(QObject):
             dict: Todo list data or None if error
         """
         try:
-            from modules.file_manager import FileManager
-            file_manager = FileManager()
-            return file_manager.load_todos()
+            file_manager = self._get_file_manager()
+            mtime = self._todos_file_mtime()
+            # Only re-parse the file if it changed since it was last read or written
+            if mtime is None or mtime != self._todos_mtime:
+                self._todos_cache = file_manager.load_todos()
+                self._todos_mtime = mtime
+            return self._todos_cache
         except Exception as e:
             print(f"Error loading todos: {e}")
             return None
@@ -199,9 +294,32 @@ class Notifier(QObject):
             bool: True if save successful, False otherwise
         """
         try:
-            from modules.file_manager import FileManager
-            file_manager = FileManager()
-            return file_manager.save_todos(data)
+            saved = self._get_file_manager().save_todos(data)
+            if saved:
+                # What was just written is current; no need to read it back
+                self._todos_cache = data
+                self._todos_mtime = self._todos_file_mtime()
+                self.todos_saved.emit()
+            return saved
         except Exception as e:
             print(f"Error saving todos: {e}")
             return False
+
+    def _get_file_manager(self):
+        """Create the FileManager on first use and reuse it afterwards."""
+        if self._file_manager is None:
+            from modules.file_manager import FileManager
+            self._file_manager = FileManager()
+        return self._file_manager
+
+    def _todos_file_mtime(self) -> Optional[int]:
+        """
+        Get the modification time of the todo file.
+        
+        Returns:
+            int: mtime in nanoseconds, or None if the file does not exist
+        """
+        try:
+            return self._get_file_manager().get_data_path("todos.json").stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
@@ -2,18 +2,291 @@
 OCR (Optical Character Recognition) Processor for MAYA AI Chatbot.
 Provides functionality to extract text from images using Tesseract OCR.
 """
+import functools
+import hashlib
 import logging
+import multiprocessing
+import os
+import re
 import tempfile
+import threading
+from collections import ChainMap, OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, List, Sequence, Union
 
 import cv2
 import numpy as np
-from PIL import Image, ImageEnhance, ImageFilter
+from PIL import Image
 import pytesseract
 
+# tesserocr drives libtesseract in-process: the engine and language model are
+# loaded once and kept, instead of a tesseract process being started per call
+try:
+    from tesserocr import PyTessBaseAPI, RIL, iterate_level
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+_PSM_RE = re.compile(r'--psm\s+(\d+)')
+_OEM_RE = re.compile(r'--oem\s+(\d+)')
+
+# Number of extract_text results kept by OCRProcessor
+_OCR_CACHE_SIZE = 128
+
+# Same kernel as PIL's ImageFilter.SHARPEN
+_SHARPEN_KERNEL = np.array([[-2, -2, -2],
+                            [-2, 32, -2],
+                            [-2, -2, -2]], np.float32) / 16
+
+# Kernel of Immerkaer's noise estimator: the difference of two Laplacians,
+# which cancels image structure and leaves mostly noise
+_NOISE_KERNEL = np.array([[1, -2, 1],
+                          [-2, 4, -2],
+                          [1, -2, 1]], np.float32)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_options(options: str) -> Tuple[int, Optional[int]]:
+    """
+    Read the engine and page segmentation modes from a Tesseract option string.
+    
+    Cached, since the same few option strings are used for every call.
+    
+    Args:
+        options: Options such as '--oem 3 --psm 6'
+        
+    Returns:
+        Tuple of (oem, psm); oem defaults to 3 and psm is None if not given
+    """
+    oem = _OEM_RE.search(options)
+    psm = _PSM_RE.search(options)
+    return (int(oem.group(1)) if oem else 3,
+            int(psm.group(1)) if psm else None)
+
+
+def _pack_bits(binary: np.ndarray) -> bytes:
+    """
+    Pack a 0/255 image into 1-bit rows, most significant bit first.
+    
+    Set bits are white, as both PIL's '1' mode and Tesseract expect.
+    
+    Args:
+        binary: Thresholded grayscale image as a uint8 array
+        
+    Returns:
+        bytes: (width + 7) // 8 bytes per row
+    """
+    return np.packbits(binary > 127, axis=1).tobytes()
+
+
+def _estimate_text_height(img_np: np.ndarray) -> Optional[float]:
+    """
+    Estimate the height of the characters in a grayscale image.
+    
+    The image is binarised with Otsu's method, with the minority colour taken
+    as the text, and the median height of its connected components is used.
+    
+    Args:
+        img_np: Grayscale image as a uint8 array
+        
+    Returns:
+        float: Median glyph height in pixels, or None if no text-like shapes were found
+    """
+    _, binary = cv2.threshold(img_np, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    if cv2.countNonZero(binary) > binary.size // 2:
+        binary = cv2.bitwise_not(binary)  # Dark text on a light background
+    _, _, stats, _ = cv2.connectedComponentsWithStats(binary, connectivity=8)
+    heights = stats[1:, cv2.CC_STAT_HEIGHT]  # Row 0 is the background
+    # Ignore specks and shapes too tall to be characters (rules, boxes, images)
+    heights = heights[(heights >= 4) & (heights <= img_np.shape[0] // 2)]
+    if heights.size < 3:
+        return None
+    return float(np.median(heights))
+
+
+def _estimate_noise(img_np: np.ndarray) -> float:
+    """
+    Estimate the standard deviation of the noise in a grayscale image.
+    
+    Uses Immerkaer's method, a single 3x3 filter and a mean, so it costs a
+    tiny fraction of the denoising it is used to skip.
+    
+    Args:
+        img_np: Grayscale image as a uint8 array
+        
+    Returns:
+        float: Estimated noise sigma, in grey levels
+    """
+    height, width = img_np.shape[:2]
+    if height < 3 or width < 3:
+        return 0.0
+    response = cv2.filter2D(img_np.astype(np.float32), -1, _NOISE_KERNEL)
+    total = float(np.abs(response[1:-1, 1:-1]).sum())
+    return total * np.sqrt(np.pi / 2) / (6 * (width - 2) * (height - 2))
+
+
+@functools.lru_cache(maxsize=8)
+def _get_languages(tesseract_path: Optional[str]) -> Tuple[str, ...]:
+    """
+    Ask Tesseract for its installed languages, once per executable.
+    
+    Failures raise and so are not cached; the next call tries again.
+    
+    Args:
+        tesseract_path: Tesseract executable the languages belong to (None for PATH)
+        
+    Returns:
+        Tuple of language codes
+    """
+    return tuple(pytesseract.get_languages(config=''))
+
+
+def _parse_tsv(tsv: str) -> Dict[str, Tuple[str, ...]]:
+    """
+    Split Tesseract's TSV output into columns.
+    
+    Cells are left as strings: the numeric columns that are needed are
+    converted in bulk by NumPy, or only compared, so pytesseract's per-cell
+    int() and float() calls for Output.DICT are avoided.
+    
+    Args:
+        tsv: image_to_data output with Output.STRING
+        
+    Returns:
+        Dict mapping each column name to a tuple of its cells
+    """
+    lines = tsv.splitlines()
+    if not lines:
+        return {'text': (), 'conf': (), 'block_num': (), 'par_num': (), 'line_num': ()}
+    names = lines[0].split('\t')
+    width = len(names)
+    rows = []
+    for line in lines[1:]:
+        if not line:
+            continue
+        row = line.split('\t')
+        if len(row) != width:
+            # zip() below would cut every column to the shortest row
+            row = (row + [''] * width)[:width]
+        rows.append(row)
+    if not rows:
+        return {name: () for name in names}
+    return dict(zip(names, zip(*rows)))
+
+
+def _text_from_data(data: Dict[str, Sequence]) -> str:
+    """
+    Rebuild the text of an image_to_data result, as given by _parse_tsv.
+    
+    Words are joined with spaces into lines, and a blank line separates
+    paragraphs, as in image_to_string output.
+    
+    Args:
+        data: image_to_data columns, keyed by name
+        
+    Returns:
+        str: The recognised text
+    """
+    lines: List[str] = []
+    words: List[str] = []
+    current = paragraph = None
+    for word, block, par, line in zip(data['text'], data['block_num'],
+                                      data['par_num'], data['line_num']):
+        if not word or not word.strip():
+            continue
+        if (block, par, line) != current:
+            if words:
+                lines.append(' '.join(words))
+                words = []
+            if paragraph is not None and (block, par) != paragraph:
+                lines.append('')
+            current, paragraph = (block, par, line), (block, par)
+        words.append(word)
+    if words:
+        lines.append(' '.join(words))
+    return '\n'.join(lines)
+
+
+def _sauvola_threshold(img_np: np.ndarray, window: int = 25,
+                       k: float = 0.2, r: float = 128.0) -> np.ndarray:
+    """
+    Binarise a grayscale image with Sauvola's method.
+    
+    The local mean and standard deviation come from box filters, which use
+    running sums, so the cost per pixel does not depend on the window size.
+    
+    Args:
+        img_np: Grayscale image as a uint8 array
+        window: Side of the square neighbourhood, in pixels
+        k: Sensitivity to the local contrast
+        r: Dynamic range of the standard deviation
+        
+    Returns:
+        Binary uint8 image (0 or 255)
+    """
+    img = img_np.astype(np.float32)
+    ksize = (window, window)
+    mean = cv2.boxFilter(img, -1, ksize, borderType=cv2.BORDER_REPLICATE)
+    # Worked in place: threshold = mean * (1 + k * (std / r - 1))
+    threshold = cv2.sqrBoxFilter(img, -1, ksize, borderType=cv2.BORDER_REPLICATE)
+    threshold -= mean * mean
+    np.maximum(threshold, 0, out=threshold)
+    np.sqrt(threshold, out=threshold)
+    threshold *= k / r
+    threshold += 1 - k
+    threshold *= mean
+    binary = np.greater(img, threshold).view(np.uint8)
+    binary *= 255
+    return binary
+
+
+# Writes debug images in the background; created on first use
+_debug_writer: Optional[ThreadPoolExecutor] = None
+
+
+def _write_debug_image(image: Union[Image.Image, np.ndarray]):
+    """Write a preprocessed image to a temporary PNG file and log its path."""
+    try:
+        if isinstance(image, np.ndarray):
+            image = Image.fromarray(image)
+        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
+            # Light compression: these files are only looked at while debugging
+            image.save(tmp, format='PNG', compress_level=1)
+        logger.debug(f"Saved preprocessed image to {tmp.name}")
+    except Exception as e:
+        logger.error(f"Error saving debug image: {str(e)}")
+
+
+def _save_debug_image(image: Union[Image.Image, np.ndarray]):
+    """Queue a preprocessed image to be written by _write_debug_image."""
+    global _debug_writer
+    if _debug_writer is None:
+        _debug_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ocr-debug')
+    _debug_writer.submit(_write_debug_image, image)
+
+
+# OCRProcessor of the current extract_text_parallel worker process
+_worker_processor: Optional['OCRProcessor'] = None
+
+
+def _init_worker(tesseract_path: Optional[str]):
+    """Set up an extract_text_parallel worker process."""
+    global _worker_processor
+    # Tesseract is limited to one thread by the environment the process was
+    # spawned with (see extract_text_parallel); OpenCV would otherwise also
+    # start a thread per core in every worker for denoising and filtering
+    cv2.setNumThreads(1)
+    _worker_processor = OCRProcessor(tesseract_path)
+
+
+def _extract_in_worker(image: Image.Image,
+                       config: Optional[Dict[str, Any]]) -> Tuple[str, Dict[str, Any]]:
+    """Run extract_text in an extract_text_parallel worker process."""
+    return _worker_processor.extract_text(image, config)
+
 class OCRProcessor:
     """Handles OCR (Optical Character Recognition) operations on images."""
     
@@ -36,9 +309,97 @@ class OCRProcessor:
             'contrast_factor': 1.5,  # Increase contrast
             'sharpen': True,  # Apply sharpening
             'denoise': True,  # Apply denoising
+            'noise_sigma_skip': 3.0,  # Skip denoising when the estimated noise is below this
+            'fast_denoise': False,  # Denoise with smaller windows (about 7x less work)
             'threshold': True,  # Apply thresholding
+            'threshold_method': 'otsu',  # 'otsu', 'sauvola' (uneven lighting) or 'adaptive_gaussian'
+            'rescale': True,  # Resample so text is about target_text_height pixels tall
+            'target_text_height': 24,  # Median glyph (about x-) height; capitals then come out near 32 px
             'dpi': 300  # Default DPI for better recognition
         }
+        
+        # tesserocr engines keyed by (lang, oem), created on first use; an
+        # engine handles one image at a time, hence the lock
+        self._apis: Dict[Tuple[str, int], 'PyTessBaseAPI'] = {}
+        self._api_lock = threading.Lock()
+        
+        # Results of recent extract_text calls, keyed by _cache_key; the same
+        # region is often recognised again while it has not changed. The lock
+        # is only held for lookups and inserts, never while recognising
+        self._ocr_cache: 'OrderedDict[bytes, Tuple[str, Dict[str, Any]]]' = OrderedDict()
+        self._cache_lock = threading.Lock()
+    
+    def close(self):
+        """Release the tesserocr engines, if any were created."""
+        with self._api_lock:
+            for api in self._apis.values():
+                api.End()
+            self._apis.clear()
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+    
+    def _get_api(self, lang: str, oem: int) -> 'PyTessBaseAPI':
+        """
+        Get the tesserocr engine for a language, creating it on first use.
+        
+        Args:
+            lang: Tesseract language code(s), e.g. 'eng' or 'eng+fra'
+            oem: OCR engine mode; it can only be set when the engine is created
+            
+        Returns:
+            PyTessBaseAPI: Initialised engine
+        """
+        api = self._apis.get((lang, oem))
+        if api is None:
+            api = PyTessBaseAPI(lang=lang, oem=oem)
+            self._apis[(lang, oem)] = api
+        return api
+    
+    def _recognize_tesserocr(self, image: Union[Image.Image, np.ndarray],
+                             config: Dict[str, Any]) -> Tuple[str, Dict[str, List]]:
+        """
+        Run OCR in-process with tesserocr, in a single recognition pass.
+        
+        The --oem and --psm options of config['config'] are honoured.
+        
+        Args:
+            image: Preprocessed PIL Image, or grayscale uint8 array
+            config: Merged configuration dictionary
+            
+        Returns:
+            Tuple of (text, data) where data has 'text' and 'conf' lists of
+            words and their confidences, like pytesseract.image_to_data
+        """
+        oem, psm = _parse_options(config.get('config', ''))
+        data: Dict[str, List] = {'text': [], 'conf': []}
+        with self._api_lock:
+            api = self._get_api(config.get('lang') or 'eng', oem)
+            if psm is not None:
+                api.SetPageSegMode(psm)
+            if isinstance(image, np.ndarray):
+                # Raw pixels, with no PIL image or PNG encoding in between
+                height, width = image.shape
+                if config.get('threshold', True):
+                    # Bitonal: 1 bit per pixel (bytes_per_pixel 0)
+                    api.SetImageBytes(_pack_bits(image), width, height, 0, (width + 7) // 8)
+                else:
+                    api.SetImageBytes(image.tobytes(), width, height, 1, width)
+            else:
+                api.SetImage(image)
+            if config.get('dpi'):
+                api.SetSourceResolution(config['dpi'])
+            text = api.GetUTF8Text()
+            iterator = api.GetIterator()
+            if iterator is not None:
+                for word in iterate_level(iterator, RIL.WORD):
+                    data['text'].append(word.GetUTF8Text(RIL.WORD))
+                    data['conf'].append(word.Confidence(RIL.WORD))
+            api.Clear()
+        return text, data
     
     def preprocess_image(self, image: Image.Image, config: Dict[str, Any]) -> Image.Image:
         """Preprocess the image to improve OCR accuracy.
@@ -48,40 +409,83 @@ class OCRProcessor:
             config: Configuration dictionary
             
         Returns:
-            Preprocessed PIL Image
+            Preprocessed PIL Image; 1-bit when thresholding is on
         """
         if not config.get('preprocess', True):
             return image
+        img_np = self._preprocess_array(image, config)
+        if config.get('threshold', True):
+            # Packed 1-bit pixels: an eighth of the data to encode and pass on
+            height, width = img_np.shape
+            return Image.frombytes('1', (width, height), _pack_bits(img_np))
+        return Image.fromarray(img_np)
+    
+    def _preprocess_array(self, image: Image.Image, config: Dict[str, Any]) -> np.ndarray:
+        """Run the preprocessing pipeline of preprocess_image.
         
-        # Convert to grayscale
-        img = image.convert('L')
+        Args:
+            image: Input PIL Image
+            config: Configuration dictionary
+            
+        Returns:
+            Preprocessed grayscale image as a uint8 array
+        """
+        # Convert to grayscale. The image stays one uint8 array from here on;
+        # OpenCV's kernels replace the PIL round trips for contrast and sharpening
+        if image.mode == 'RGB':
+            img_np = cv2.cvtColor(np.asarray(image), cv2.COLOR_RGB2GRAY)
+        elif image.mode == 'RGBA':
+            img_np = cv2.cvtColor(np.asarray(image), cv2.COLOR_RGBA2GRAY)
+        else:
+            img_np = np.asarray(image.convert('L'))
         
-        # Convert to numpy array for OpenCV processing
-        img_np = np.array(img)
+        # Resample to the text size Tesseract recognises best. The dpi setting
+        # only labels the image; this changes its pixels, and shrinking large
+        # text also cuts the work of every later step
+        if config.get('rescale', True):
+            height = _estimate_text_height(img_np)
+            if height:
+                scale = min(max(config.get('target_text_height', 24) / height, 0.5), 3.0)
+                if abs(scale - 1) > 0.1:
+                    img_np = cv2.resize(img_np, None, fx=scale, fy=scale,
+                                        interpolation=cv2.INTER_CUBIC if scale > 1 else cv2.INTER_AREA)
         
-        # Apply denoising
-        if config.get('denoise', True):
-            img_np = cv2.fastNlMeansDenoising(img_np, None, h=10, templateWindowSize=7, searchWindowSize=21)
+        # Apply denoising; clean inputs such as screenshots skip it, since it is
+        # by far the most expensive step
+        if config.get('denoise', True) and \
+           _estimate_noise(img_np) >= config.get('noise_sigma_skip', 0.0):
+            if config.get('fast_denoise', False):
+                img_np = cv2.fastNlMeansDenoising(img_np, None, h=10, templateWindowSize=5, searchWindowSize=11)
+            else:
+                img_np = cv2.fastNlMeansDenoising(img_np, None, h=10, templateWindowSize=7, searchWindowSize=21)
         
-        # Apply adaptive thresholding
+        # Apply thresholding
         if config.get('threshold', True):
-            img_np = cv2.adaptiveThreshold(
-                img_np, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
-                cv2.THRESH_BINARY, 11, 2
-            )
-        
-        # Convert back to PIL Image
-        img = Image.fromarray(img_np)
+            method = config.get('threshold_method', 'otsu')
+            if method == 'sauvola':
+                img_np = _sauvola_threshold(img_np)
+            elif method == 'adaptive_gaussian':
+                img_np = cv2.adaptiveThreshold(
+                    img_np, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
+                    cv2.THRESH_BINARY, 11, 2
+                )
+            else:
+                # One global threshold from the histogram; fine for evenly lit
+                # input such as screenshots
+                _, img_np = cv2.threshold(img_np, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+            # Contrast and sharpening only saturate a 0/255 image back to itself
+            return img_np
         
-        # Enhance contrast
-        enhancer = ImageEnhance.Contrast(img)
-        img = enhancer.enhance(config.get('contrast_factor', 1.5))
+        # Enhance contrast around the mean, as ImageEnhance.Contrast does
+        factor = config.get('contrast_factor', 1.5)
+        mean = int(cv2.mean(img_np)[0] + 0.5)
+        img_np = cv2.addWeighted(img_np, factor, img_np, 0, (1 - factor) * mean)
         
         # Sharpen the image
         if config.get('sharpen', True):
-            img = img.filter(ImageFilter.SHARPEN)
+            img_np = cv2.filter2D(img_np, -1, _SHARPEN_KERNEL, borderType=cv2.BORDER_REPLICATE)
         
-        return img
+        return img_np
     
     def extract_text(self, image: Image.Image, config: Optional[Dict[str, Any]] = None) -> Tuple[str, Dict[str, Any]]:
         """Extract text from an image using OCR.
@@ -89,7 +493,8 @@ class OCRProcessor:
         Args:
             image: PIL Image containing text to recognize
             config: Optional configuration dictionary. If None, default settings are used.
-                   Possible keys: lang, config, preprocess, contrast_factor, sharpen, denoise, threshold, dpi
+                   Possible keys: lang, config, preprocess, contrast_factor, sharpen, denoise, threshold, dpi,
+                   no_cache (recognise again even if this image was seen recently)
                    
         Returns:
             Tuple of (extracted_text, metadata)
@@ -97,52 +502,188 @@ class OCRProcessor:
         if config is None:
             config = {}
         
-        # Merge with default config
-        merged_config = {**self.default_config, **config}
+        # Merge with default config; a view, so nothing is copied for cache hits
+        merged_config = ChainMap(config, self.default_config)
         
-        # Preprocess the image
-        processed_img = self.preprocess_image(image, merged_config)
+        use_cache = not merged_config.get('no_cache', False)
+        if use_cache:
+            key = self._cache_key(image, merged_config)
+            with self._cache_lock:
+                cached = self._ocr_cache.get(key)
+                if cached is not None:
+                    self._ocr_cache.move_to_end(key)
+            if cached is not None:
+                return cached[0], dict(cached[1])
         
-        # Create a temporary file for debugging if needed
-        debug = config.get('debug', False)
-        if debug:
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                processed_img.save(tmp.name)
-                logger.debug(f"Saved preprocessed image to {tmp.name}")
+        # Preprocess the image; tesserocr takes the array as it is, while
+        # pytesseract needs a PIL Image
+        if TESSEROCR_AVAILABLE and merged_config.get('preprocess', True):
+            processed_img = self._preprocess_array(image, merged_config)
+        else:
+            processed_img = self.preprocess_image(image, merged_config)
+        
+        # Save the preprocessed image for debugging if needed, off this thread
+        if merged_config.get('debug', False):
+            _save_debug_image(processed_img)
         
         try:
             # Set DPI if specified
             dpi = merged_config.get('dpi')
-            if dpi:
+            if dpi and isinstance(processed_img, Image.Image):
                 processed_img.info['dpi'] = (dpi, dpi)
             
-            # Perform OCR
-            text = pytesseract.image_to_string(
-                processed_img,
-                lang=merged_config.get('lang'),
-                config=merged_config.get('config', '')
-            )
-            
-            # Get additional data if needed
-            data = pytesseract.image_to_data(
-                processed_img,
-                lang=merged_config.get('lang'),
-                config=merged_config.get('config', ''),
-                output_type=pytesseract.Output.DICT
-            )
+            if TESSEROCR_AVAILABLE:
+                # One in-process pass gives both the text and the word confidences
+                text, data = self._recognize_tesserocr(processed_img, merged_config)
+            else:
+                # Perform OCR; the words and their layout give the text too,
+                # so image_to_string would only repeat the recognition
+                data = _parse_tsv(pytesseract.image_to_data(
+                    processed_img,
+                    lang=merged_config.get('lang'),
+                    config=merged_config.get('config', ''),
+                    output_type=pytesseract.Output.STRING
+                ))
+                text = _text_from_data(data)
             
             # Prepare metadata
+            # Layout rows carry a confidence of -1 and no text; leave them out
+            conf = np.asarray(data['conf'], dtype=np.float32)
+            conf = conf[conf > 0]
+            words = np.char.strip(np.asarray(data['text'], dtype=str))
             metadata = {
-                'confidence': float(np.mean([float(x) for x in data['conf'] if float(x) > 0])) if data['conf'] else 0.0,
-                'word_count': len(data['text']),
-                'config': merged_config
+                'confidence': float(conf.mean()) if conf.size else 0.0,
+                'word_count': int(np.count_nonzero(words)),
+                'config': dict(merged_config)
             }
             
-            return text.strip(), metadata
+            text = text.strip()
+            if use_cache:
+                with self._cache_lock:
+                    self._ocr_cache[key] = (text, dict(metadata))
+                    if len(self._ocr_cache) > _OCR_CACHE_SIZE:
+                        self._ocr_cache.popitem(last=False)
+            return text, metadata
             
         except Exception as e:
             logger.error(f"Error during OCR processing: {str(e)}")
-            return "", {'error': str(e), 'config': merged_config}
+            return "", {'error': str(e), 'config': dict(merged_config)}
+    
+    @staticmethod
+    def _cache_key(image: Image.Image, config: Dict[str, Any]) -> bytes:
+        """
+        Get the extract_text cache key for an image and configuration.
+        
+        Args:
+            image: PIL Image to recognise
+            config: Merged configuration dictionary
+            
+        Returns:
+            bytes: 16-byte digest of the pixels, their layout and the config
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{image.mode}{image.size}{sorted(config.items())!r}".encode())
+        digest.update(image.tobytes())
+        return digest.digest()
+    
+    def extract_text_batch(self, images: List[Image.Image],
+                           config: Optional[Dict[str, Any]] = None) -> List[str]:
+        """Extract text from several images with a single Tesseract run.
+        
+        Tesseract is given a list file naming one image per line and separates
+        the pages of its output with form feeds, so process start-up and
+        language model loading are paid once for the whole batch. Use
+        extract_text for confidences and other metadata.
+        
+        Args:
+            images: PIL Images containing text to recognize
+            config: Optional configuration dictionary, as for extract_text
+            
+        Returns:
+            Extracted text for each image, in order ("" where nothing was found)
+        """
+        if len(images) == 1:
+            return [self.extract_text(images[0], config)[0]]
+        
+        merged_config = {**self.default_config, **(config or {})}
+        
+        try:
+            if TESSEROCR_AVAILABLE:
+                # No process to start; the cached engine handles each image
+                preprocess = (self._preprocess_array if merged_config.get('preprocess', True)
+                              else self.preprocess_image)
+                return [self._recognize_tesserocr(preprocess(image, merged_config), merged_config)[0].strip()
+                        for image in images]
+            
+            processed = [self.preprocess_image(image, merged_config) for image in images]
+            
+            dpi = merged_config.get('dpi')
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                paths = []
+                for i, image in enumerate(processed):
+                    path = str(Path(tmp_dir) / f"page_{i}.png")
+                    # Written uncompressed: the files only live for this call
+                    image.save(path, compress_level=0, **({'dpi': (dpi, dpi)} if dpi else {}))
+                    paths.append(path)
+                
+                list_path = str(Path(tmp_dir) / "list.txt")
+                with open(list_path, 'w', encoding='utf-8') as f:
+                    f.write('\n'.join(paths) + '\n')
+                
+                text = pytesseract.image_to_string(
+                    list_path,
+                    lang=merged_config.get('lang'),
+                    config=merged_config.get('config', '')
+                )
+            
+            pages = text.split('\f')
+            return [pages[i].strip() if i < len(pages) else "" for i in range(len(images))]
+            
+        except Exception as e:
+            logger.error(f"Error during batch OCR processing: {str(e)}")
+            return [""] * len(images)
+    
+    def extract_text_parallel(self, images: List[Image.Image],
+                              config: Optional[Dict[str, Any]] = None,
+                              max_workers: Optional[int] = None) -> List[Tuple[str, Dict[str, Any]]]:
+        """Extract text and metadata from several images on all cores.
+        
+        Each worker process has its own OCRProcessor and runs Tesseract with a
+        single thread. Processes rather than threads are used because the
+        preprocessing holds the GIL; a thread pool is slower than running the
+        images one after another.
+        
+        Args:
+            images: PIL Images containing text to recognize
+            config: Optional configuration dictionary, as for extract_text
+            max_workers: Number of worker processes; defaults to the CPU count
+            
+        Returns:
+            List of (extracted_text, metadata) tuples, in the order of images
+        """
+        workers = min(max_workers or os.cpu_count() or 1, len(images))
+        if workers <= 1:
+            return [self.extract_text(image, config) for image in images]
+        
+        # One single-threaded Tesseract per core beats Tesseract's own
+        # threading, which oversubscribes the cores once there are several
+        # workers. libtesseract reads OMP_THREAD_LIMIT when it is loaded, which
+        # in a worker is while this module is imported, before the initializer
+        # runs, so the workers have to inherit it from this process
+        previous_limit = os.environ.get('OMP_THREAD_LIMIT')
+        os.environ['OMP_THREAD_LIMIT'] = '1'
+        try:
+            # spawn, not fork: forking a process that runs Qt threads is unsafe
+            with ProcessPoolExecutor(max_workers=workers,
+                                     mp_context=multiprocessing.get_context('spawn'),
+                                     initializer=_init_worker,
+                                     initargs=(self.tesseract_path,)) as executor:
+                return list(executor.map(_extract_in_worker, images, [config] * len(images)))
+        finally:
+            if previous_limit is None:
+                os.environ.pop('OMP_THREAD_LIMIT', None)
+            else:
+                os.environ['OMP_THREAD_LIMIT'] = previous_limit
     
     def extract_text_from_region(self, image: Image.Image, region: Tuple[int, int, int, int], 
                                config: Optional[Dict[str, Any]] = None) -> Tuple[str, Dict[str, Any]]:
@@ -167,8 +708,7 @@ class OCRProcessor:
             List of language codes (e.g., ['eng', 'fra', 'spa'])
         """
         try:
-            langs = pytesseract.get_languages(config='')
-            return langs
+            return list(_get_languages(self.tesseract_path))
         except Exception as e:
             logger.error(f"Error getting available languages: {str(e)}")
             return ['eng']  # Default to English if there's an error
@@ -9,21 +9,26 @@ from typing import Optional, Tuple, Callable, Dict, Any
 from enum import Enum, auto
 import math
 
-from PyQt6.QtCore import Qt, QRect, QPoint, QPointF, QSize, QDateTime, pyqtSignal, QRectF, QTimer
+import numpy as np
+import pytesseract
+from PIL import Image
+
+from PyQt6.QtCore import Qt, QRect, QPoint, QPointF, QSize, QDateTime, pyqtSignal, QRectF, QTimer, QThreadPool, QUrl
 from PyQt6.QtGui import (
     QGuiApplication, QPixmap, QPainter, QPen, QColor, QBrush, QImage,
-    QScreen, QRegion, QPainterPath, QPolygonF, QKeyEvent
+    QScreen, QRegion, QPainterPath, QPolygonF, QKeyEvent, QFont, QFontMetrics, QDesktopServices
 )
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, 
     QGraphicsView, QGraphicsScene, QGraphicsPixmapItem, QSizePolicy,
     QApplication, QMessageBox, QFileDialog, QSpinBox, QCheckBox,
-    QDockWidget, QWidget, QToolBar, QStatusBar, QMainWindow, QColorDialog,
-    QTextEdit, QDialogButtonBox, QVBoxLayout, QHBoxLayout, QComboBox
+    QDockWidget, QWidget, QToolBar, QStatusBar, QColorDialog, QFrame, QScrollArea,
+    QTextEdit, QDialogButtonBox, QVBoxLayout, QHBoxLayout, QComboBox, QStyle
 )
 
 from .screen_manipulation import ScreenRegion, ScreenCapture
 from .ocr_processor import OCRProcessor, install_tesseract_windows, install_tesseract_macos, install_tesseract_linux
+from .workers import Worker
 import platform
 import sys
 
@@ -43,7 +48,26 @@ class ToolType(Enum):
 
 logger = logging.getLogger(__name__)
 
-class ScreenCaptureDialog(QMainWindow):
+# Error OCRProcessor reports when the Tesseract binary cannot be found
+_TESSERACT_NOT_FOUND = str(pytesseract.TesseractNotFoundError())
+
+# Longest side of a selection sent to OCR; matches the chat window's ocr_max_side default
+_OCR_MAX_SIDE = 3300
+
+
+class CaptureView(QGraphicsView):
+    """Graphics view that paints the capture overlay over the scene instead of into it."""
+    
+    def __init__(self, draw_overlay: Callable[[QPainter], None], parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self._draw_overlay = draw_overlay
+    
+    def drawForeground(self, painter: QPainter, rect: QRectF):
+        """Draw the overlay in scene coordinates; Qt clips it to the exposed area."""
+        self._draw_overlay(painter)
+
+
+class ScreenCaptureDialog(QDialog):
     """Dialog for capturing screen regions with interactive selection."""
     
     capture_completed = pyqtSignal(QPixmap, dict)  # pixmap, metadata
@@ -73,15 +97,28 @@ class ScreenCaptureDialog(QMainWindow):
         self.selection_end = QPoint()
         self.is_selecting = False
         self.selection_rect = QRect()
+        self._overlay_rect = QRect()  # Scene area the overlay was last drawn in
+        
+        # Coalesce drag redraws to roughly one per display frame
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(16)
+        self._update_timer.timeout.connect(self._do_update_display)
         
         # Annotation state
         self.annotation_mode = False
         self.current_annotation = None
         
-        # Create central widget and main layout
-        self.central_widget = QWidget()
-        self.setCentralWidget(self.central_widget)
-        self.main_layout = QVBoxLayout(self.central_widget)
+        # OCR running on the thread pool, if any
+        self._ocr_worker: Optional[Worker] = None
+        self._ocr_loading_dialog: Optional[QDialog] = None
+        
+        # Arrow head of the last arrow drawn, keyed by its end points and width
+        self._arrow_key: Optional[Tuple[float, float, float, float, int]] = None
+        self._arrow_head = QPolygonF()
+        
+        # Main layout: toolbar, capture view, status bar
+        self.main_layout = QVBoxLayout(self)
         self.main_layout.setContentsMargins(0, 0, 0, 0)
         self.main_layout.setSpacing(0)
         
@@ -90,6 +127,7 @@ class ScreenCaptureDialog(QMainWindow):
         
         # Capture the entire screen as background
         self.background_pixmap = None
+        self._dark_pixmap = None
         self.capture_full_screen()
         
         # Set window size to match primary screen
@@ -102,8 +140,9 @@ class ScreenCaptureDialog(QMainWindow):
     def init_ui(self):
         """Initialize the user interface."""
         # Create toolbar
-        self.toolbar = self.addToolBar("Tools")
+        self.toolbar = QToolBar("Tools", self)
         self.toolbar.setMovable(False)
+        self.main_layout.addWidget(self.toolbar)
         
         # Add toolbar actions
         self.select_btn = self.toolbar.addAction("Select")
@@ -117,9 +156,10 @@ class ScreenCaptureDialog(QMainWindow):
         self.toolbar.addSeparator()
         
         # Color button
+        self._current_color = QColor('red')
         self.color_btn = QPushButton()
         self.color_btn.setFixedSize(24, 24)
-        self.color_btn.setStyleSheet("background-color: red;")
+        self.color_btn.setStyleSheet(f"background-color: {self._current_color.name()};")
         self.color_btn.clicked.connect(self.select_color)
         self.toolbar.addWidget(self.color_btn)
         
@@ -176,7 +216,12 @@ class ScreenCaptureDialog(QMainWindow):
             self.ocr_btn.setEnabled(False)
         
         # Graphics view for displaying the screen and selection
-        self.graphics_view = QGraphicsView(self)
+        self.graphics_view = CaptureView(self._draw_overlay, self)
+        
+        # Font of the selection size label, measured once rather than per repaint
+        self._label_font = QFont(self.graphics_view.font())
+        self._label_font.setBold(True)
+        self._label_metrics = QFontMetrics(self._label_font)
         self.graphics_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.graphics_view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.graphics_view.setFrameShape(QFrame.Shape.NoFrame)
@@ -186,12 +231,16 @@ class ScreenCaptureDialog(QMainWindow):
         self.scene = QGraphicsScene(self)
         self.graphics_view.setScene(self.scene)
         
+        # Single item whose pixmap is swapped on every redraw
+        self._bg_item = QGraphicsPixmapItem()
+        self.scene.addItem(self._bg_item)
+        
         # Add to layout
         self.main_layout.addWidget(self.graphics_view)
         
         # Status bar
         self.status_bar = QStatusBar()
-        self.setStatusBar(self.status_bar)
+        self.main_layout.addWidget(self.status_bar)
         
         # Set window opacity for better visibility
         self.setWindowOpacity(0.9)
@@ -213,41 +262,78 @@ class ScreenCaptureDialog(QMainWindow):
             return
             
         self.background_pixmap = screen.grabWindow(0)
-        self.update_display()
+        self._cache_overlay()
+        self._do_update_display()
+    
+    def _cache_overlay(self):
+        """Darken a copy of the background once so redraws only blit the selection."""
+        self._dark_pixmap = self.background_pixmap.copy()
+        painter = QPainter(self._dark_pixmap)
+        painter.fillRect(self._dark_pixmap.rect(), QColor(0, 0, 0, 128))  # 50% transparency
+        painter.end()
+    
+    def _schedule_update_display(self):
+        """Redraw on the next timer tick, folding in any updates queued before it."""
+        if not self._update_timer.isActive():
+            self._update_timer.start()
     
-    def update_display(self):
+    def _do_update_display(self):
         """Update the display with the current background, selection, and annotations."""
+        # Drawing now supersedes any redraw still queued
+        self._update_timer.stop()
+        
         # Enable/disable OCR button based on selection
         self.ocr_btn.setEnabled(not self.selection_rect.isNull() and self.tesseract_installed)
         if self.background_pixmap is None:
             return
             
-        # Create a copy of the background
-        display_pixmap = self.background_pixmap.copy()
-        painter = QPainter(display_pixmap)
+        # Show the cached darkened background while selecting; drawForeground
+        # blits the selection back in, so the full-screen pixmaps are never copied
+        pixmap = self._dark_pixmap if self._dims_background() else self.background_pixmap
+        if self._bg_item.pixmap().cacheKey() != pixmap.cacheKey():
+            if self._bg_item.pixmap().size() != pixmap.size():
+                self.graphics_view.setSceneRect(QRectF(pixmap.rect()))
+            self._bg_item.setPixmap(pixmap)
+        
+        # Repaint only where the old and new overlays are drawn
+        overlay_rect = self._overlay_bounds()
+        dirty = self._overlay_rect.united(overlay_rect)
+        if not dirty.isNull():
+            self.scene.update(QRectF(dirty))
+        self._overlay_rect = overlay_rect
+    
+    def _dims_background(self) -> bool:
+        """Whether the area outside the selection is darkened (not in annotation mode)."""
+        return not self.annotation_mode and (self.is_selecting or not self.selection_rect.isNull())
+    
+    def _overlay_bounds(self) -> QRect:
+        """Return the scene area covered by the selection border, size label and annotation."""
+        bounds = QRect()
+        if not self.selection_rect.isNull():
+            rect = self.selection_rect.normalized()
+            bounds = rect.adjusted(-2, -2, 2, 2).united(self._size_label(rect)[1])
+        annotation = self.current_annotation
+        if self.annotation_mode and annotation and annotation['start_pos']:
+            # Arrow heads reach up to four line widths past the end point
+            margin = annotation.get('line_width', 2) * 4 + 2
+            bounds = bounds.united(
+                QRect(annotation['start_pos'], annotation['end_pos']).normalized().adjusted(
+                    -margin, -margin, margin, margin))
+        return bounds
+    
+    def _draw_overlay(self, painter: QPainter):
+        """Draw the undimmed selection and its border, the size label and any annotation in progress."""
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # Draw semi-transparent overlay (only outside selection in non-annotation mode)
-        if not self.annotation_mode and (self.is_selecting or not self.selection_rect.isNull()):
-            overlay = QPixmap(display_pixmap.size())
-            overlay.fill(Qt.GlobalColor.black)
-            overlay.setAlpha(128)  # 50% transparency
-            
-            # Create a path that covers the entire image except the selection
-            path = QPainterPath()
-            path.addRect(display_pixmap.rect())
-            if not self.selection_rect.isNull():
-                path.addRect(self.selection_rect.normalized())
-            
-            # Draw the overlay with the path as a mask
-            painter.setClipPath(path)
-            painter.drawPixmap(0, 0, overlay)
-            painter.setClipping(False)
+        if self._dims_background() and self.background_pixmap is not None:
+            # Punch the selection through with the undarkened background
+            selection = self.selection_rect.normalized()
+            painter.drawPixmap(selection, self.background_pixmap, selection)
             
             # Draw selection rectangle
             painter.setPen(QPen(Qt.GlobalColor.red, 2, Qt.PenStyle.DashLine))
             painter.setBrush(Qt.BrushStyle.NoBrush)
-            painter.drawRect(self.selection_rect.normalized())
+            painter.drawRect(selection)
         
         # Draw current annotation in progress
         if self.annotation_mode and self.current_annotation and self.current_annotation['start_pos']:
@@ -256,28 +342,23 @@ class ScreenCaptureDialog(QMainWindow):
         # Draw size info for selection
         if not self.selection_rect.isNull():
             rect = self.selection_rect.normalized()
-            size_text = f"{rect.width()} x {rect.height()}"
+            size_text, text_rect = self._size_label(rect)
             
             # Draw text with background for better visibility
-            font = painter.font()
-            font.setBold(True)
-            painter.setFont(font)
-            
-            text_rect = painter.boundingRect(rect, Qt.AlignmentFlag.AlignCenter, size_text)
-            text_rect.moveBottomLeft(rect.bottomLeft() + QPoint(0, 20))
-            
-            # Ensure text is visible
-            text_rect.adjust(-2, -2, 2, 2)
+            painter.setFont(self._label_font)
             painter.fillRect(text_rect, QColor(0, 0, 0, 180))
             painter.setPen(Qt.GlobalColor.white)
             painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, size_text)
-        
-        painter.end()
-        
-        # Update the scene
-        self.scene.clear()
-        self.scene.addPixmap(display_pixmap)
-        self.graphics_view.setSceneRect(display_pixmap.rect())
+    
+    def _size_label(self, rect: QRect) -> Tuple[str, QRect]:
+        """Return the "W x H" label for a selection and where it is drawn, just below it."""
+        size_text = f"{rect.width()} x {rect.height()}"
+        height = self._label_metrics.height()
+        text_rect = QRect(rect.left(), rect.bottom() + 21 - height,
+                          self._label_metrics.horizontalAdvance(size_text), height)
+        
+        # Ensure text is visible
+        return size_text, text_rect.adjusted(-2, -2, 2, 2)
     
     def _draw_annotation(self, painter: QPainter, annotation: dict):
         """Draw an annotation on the painter."""
@@ -298,42 +379,43 @@ class ScreenCaptureDialog(QMainWindow):
             painter.setBrush(Qt.BrushStyle.NoBrush)
         
         # Draw based on annotation type
-        tool_type = annotation.get('type', ToolType.RECTANGLE)
-        start = annotation['start_pos']
-        end = annotation['end_pos']
-        
-        if tool_type == ToolType.RECTANGLE:
-            painter.drawRect(QRectF(start, end).normalized())
-        elif tool_type == ToolType.ELLIPSE:
-            painter.drawEllipse(QRectF(start, end).normalized())
-        elif tool_type == ToolType.ARROW:
-            self._draw_arrow(painter, start, end, pen)
-        elif tool_type == ToolType.LINE:
-            painter.drawLine(start, end)
-        elif tool_type == ToolType.HIGHLIGHT:
-            self._draw_highlight(painter, start, end, pen)
+        draw = self._DRAW_TOOLS.get(annotation.get('type', ToolType.RECTANGLE))
+        if draw is not None:
+            draw(self, painter, QPointF(annotation['start_pos']), QPointF(annotation['end_pos']), pen)
+    
+    def _draw_rect(self, painter: QPainter, start: QPointF, end: QPointF, pen: QPen):
+        """Draw a rectangle spanning start and end."""
+        painter.drawRect(QRectF(start, end).normalized())
+    
+    def _draw_ellipse(self, painter: QPainter, start: QPointF, end: QPointF, pen: QPen):
+        """Draw an ellipse inside the rectangle spanning start and end."""
+        painter.drawEllipse(QRectF(start, end).normalized())
+    
+    def _draw_line(self, painter: QPainter, start: QPointF, end: QPointF, pen: QPen):
+        """Draw a line from start to end."""
+        painter.drawLine(start, end)
     
     def _draw_arrow(self, painter: QPainter, start: QPointF, end: QPointF, pen: QPen):
         """Draw an arrow from start to end."""
         # Draw the line
         painter.drawLine(start, end)
         
-        # Draw arrow head
-        arrow_size = pen.width() * 4
-        angle = (end - start).angle() * 3.14159 / 180.0
-        
-        p1 = end - QPointF(
-            arrow_size * 0.8 * (math.cos(angle + 0.3)),
-            arrow_size * 0.8 * (math.sin(angle + 0.3))
-        )
-        p2 = end - QPointF(
-            arrow_size * 0.8 * (math.cos(angle - 0.3)),
-            arrow_size * 0.8 * (math.sin(angle - 0.3))
-        )
+        # Draw arrow head; its geometry only changes when the arrow does,
+        # so repaints of an unchanged arrow reuse the last polygon
+        key = (start.x(), start.y(), end.x(), end.y(), pen.width())
+        if key != self._arrow_key:
+            arrow_size = pen.width() * 4 * 0.8
+            angle = math.atan2(end.y() - start.y(), end.x() - start.x())
+            cos, sin = math.cos, math.sin
+            self._arrow_head = QPolygonF([
+                end,
+                end - QPointF(arrow_size * cos(angle + 0.3), arrow_size * sin(angle + 0.3)),
+                end - QPointF(arrow_size * cos(angle - 0.3), arrow_size * sin(angle - 0.3)),
+            ])
+            self._arrow_key = key
         
-        arrow_head = QPolygonF([end, p1, p2])
         painter.setBrush(QBrush(pen.color()))
-        painter.drawPolygon(arrow_head)
+        painter.drawPolygon(self._arrow_head)
     
     def _draw_highlight(self, painter: QPainter, start: QPointF, end: QPointF, pen: QPen):
         """Draw a highlight rectangle."""
@@ -353,37 +435,51 @@ class ScreenCaptureDialog(QMainWindow):
         painter.setPen(old_pen)
         painter.setBrush(old_brush)
     
+    # Drawing function for each annotation tool; tools without one draw nothing
+    _DRAW_TOOLS = {
+        ToolType.RECTANGLE: _draw_rect,
+        ToolType.ELLIPSE: _draw_ellipse,
+        ToolType.ARROW: _draw_arrow,
+        ToolType.LINE: _draw_line,
+        ToolType.HIGHLIGHT: _draw_highlight,
+    }
+    
+    def _scene_pos(self, event) -> QPoint:
+        """Position of a mouse event on the captured screen, below the toolbar."""
+        view = self.graphics_view
+        return view.mapToScene(view.mapFrom(self, event.position().toPoint())).toPoint()
+    
     def mousePressEvent(self, event):
         """Handle mouse press events."""
         if event.button() == Qt.MouseButton.LeftButton:
             if self.annotation_mode and self.current_annotation:
                 # Start a new annotation
-                self.current_annotation['start_pos'] = event.pos()
-                self.current_annotation['end_pos'] = event.pos()
+                self.current_annotation['start_pos'] = self._scene_pos(event)
+                self.current_annotation['end_pos'] = self._scene_pos(event)
             else:
                 # Start selection
-                self.selection_start = event.pos()
-                self.selection_end = event.pos()
+                self.selection_start = self._scene_pos(event)
+                self.selection_end = self._scene_pos(event)
                 self.selection_rect = QRect(self.selection_start, self.selection_end)
                 self.is_selecting = True
-                self.update_display()
+                self._schedule_update_display()
     
     def mouseMoveEvent(self, event):
         """Handle mouse move events."""
         if self.is_selecting:
-            self.selection_end = event.pos()
+            self.selection_end = self._scene_pos(event)
             self.selection_rect = QRect(self.selection_start, self.selection_end)
-            self.update_display()
+            self._schedule_update_display()
         elif self.annotation_mode and self.current_annotation and self.current_annotation['start_pos']:
             # Update annotation end position
-            self.current_annotation['end_pos'] = event.pos()
-            self.update_display()
+            self.current_annotation['end_pos'] = self._scene_pos(event)
+            self._schedule_update_display()
     
     def mouseReleaseEvent(self, event):
         """Handle mouse release events."""
         if event.button() == Qt.MouseButton.LeftButton:
             if self.is_selecting:
-                self.selection_end = event.pos()
+                self.selection_end = self._scene_pos(event)
                 self.selection_rect = QRect(self.selection_start, self.selection_end).normalized()
                 self.is_selecting = False
                 
@@ -391,15 +487,15 @@ class ScreenCaptureDialog(QMainWindow):
                 if self.selection_rect.width() < 10 or self.selection_rect.height() < 10:
                     self.selection_rect = QRect()
                 
-                self.update_display()
+                self._do_update_display()
             elif self.annotation_mode and self.current_annotation and self.current_annotation['start_pos']:
                 # Finish the current annotation
-                self.current_annotation['end_pos'] = event.pos()
+                self.current_annotation['end_pos'] = self._scene_pos(event)
                 
                 # Add to annotations list or process as needed
                 # For now, just reset the current annotation
                 self.current_annotation = None
-                self.update_display()
+                self._do_update_display()
     
     def keyPressEvent(self, event):
         """Handle key press events."""
@@ -422,7 +518,7 @@ class ScreenCaptureDialog(QMainWindow):
             'type': tool_type,
             'start_pos': None,
             'end_pos': None,
-            'color': QColor(self.color_btn.styleSheet().split(':')[1].strip(';')),
+            'color': QColor(self._current_color),
             'line_width': self.line_width.value(),
             'filled': self.fill_check.isChecked()
         }
@@ -432,10 +528,11 @@ class ScreenCaptureDialog(QMainWindow):
         """Show color selection dialog."""
         color = QColorDialog.getColor()
         if color.isValid():
+            self._current_color = color
             self.color_btn.setStyleSheet(f"background-color: {color.name()};")
     
     def extract_text_from_selection(self):
-        """Extract text from the selected region using OCR."""
+        """Extract text from the selected region using OCR on the thread pool."""
         if self.selection_rect.isNull() or self.background_pixmap is None:
             return
         
@@ -444,6 +541,7 @@ class ScreenCaptureDialog(QMainWindow):
         loading_dialog.setWindowTitle("Extracting Text...")
         loading_dialog.setFixedSize(300, 100)
         loading_dialog.setWindowModality(Qt.WindowModality.ApplicationModal)
+        loading_dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
         
         layout = QVBoxLayout(loading_dialog)
         layout.addWidget(QLabel("Extracting text, please wait..."))
@@ -452,95 +550,92 @@ class ScreenCaptureDialog(QMainWindow):
         cancel_btn = QPushButton("Cancel")
         cancel_btn.clicked.connect(loading_dialog.reject)
         layout.addWidget(cancel_btn)
+        loading_dialog.rejected.connect(self.cancel_ocr)
         
-        # Show the dialog immediately
-        loading_dialog.show()
-        QApplication.processEvents()
+        # QPixmap may only be used on the GUI thread, so the worker is given a QImage
+        selected_region = self.background_pixmap.copy(self.selection_rect).toImage()
         
-        # Flag to track if operation was cancelled
-        self.ocr_cancelled = False
-        
-        def run_ocr():
-            try:
-                # Extract the selected region
-                selected_region = self.background_pixmap.copy(self.selection_rect)
-                
-                # Convert QPixmap to PIL Image
-                qimage = selected_region.toImage()
-                buffer = qimage.bits().asstring(qimage.sizeInBytes())
-                pil_image = Image.frombytes(
-                    'RGBA', 
-                    (qimage.width(), qimage.height()), 
-                    buffer, 
-                    'raw', 'RGBA'
-                )
-                
-                # Get selected language
-                lang = self.lang_combo.currentData()
-                
-                # Check if dialog was closed
-                if not loading_dialog.isVisible():
-                    return
-                
-                # Extract text using OCR
-                text, metadata = self.ocr_processor.extract_text(
-                    pil_image,
-                    config={
-                        'lang': lang,
-                        'preprocess': True,
-                        'contrast_factor': 1.5,
-                        'sharpen': True,
-                        'denoise': True,
-                        'threshold': True
-                    }
-                )
-                
-                # Check if dialog was closed
-                if not loading_dialog.isVisible():
-                    return
-                
-                # Show the extracted text in a dialog
-                self.show_ocr_result(text, metadata)
-                
-            except pytesseract.TesseractNotFoundError:
-                if loading_dialog.isVisible():
-                    loading_dialog.reject()
-                self.show_ocr_install_instructions()
-                
-            except Exception as e:
-                if loading_dialog.isVisible():
-                    loading_dialog.reject()
-                QMessageBox.critical(
-                    self, 
-                    "OCR Error", 
-                    f"Error extracting text: {str(e)}\n\n"
-                    "Please check that Tesseract OCR is properly installed and in your system PATH."
-                )
-                logger.error(f"OCR extraction failed: {str(e)}", exc_info=True)
-                
-            finally:
-                if loading_dialog.isVisible():
-                    loading_dialog.accept()
+        worker = Worker(self._run_ocr, selected_region, self.lang_combo.currentData())
+        worker.signals.result.connect(self._on_ocr_result)
+        worker.signals.error.connect(self._on_ocr_error)
+        self._ocr_worker = worker
+        self._ocr_loading_dialog = loading_dialog
+        QThreadPool.globalInstance().start(worker)
         
-        # Run OCR in a separate thread to keep the UI responsive
-        from PyQt6.QtCore import QThread, pyqtSignal
+        # Show the dialog without blocking; the result slots close it
+        loading_dialog.open()
+    
+    def _run_ocr(self, qimage: QImage, lang: str) -> Tuple[str, dict]:
+        """Recognise the text in a selected region; runs on the thread pool."""
+        # Shrink oversized selections up front; preprocessing then
+        # rescales the text to the height Tesseract reads best
+        if max(qimage.width(), qimage.height()) > _OCR_MAX_SIDE:
+            qimage = qimage.scaled(_OCR_MAX_SIDE, _OCR_MAX_SIDE,
+                                   Qt.AspectRatioMode.KeepAspectRatio,
+                                   Qt.TransformationMode.SmoothTransformation)
+        
+        # Convert to PIL Image, viewing the QImage buffer without copying it
+        qimage = qimage.convertToFormat(QImage.Format.Format_RGBA8888)
+        ptr = qimage.constBits()
+        ptr.setsize(qimage.sizeInBytes())
+        arr = np.frombuffer(ptr, np.uint8).reshape(
+            (qimage.height(), qimage.bytesPerLine() // 4, 4))[:, :qimage.width()]
+        pil_image = Image.fromarray(arr, 'RGBA')
+        
+        # Extract text using OCR
+        return self.ocr_processor.extract_text(
+            pil_image,
+            config={
+                'lang': lang,
+                'preprocess': True,
+                'contrast_factor': 1.5,
+                'sharpen': True,
+                'denoise': True,
+                'threshold': True
+            }
+        )
+    
+    def cancel_ocr(self):
+        """Stop waiting for the running OCR; its result is discarded."""
+        self._ocr_worker = None
+    
+    def _take_ocr_result(self) -> bool:
+        """Close the loading dialog for the current OCR, or return False for a cancelled one."""
+        if self._ocr_worker is None or self.sender() is not self._ocr_worker.signals:
+            return False  # Result of an OCR that has been cancelled
+        self._ocr_worker = None
+        self._ocr_loading_dialog.accept()
+        return True
+    
+    def _on_ocr_result(self, result: Tuple[str, dict]):
+        """Show the text recognised in the selection."""
+        if not self._take_ocr_result():
+            return
         
-        class OCRThread(QThread):
-            finished = pyqtSignal()
-            
-            def run(self):
-                run_ocr()
-                self.finished.emit()
-        
-        self.ocr_thread = OCRThread()
-        self.ocr_thread.finished.connect(loading_dialog.accept)
-        self.ocr_thread.start()
-        
-        # Show the dialog and wait for it to be closed
-        if loading_dialog.exec() == QDialog.DialogCode.Rejected:
-            self.ocr_cancelled = True
-            self.ocr_thread.terminate()
-            self.ocr_thread.wait()
+        # OCRProcessor reports failures in the metadata rather than raising
+        text, metadata = result
+        error = metadata.get('error')
+        if error == _TESSERACT_NOT_FOUND:
+            self.show_ocr_install_instructions()
+        elif error:
+            self._show_ocr_error(error)
+        else:
+            self.show_ocr_result(text, metadata)
+    
+    def _on_ocr_error(self, error: str):
+        """Report an OCR whose worker raised."""
+        if self._take_ocr_result():
+            self._show_ocr_error(error)
+    
+    def _show_ocr_error(self, error: str):
+        """Report a failed OCR."""
+        QMessageBox.critical(
+            self, 
+            "OCR Error", 
+            f"Error extracting text: {error}\n\n"
+            "Please check that Tesseract OCR is properly installed and in your system PATH."
+        )
+        logger.error(f"OCR extraction failed: {error}")
     
     def show_ocr_result(self, text: str, metadata: dict):
         """Display the OCR results in a dialog."""
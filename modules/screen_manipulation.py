@@ -4,6 +4,7 @@ Provides functionality for capturing and manipulating screen content.
 """
 import os
 import logging
+import tempfile
 import numpy as np
 from typing import Optional, Tuple, Union, List
 from dataclasses import dataclass
@@ -24,6 +25,25 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# QPixmap.save quality per extension. For PNG, Qt maps quality inversely to
+# the zlib level: 80 gives level 1, which is several times faster than the
+# default for a few percent larger files; 100 (level 0) is for temp files.
+_SAVE_QUALITY = {'.png': 80, '.jpg': 90, '.jpeg': 90}
+_TEMP_PNG_QUALITY = 100
+
+
+def save_quality(filepath: str) -> int:
+    """
+    Get the QPixmap.save quality to use for a file.
+    
+    Args:
+        filepath: Path the image will be saved to
+        
+    Returns:
+        int: Quality for the file's extension, or -1 for Qt's default
+    """
+    return _SAVE_QUALITY.get(os.path.splitext(filepath)[1].lower(), -1)
+
 @dataclass
 class ScreenRegion:
     """Represents a region of the screen with coordinates and dimensions."""
@@ -182,10 +202,10 @@ class ScreenCapture(QObject):
             
             # Save with appropriate format based on extension
             if filepath.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp', '.gif')):
-                return target.save(filepath)
+                return target.save(filepath, None, save_quality(filepath))
             else:
                 # Default to PNG if extension not recognized
-                return target.save(filepath + '.png', 'PNG')
+                return target.save(filepath + '.png', 'PNG', save_quality('.png'))
                 
         except Exception as e:
             error_msg = f"Failed to save screenshot: {str(e)}"
@@ -193,12 +213,15 @@ class ScreenCapture(QObject):
             self.error_occurred.emit(error_msg)
             return False
     
-    def ocr_text(self, pixmap: Optional[QPixmap] = None) -> str:
+    def ocr_text(self, pixmap: Optional[Union[QPixmap, QImage]] = None) -> str:
         """
         Extract text from a screenshot using OCR.
         
+        Pass a QImage rather than a QPixmap when calling from a worker thread;
+        QPixmap may only be used on the GUI thread.
+        
         Args:
-            pixmap: Optional pixmap to process. If None, uses last capture.
+            pixmap: Optional pixmap or image to process. If None, uses last capture.
             
         Returns:
             Extracted text as string.
@@ -212,7 +235,7 @@ class ScreenCapture(QObject):
                 raise ValueError("No screenshot available for OCR")
                 
             # Convert QPixmap to PIL Image
-            qimage = target.toImage()
+            qimage = target.toImage() if isinstance(target, QPixmap) else target
             width, height = qimage.width(), qimage.height()
             
             # Convert to format suitable for OpenCV
@@ -233,6 +256,50 @@ class ScreenCapture(QObject):
             logger.error(error_msg, exc_info=True)
             self.error_occurred.emit(error_msg)
             return ""
+    
+    def ocr_text_batch(self, pixmaps: List[Union[QPixmap, QImage]]) -> List[str]:
+        """
+        Extract text from several screenshots with a single Tesseract run.
+        
+        Tesseract is given a list file naming one image per line and separates
+        the pages of its output with form feeds, so process start-up and
+        language model loading are paid once for the whole batch.
+        
+        Args:
+            pixmaps: Pixmaps or images to process (images when off the GUI thread)
+            
+        Returns:
+            Extracted text for each pixmap, in order ("" where nothing was found).
+        """
+        if len(pixmaps) == 1:
+            return [self.ocr_text(pixmaps[0])]
+        
+        try:
+            if not SCREEN_CAPTURE_AVAILABLE:
+                raise RuntimeError("OCR dependencies not available")
+            
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                paths = []
+                for i, pixmap in enumerate(pixmaps):
+                    path = os.path.join(tmp_dir, f"{i}.png")
+                    if not pixmap.save(path, "PNG", _TEMP_PNG_QUALITY):
+                        raise RuntimeError(f"Could not write image {i} for OCR")
+                    paths.append(path)
+                
+                list_path = os.path.join(tmp_dir, "images.txt")
+                with open(list_path, 'w', encoding='utf-8') as f:
+                    f.write('\n'.join(paths) + '\n')
+                
+                text = pytesseract.image_to_string(list_path)
+            
+            pages = text.split('\f')
+            return [pages[i].strip() if i < len(pages) else "" for i in range(len(pixmaps))]
+            
+        except Exception as e:
+            error_msg = f"OCR failed: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            self.error_occurred.emit(error_msg)
+            return [""] * len(pixmaps)
 
 # Example usage
 if __name__ == "__main__":
@@ -113,6 +113,30 @@ class SettingsDialog(QDialog):
         # Load voice settings
         self.load_voice_settings()
     
+    def reload(self, voice_assistant=None):
+        """
+        Refresh the dialog from the environment and settings file.
+        
+        Called before a kept dialog is shown again, so it reflects changes
+        made since it was built.
+        
+        Args:
+            voice_assistant: Voice assistant to use, if one exists now
+        """
+        if voice_assistant is not None:
+            self.voice_assistant = voice_assistant
+        self.api_key = os.getenv('GROQ_API_KEY', '')
+        self.api_key_input.setText(self.api_key)
+        self.settings = self._load_settings()
+        
+        if self.theme_manager:
+            # Reflect the current theme without re-applying it
+            self.theme_combo.blockSignals(True)
+            self.theme_combo.setCurrentText(self.theme_manager.get_current_theme())
+            self.theme_combo.blockSignals(False)
+        
+        self.load_voice_settings()
+    
     def _load_settings(self) -> Dict[str, Any]:
         """Load settings from file or return defaults."""
         default_settings = {
@@ -9,7 +9,7 @@ QMainWindow {
     font-family: 'Segoe UI', Arial, sans-serif;
 }
 
-QTextBrowser {
+QTextBrowser, QPlainTextEdit {
     background-color: white;
     border: 1px solid #ddd;
     border-radius: 8px;
@@ -3,6 +3,7 @@ To-Do List module for MAYA AI Chatbot.
 Handles the creation, management, and persistence of to-do items.
 """
 import json
+import logging
 import os
 from datetime import datetime
 from typing import List, Dict, Any, Optional
@@ -36,7 +37,7 @@ class TodoItem:
     def __init__(self, title: str, description: str = "", due_date: str = "", 
                  priority: int = PRIORITY_MEDIUM, completed: bool = False, 
                  created_at: str = None, category: str = "General", 
-                 reminder: str = ""):
+                 reminder: str = "", notified: bool = False):
         """
         Initialize a new to-do item.
         
@@ -49,6 +50,7 @@ class TodoItem:
             created_at: Creation timestamp in ISO format
             category: Category of the task (e.g., Work, Personal, Shopping)
             reminder: Reminder date/time in ISO format (YYYY-MM-DDTHH:MM)
+            notified: Whether the reminder for the current dates has been shown
         """
         self.title = title
         self.description = description
@@ -57,6 +59,7 @@ class TodoItem:
         self.completed = completed
         self.category = category
         self.reminder = reminder
+        self.notified = notified
         self.created_at = created_at or datetime.now().isoformat()
         self.updated_at = self.created_at
     
@@ -75,6 +78,7 @@ class TodoItem:
             'completed': self.completed,
             'category': self.category,
             'reminder': self.reminder,
+            'notified': self.notified,
             'created_at': self.created_at,
             'updated_at': self.updated_at
         }
@@ -90,6 +94,7 @@ class TodoItem:
             completed=data.get('completed', False),
             category=data.get('category', 'General'),
             reminder=data.get('reminder', ''),
+            notified=data.get('notified', False),
             created_at=data.get('created_at')
         )
     
@@ -105,7 +110,7 @@ class TodoItem:
     
     def needs_reminder(self) -> bool:
         """Check if a reminder should be shown for this task."""
-        if not self.reminder or self.completed:
+        if not self.reminder or self.completed or self.notified:
             return False
         try:
             reminder_time = datetime.fromisoformat(self.reminder)
@@ -138,7 +143,6 @@ class TodoList(QObject):
             self.categories.add(todo.category)
         self.todos.append(todo)
         self.save()
-        self.data_changed.emit()
     
     def update(self, index: int, todo: TodoItem) -> None:
         """Update an existing to-do item."""
@@ -148,14 +152,12 @@ class TodoList(QObject):
             todo.updated_at = datetime.now().isoformat()
             self.todos[index] = todo
             self.save()
-            self.data_changed.emit()
     
     def delete(self, index: int) -> None:
         """Delete a to-do item by index."""
         if 0 <= index < len(self.todos):
             del self.todos[index]
             self.save()
-            self.data_changed.emit()
     
     def get_categories(self) -> List[str]:
         """Get a sorted list of all categories."""
@@ -200,7 +202,6 @@ class TodoList(QObject):
             self.todos[index].completed = not self.todos[index].completed
             self.todos[index].updated_at = datetime.now().isoformat()
             self.save()
-            self.data_changed.emit()
     
     def load(self) -> None:
         """Load to-do items from the storage file."""
@@ -222,7 +223,11 @@ class TodoList(QObject):
                 self.todos = []
     
     def save(self) -> None:
-        """Save to-do items to the storage file."""
+        """Save to-do items to the storage file and emit data_changed.
+        
+        The signal is emitted even if writing fails, since the items in
+        memory have changed either way.
+        """
         try:
             # Update categories from todos
             todo_categories = {todo.category for todo in self.todos if todo.category}
@@ -235,9 +240,9 @@ class TodoList(QObject):
                     'saved_at': datetime.now().isoformat()
                 }
                 json.dump(data, f, indent=2)
-            self.data_changed.emit()
         except Exception as e:
             logging.error(f"Error saving todos: {e}")
+        self.data_changed.emit()
     
     def count(self) -> int:
         """
@@ -249,6 +254,87 @@ class TodoList(QObject):
         return len(self.todos)
 
 
+class TodoReminders(QObject):
+    """
+    Connects a to-do list to the Notifier that fires its reminders.
+    
+    The Notifier's queue is the only reminder path: it wakes for the next
+    due reminder and records it as notified, so each one is shown once.
+    Kept apart from TodoWidget so reminders fire even if the list is never shown.
+    """
+    
+    # Signal emitted when a reminder is triggered
+    reminder_triggered = pyqtSignal(TodoItem)
+    
+    def __init__(self, todo_list: TodoList, parent=None):
+        """
+        Initialize the reminders.
+        
+        Args:
+            todo_list: The TodoList instance to watch
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self.todo_list = todo_list
+        
+        # Reminder boxes currently open, see handle_reminder
+        self._message_boxes = set()
+        
+        # Initialize notifier; it reads the same file the list saves to, so
+        # each save re-plans its reminders and each notification it records
+        # is loaded back into the list
+        self.notifier = Notifier(self)
+        self.notifier.reminder_triggered.connect(self.handle_reminder)
+        self.notifier.todos_saved.connect(self._reload_list, Qt.ConnectionType.QueuedConnection)
+        self.todo_list.data_changed.connect(self.notifier.reload)
+    
+    def _reload_list(self):
+        """Pick up the notified flags the notifier has just written."""
+        self.todo_list.load()
+        self.todo_list.data_changed.emit()
+    
+    def handle_reminder(self, todo_data: dict):
+        """Show a reminder the notifier has just fired, without blocking.
+        
+        Args:
+            todo_data: Dictionary containing todo item data
+        """
+        # Find the corresponding TodoItem
+        todo = None
+        for t in self.todo_list.todos:
+            if (t.title == todo_data.get("title") and 
+                t.due_date == todo_data.get("due_date") and 
+                t.reminder == todo_data.get("reminder")):
+                todo = t
+                break
+        if todo is None:
+            todo = TodoItem.from_dict(todo_data)
+        
+        # Emit our own signal for UI updates
+        self.reminder_triggered.emit(todo)
+        
+        # Show a message box for the reminder; open(), not exec(), so the
+        # event loop and the other reminders keep running while it is up
+        parent = self.parent() if isinstance(self.parent(), QWidget) else None
+        msg = QMessageBox(QMessageBox.Icon.Information, "Reminder", f"Reminder: {todo.title}",
+                          QMessageBox.StandardButton.Ok, parent)
+        msg.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        
+        # Add more details to the message
+        details = []
+        if todo.due_date:
+            details.append(f"Due: {todo.due_date}")
+        if todo.description:
+            details.append(f"Description: {todo.description}")
+        if details:
+            msg.setInformativeText("\n".join(details))
+        
+        # A box without a parent is only kept alive by this reference
+        self._message_boxes.add(msg)
+        msg.finished.connect(lambda _, msg=msg: self._message_boxes.discard(msg))
+        msg.open()
+
+
 class TodoDialog(QDialog):
     """Dialog for adding or editing a to-do item."""
     
@@ -337,10 +423,14 @@ class TodoDialog(QDialog):
         Returns:
             TodoItem: The updated to-do item
         """
+        due_date = self.date_edit.text().strip()
+        reminder = self.reminder_edit.text().strip()
+        if (due_date, reminder) != (self.todo.due_date, self.todo.reminder):
+            self.todo.notified = False  # New dates get a new reminder
         self.todo.title = self.title_edit.text().strip()
         self.todo.description = self.desc_edit.toPlainText().strip()
-        self.todo.due_date = self.date_edit.text().strip()
-        self.todo.reminder = self.reminder_edit.text().strip()
+        self.todo.due_date = due_date
+        self.todo.reminder = reminder
         self.todo.priority = self.priority_combo.currentData()
         self.todo.category = self.category_combo.currentText().strip() or "General"
         self.todo.completed = self.completed_check.isChecked()
@@ -353,13 +443,14 @@ class TodoWidget(QWidget):
     # Signal emitted when a reminder is triggered
     reminder_triggered = pyqtSignal(TodoItem)
     
-    def __init__(self, todo_list: TodoList, parent=None):
+    def __init__(self, todo_list: TodoList, parent=None, reminders: Optional['TodoReminders'] = None):
         """
         Initialize the to-do widget.
         
         Args:
             todo_list: The TodoList instance to manage
             parent: Parent widget
+            reminders: Reminders of the list; one is created if not given
         """
         super().__init__(parent)
         self.todo_list = todo_list
@@ -368,23 +459,20 @@ class TodoWidget(QWidget):
         self.sort_by = "priority"  # priority, due_date, title
         self.sort_order = Qt.SortOrder.DescendingOrder  # Higher priority first
         
-        # Initialize notifier
-        self.notifier = Notifier()
+        # Reminders run whether or not the widget is shown; an application
+        # passes in the one it created at startup
+        self.reminders = reminders if reminders is not None else TodoReminders(todo_list, self)
+        self.notifier = self.reminders.notifier
         
         # Initialize UI components first
         self.setup_ui()
         
         # Connect signals after UI is set up
         self.todo_list.data_changed.connect(self.update_list)
-        self.notifier.reminder_triggered.connect(self.handle_reminder)
+        self.reminders.reminder_triggered.connect(self.reminder_triggered)
         
         # Update the list after UI is fully initialized
         self.update_list()
-        
-        # Setup reminder timer
-        self.reminder_timer = QTimer(self)
-        self.reminder_timer.timeout.connect(self.check_reminders)
-        self.reminder_timer.start(60000)  # Check every minute
     
     def setup_ui(self):
         """Set up the user interface."""
@@ -675,83 +763,6 @@ class TodoWidget(QWidget):
             todo.priority = priority
             self.todo_list.update(index, todo)
     
-    def handle_reminder(self, todo_data: dict):
-        """Handle a reminder notification.
-        
-        Args:
-            todo_data: Dictionary containing todo item data
-        """
-        # Find the corresponding TodoItem
-        todo = None
-        for t in self.todo_list.todos:
-            if (t.title == todo_data.get("title") and 
-                t.due_date == todo_data.get("due_date") and 
-                t.reminder == todo_data.get("reminder")):
-                todo = t
-                break
-                
-        if todo:
-            # Show a message box for the reminder
-            msg = QMessageBox()
-            msg.setIcon(QMessageBox.Icon.Information)
-            msg.setWindowTitle("Reminder")
-            msg.setText(f"Reminder: {todo.title}")
-            
-            # Add more details to the message
-            details = []
-            if todo.due_date:
-                details.append(f"Due: {todo.due_date}")
-            if todo.description:
-                details.append(f"Description: {todo.description}")
-                
-            if details:
-                msg.setInformativeText("\n".join(details))
-                
-            # Add buttons
-            msg.setStandardButtons(QMessageBox.StandardButton.Ok | QMessageBox.StandardButton.Snooze)
-            msg.setDefaultButton(QMessageBox.StandardButton.Ok)
-            
-            # Show the message box
-            result = msg.exec()
-            
-            # Handle snooze if needed
-            if result == QMessageBox.StandardButton.Snooze:
-                # Implement snooze logic here if needed
-                pass
-    
-    def check_reminders(self):
-        """Check for tasks with upcoming reminders and trigger notifications."""
-        for i in range(self.todo_list.count()):
-            todo = self.todo_list.get(i)
-            if todo and todo.needs_reminder():
-                # Create a dictionary with the todo item data
-                todo_data = {
-                    "title": todo.title,
-                    "due_date": todo.due_date,
-                    "reminder": todo.reminder,
-                    "description": todo.description,
-                    "priority": todo.priority,
-                    "category": todo.category,
-                    "completed": todo.completed
-                }
-                # Trigger the reminder
-                self.handle_reminder(todo_data)
-                
-                # Emit our own signal for UI updates
-                self.reminder_triggered.emit(todo)
-                
-                # Optionally show a message box
-                msg = QMessageBox()
-                msg.setIcon(QMessageBox.Icon.Information)
-                msg.setWindowTitle("MAYA Reminder")
-                msg.setText(f"Reminder: {todo.title}")
-            
-                if todo.due_date:
-                    msg.setInformativeText(f"Due: {format_date(todo.due_date)}")
-            
-                msg.setStandardButtons(QMessageBox.StandardButton.Ok)
-                msg.exec()
-    
     def edit_todo(self, item):
         """Edit the selected to-do item."""
         if not item:
@@ -13,6 +13,11 @@ import pyttsx3
 from PyQt6.QtCore import QObject, pyqtSignal, QTimer
 from .character import CharacterSystem, CharacterTrait
 
+# Failed reads in a row after which the microphone stream is reopened
+_MAX_STREAM_ERRORS = 3
+# Seconds to wait before each attempt to reopen it; the loop stops after the last
+_REOPEN_DELAYS = (1, 2, 5, 10, 30)
+
 class VoiceAssistant(QObject):
     """Handles voice input/output functionality with video support."""
     
@@ -193,52 +198,80 @@ class VoiceAssistant(QObject):
     
     def _listen_loop(self):
         """Main listening loop for the wake word."""
+        # The microphone stays open for the whole loop and is not recalibrated
+        # on every pass: reopening it and sampling a second of ambient noise
+        # each time left gaps in which the wake word was missed. The recognizer
+        # was calibrated in __init__ and its dynamic energy threshold keeps
+        # adapting while it listens.
+        # If the stream keeps failing it is closed and reopened after a
+        # growing delay; the error is reported once per outage, and the loop
+        # gives up once the delays are used up.
+        outages = 0  # Consecutive times the microphone had to be reopened
         while not self.stop_listening.is_set():
             try:
                 with self.microphone as source:
-                    self.recognizer.adjust_for_ambient_noise(source)
-                    audio = self.recognizer.listen(source, timeout=5, phrase_time_limit=3)
-                
-                try:
-                    # Recognize speech using Google's speech recognition
-                    text = self.recognizer.recognize_google(audio).lower()
-                    
-                    # Check for wake word
-                    if self.wake_word in text:
-                        self.wake_word_detected.emit()
-                        self.speak("Yes, how can I help you?")
-                        self.start_speech_recognition()
-                        
-                except sr.UnknownValueError:
-                    # Speech was unintelligible
-                    pass
-                except sr.RequestError as e:
-                    self.error_occurred.emit(f"Could not request results; {e}")
-                
-            except sr.WaitTimeoutError:
-                # No speech detected, continue listening
-                pass
+                    errors = 0  # Consecutive failed reads from this stream
+                    while not self.stop_listening.is_set():
+                        try:
+                            audio = self.recognizer.listen(source, timeout=5, phrase_time_limit=3)
+                            outages = errors = 0
+                            
+                            try:
+                                # Recognize speech using Google's speech recognition
+                                text = self.recognizer.recognize_google(audio).lower()
+                                
+                                # Check for wake word
+                                if self.wake_word in text:
+                                    self.wake_word_detected.emit()
+                                    self.speak("Yes, how can I help you?")
+                                    self._recognize_command(source)
+                                    
+                            except sr.UnknownValueError:
+                                # Speech was unintelligible
+                                pass
+                            except sr.RequestError as e:
+                                self.error_occurred.emit(f"Could not request results; {e}")
+                            
+                        except sr.WaitTimeoutError:
+                            # No speech detected, continue listening
+                            outages = errors = 0
+                        except Exception:
+                            errors += 1
+                            if errors >= _MAX_STREAM_ERRORS:
+                                raise  # Treat the stream as broken and reopen it
             except Exception as e:
-                self.error_occurred.emit(f"Error in listen loop: {str(e)}")
+                # The microphone could not be opened, or stopped delivering audio
+                if outages == 0:
+                    self.error_occurred.emit(f"Error in listen loop: {str(e)}")
+                if outages >= len(_REOPEN_DELAYS):
+                    break
+                self.stop_listening.wait(_REOPEN_DELAYS[outages])
+                outages += 1
     
     def start_speech_recognition(self):
         """Start actively listening for user commands."""
+        try:
+            with self.microphone as source:
+                self._recognize_command(source)
+        except Exception as e:
+            self.error_occurred.emit(f"Error in speech recognition: {str(e)}")
+    
+    def _recognize_command(self, source):
+        """Listen for one command on an already open microphone and emit it."""
         self.is_listening = True
         self.listening_changed.emit(True)
         
         try:
-            with self.microphone as source:
-                self.recognizer.adjust_for_ambient_noise(source)
-                audio = self.recognizer.listen(source, timeout=5, phrase_time_limit=5)
+            audio = self.recognizer.listen(source, timeout=5, phrase_time_limit=5)
+            
+            try:
+                text = self.recognizer.recognize_google(audio)
+                self.speech_recognized.emit(text)
+            except sr.UnknownValueError:
+                self.speak("I didn't catch that. Could you repeat?")
+            except sr.RequestError as e:
+                self.error_occurred.emit(f"Could not request results; {e}")
                 
-                try:
-                    text = self.recognizer.recognize_google(audio)
-                    self.speech_recognized.emit(text)
-                except sr.UnknownValueError:
-                    self.speak("I didn't catch that. Could you repeat?")
-                except sr.RequestError as e:
-                    self.error_occurred.emit(f"Could not request results; {e}")
-                    
         except Exception as e:
             self.error_occurred.emit(f"Error in speech recognition: {str(e)}")
         finally:
@@ -0,0 +1,129 @@
+"""
+Background workers for the MAYA AI Chatbot.
+Keeps blocking I/O off the GUI thread and reports back through Qt signals.
+"""
+
+import codecs
+import os
+
+from PyQt6.QtCore import QObject, QRunnable, QThread, pyqtSignal
+
+
+class FileLoader(QThread):
+    """
+    Reads a UTF-8 text file on a background thread and emits it in chunks.
+
+    The file is read ``chunk_size`` bytes at a time, so the receiver can
+    append it piece by piece instead of holding and inserting it all at once.
+    """
+    chunk_ready = pyqtSignal(str)  # Chunk of file text
+    progress = pyqtSignal(int)  # Percentage of the file read
+    load_finished = pyqtSignal(str)  # File path
+    load_failed = pyqtSignal(str)  # Error message
+
+    def __init__(self, file_path: str, chunk_size: int = 64 * 1024, parent=None):
+        super().__init__(parent)
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+
+    def run(self):
+        """Read the file and emit its contents chunk by chunk."""
+        try:
+            total = os.path.getsize(self.file_path) or 1
+            done = 0
+            # Incremental decoding copes with characters split across chunks
+            decoder = codecs.getincrementaldecoder('utf-8')()
+            with open(self.file_path, 'rb') as f:
+                while not self.isInterruptionRequested():
+                    data = f.read(self.chunk_size)
+                    text = decoder.decode(data, final=not data)
+                    if text:
+                        self.chunk_ready.emit(text)
+                    if not data:
+                        break
+                    done += len(data)
+                    self.progress.emit(done * 100 // total)
+                else:
+                    return
+            self.load_finished.emit(self.file_path)
+        except Exception as e:
+            self.load_failed.emit(str(e))
+
+
+class WorkerSignals(QObject):
+    """Signals emitted by a Worker (QRunnable cannot define signals itself)."""
+    result = pyqtSignal(object)  # Return value of the function
+    error = pyqtSignal(str)  # Error message
+
+
+class Worker(QRunnable):
+    """
+    Runs a function on the global QThreadPool.
+
+    The return value is emitted through ``signals.result`` and any exception
+    through ``signals.error``; both are delivered on the receiver's thread.
+    """
+
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def run(self):
+        """Call the function and report its outcome."""
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.result.emit(result)
+
+
+class BatchSignals(QObject):
+    """Signals emitted by a BatchWorker."""
+    batch_ready = pyqtSignal(list)  # Next batch of items
+    finished = pyqtSignal()  # All items delivered
+    error = pyqtSignal(str)  # Error message
+
+
+class BatchWorker(QRunnable):
+    """
+    Drains a generator on the global QThreadPool and emits its items in batches.
+
+    Batches let the receiver show results as they are found without paying
+    for one queued signal per item. Call cancel() to stop early.
+    """
+
+    def __init__(self, fn, *args, batch_size: int = 64, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.batch_size = batch_size
+        self.signals = BatchSignals()
+        self._cancelled = False
+
+    def cancel(self):
+        """Stop after the current item; nothing further is emitted."""
+        self._cancelled = True
+
+    def run(self):
+        """Iterate the generator and emit its items batch by batch."""
+        try:
+            batch = []
+            for item in self.fn(*self.args, **self.kwargs):
+                if self._cancelled:
+                    return
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    self.signals.batch_ready.emit(batch)
+                    batch = []
+            if self._cancelled:
+                return
+            if batch:
+                self.signals.batch_ready.emit(batch)
+            self.signals.finished.emit()
+        except Exception as e:
+            self.signals.error.emit(str(e))
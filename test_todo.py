@@ -1,9 +1,13 @@
 import sys
 import os
+import tempfile
 import unittest
 from datetime import datetime, timedelta
+from unittest.mock import patch
 from PyQt6.QtWidgets import QApplication
-from modules.todo import TodoItem, TodoList, TodoWidget, TodoDialog
+from PyQt6.QtTest import QTest
+from modules.file_manager import FileManager
+from modules.todo import TodoItem, TodoList, TodoWidget, TodoDialog, TodoReminders
 
 # Initialize QApplication for testing
 app = QApplication(sys.argv)
@@ -28,6 +32,16 @@ class TestTodoItem(unittest.TestCase):
         todo.completed = True
         self.assertFalse(todo.is_overdue())
 
+    def test_needs_reminder(self):
+        """Test that a due reminder is only needed until it has been shown."""
+        past = (datetime.now() - timedelta(minutes=5)).isoformat(timespec="minutes")
+        todo = TodoItem("Reminder Task", reminder=past)
+        self.assertTrue(todo.needs_reminder())
+        
+        # Shown reminders are not repeated
+        todo.notified = True
+        self.assertFalse(todo.needs_reminder())
+
 class TestTodoList(unittest.TestCase):
     def setUp(self):
         """Set up a clean TodoList for each test."""
@@ -100,5 +114,35 @@ class TestTodoWidget(unittest.TestCase):
         self.widget.on_filter_changed("Completed")
         self.assertEqual(len(self.widget.get_filtered_tasks()), 1)
 
+class TestTodoReminders(unittest.TestCase):
+    def setUp(self):
+        """Keep the reminder file in a scratch home directory."""
+        self.home = tempfile.TemporaryDirectory()
+        self.addCleanup(self.home.cleanup)
+        home_patch = patch.dict(os.environ, {"HOME": self.home.name})
+        home_patch.start()
+        self.addCleanup(home_patch.stop)
+        self.todo_list = TodoList(str(FileManager().get_data_path("todos.json")))
+        
+    def test_reminder_shown_once(self):
+        """Test that a due reminder fires once, and not again after edits."""
+        past = (datetime.now() - timedelta(minutes=1)).isoformat(timespec="minutes")
+        self.todo_list.add(TodoItem("Call back", reminder=past))
+        reminders = TodoReminders(self.todo_list)
+        fired = []
+        reminders.reminder_triggered.connect(lambda todo: fired.append(todo.title))
+        
+        QTest.qWait(300)
+        self.assertEqual(fired, ["Call back"])
+        self.assertTrue(self.todo_list.todos[0].notified)
+        
+        # Editing the item re-plans the reminders without repeating this one
+        self.todo_list.update(0, self.todo_list.todos[0])
+        QTest.qWait(300)
+        self.assertEqual(fired, ["Call back"])
+        
+        for box in list(reminders._message_boxes):
+            box.done(0)
+
 if __name__ == "__main__":
     unittest.main()
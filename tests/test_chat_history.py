@@ -0,0 +1,76 @@
+"""Tests for the chat window's scrollback and "Load earlier messages"."""
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+from PyQt6.QtCore import QPoint
+from PyQt6.QtWidgets import QApplication
+
+# Add the modules directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules import gui
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+SCROLLBACK = 30
+MESSAGES = 100
+
+
+class TestLoadEarlierMessages:
+    """Tests for ChatWindow.load_earlier_messages."""
+
+    @pytest.fixture
+    def window(self):
+        """A chat window holding more messages than its scrollback keeps."""
+        window = gui.ChatWindow()
+        window._settings_dialog.close()
+        window._chat_scrollback = SCROLLBACK
+        window.chat_display.clear()
+        window._reset_history()
+        window.show()
+        for i in range(MESSAGES):
+            window._append_message(window._user_prefix, f"message {i}")
+        app.processEvents()
+        yield window
+        window.close()
+
+    def top_line(self, window):
+        """Text of the line at the top of the chat view."""
+        return window.chat_display.cursorForPosition(QPoint(0, 0)).block().text()
+
+    def test_scrollback_prunes(self, window):
+        """Test that only the scrollback is displayed and the button is offered."""
+        document = window.chat_display.document()
+        assert document.blockCount() == SCROLLBACK
+        assert document.firstBlock().text() == f"You: message {MESSAGES - SCROLLBACK}"
+        assert window.load_earlier_button.isVisible()
+
+    def test_load_earlier_batch(self, window):
+        """Test that one batch is put back above and the view stays put."""
+        window._chat_scrollbar.setValue(0)
+        app.processEvents()
+        top = self.top_line(window)
+
+        with patch.object(gui, '_EARLIER_BATCH', 25):
+            window.load_earlier_button.click()
+        app.processEvents()
+
+        document = window.chat_display.document()
+        assert document.blockCount() == SCROLLBACK + 25
+        assert document.firstBlock().text() == f"You: message {MESSAGES - SCROLLBACK - 25}"
+        assert self.top_line(window) == top
+        assert window._chat_scrollbar.value() == 25
+        assert window.load_earlier_button.isVisible()
+
+    def test_load_all(self, window):
+        """Test that loading everything restores the whole history and hides the button."""
+        window.load_earlier_button.click()
+        app.processEvents()
+
+        document = window.chat_display.document()
+        assert document.blockCount() == MESSAGES
+        assert document.firstBlock().text() == "You: message 0"
+        assert document.lastBlock().text() == f"You: message {MESSAGES - 1}"
+        assert not window.load_earlier_button.isVisible()
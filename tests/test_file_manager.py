@@ -0,0 +1,44 @@
+"""Tests for the file manager module."""
+import json
+import os
+import sys
+
+# Add the modules directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.file_manager import FileManager
+
+
+class TestTodosPath:
+    """Tests for FileManager.get_todos_path."""
+
+    def test_legacy_list_copied(self, tmp_path, monkeypatch):
+        """Test that a list in the working directory is brought into the data directory."""
+        monkeypatch.chdir(tmp_path)
+        legacy = {'todos': [{'title': 'Old task'}], 'categories': ['General']}
+        (tmp_path / 'todos.json').write_text(json.dumps(legacy))
+        manager = FileManager(str(tmp_path / '.maya'))
+
+        path = manager.get_todos_path()
+        assert path == manager.get_data_path('todos.json')
+        assert manager.load_todos() == legacy
+        assert (tmp_path / 'todos.json').exists()  # Left in place
+
+    def test_existing_list_kept(self, tmp_path, monkeypatch):
+        """Test that a list already in the data directory is not overwritten."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / 'todos.json').write_text(json.dumps({'todos': [{'title': 'Old task'}]}))
+        manager = FileManager(str(tmp_path / '.maya'))
+        current = {'todos': [{'title': 'New task'}]}
+        manager.save_todos(current)
+
+        manager.get_todos_path()
+        assert manager.load_todos() == current
+
+    def test_no_legacy_list(self, tmp_path, monkeypatch):
+        """Test that nothing is created when there is no list to bring over."""
+        monkeypatch.chdir(tmp_path)
+        manager = FileManager(str(tmp_path / '.maya'))
+
+        path = manager.get_todos_path()
+        assert not path.exists()
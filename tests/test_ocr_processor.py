@@ -0,0 +1,219 @@
+"""Tests for the OCR processor module."""
+import os
+import sys
+from unittest.mock import patch
+
+import numpy as np
+from PIL import Image
+
+# Add the modules directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules import ocr_processor
+from modules.ocr_processor import (OCRProcessor, _pack_bits, _parse_tsv,
+                                   _sauvola_threshold, _text_from_data)
+
+TSV_HEADER = ('level\tpage_num\tblock_num\tpar_num\tline_num\tword_num\t'
+              'left\ttop\twidth\theight\tconf\ttext')
+
+
+def make_tsv(*words):
+    """Build image_to_data output from (block, par, line, conf, text) tuples."""
+    rows = [TSV_HEADER, '1\t1\t0\t0\t0\t0\t0\t0\t100\t100\t-1\t']
+    for block, par, line, conf, text in words:
+        rows.append(f'5\t1\t{block}\t{par}\t{line}\t1\t0\t0\t10\t10\t{conf}\t{text}')
+    return '\n'.join(rows) + '\n'
+
+
+class TestParseTsv:
+    """Tests for _parse_tsv."""
+
+    def test_columns(self):
+        """Test that the output is split into columns of strings."""
+        data = _parse_tsv(make_tsv((1, 1, 1, 96.5, 'Hello'), (1, 1, 1, 91, 'world')))
+        assert data['text'] == ('', 'Hello', 'world')
+        assert data['conf'] == ('-1', '96.5', '91')
+        assert data['line_num'] == ('0', '1', '1')
+
+    def test_empty_output(self):
+        """Test that empty output gives the columns extract_text reads, empty."""
+        data = _parse_tsv('')
+        for name in ('text', 'conf', 'block_num', 'par_num', 'line_num'):
+            assert data[name] == ()
+
+    def test_header_only(self):
+        """Test that a header without rows gives empty columns."""
+        data = _parse_tsv(TSV_HEADER + '\n')
+        assert data['text'] == ()
+        assert data['conf'] == ()
+
+    def test_short_row_is_padded(self):
+        """Test that a row with an empty last cell does not shorten the columns."""
+        tsv = make_tsv((1, 1, 1, 90, 'one')) + '5\t1\t1\t1\t1\t2\t0\t0\t10\t10\t-1\n'
+        data = _parse_tsv(tsv)
+        assert data['text'] == ('', 'one', '')
+        assert len(data['conf']) == 3
+
+
+class TestTextFromData:
+    """Tests for _text_from_data."""
+
+    def test_lines_and_paragraphs(self):
+        """Test that words, lines and paragraphs are joined as image_to_string does."""
+        data = _parse_tsv(make_tsv(
+            (1, 1, 1, 90, 'First'), (1, 1, 1, 90, 'line'),
+            (1, 1, 2, 90, 'Second'),
+            (1, 2, 1, 90, 'New'), (1, 2, 1, 90, 'paragraph'),
+            (2, 1, 1, 90, 'Block'),
+        ))
+        assert _text_from_data(data) == ('First line\nSecond\n\n'
+                                          'New paragraph\n\nBlock')
+
+    def test_blank_words_skipped(self):
+        """Test that layout rows and blank words add no text."""
+        data = _parse_tsv(make_tsv((1, 1, 1, 90, ' '), (1, 1, 1, 90, 'word')))
+        assert _text_from_data(data) == 'word'
+
+    def test_empty(self):
+        """Test that no words give no text."""
+        assert _text_from_data(_parse_tsv('')) == ''
+
+
+class TestBinarisation:
+    """Tests for _sauvola_threshold and _pack_bits."""
+
+    def test_sauvola_uneven_lighting(self):
+        """Test that dark text is separated on a background with a lighting gradient."""
+        background = np.tile(np.linspace(120, 250, 200, dtype=np.float32), (60, 1))
+        img = background.astype(np.uint8)
+        img[25:35, 20:180:20] = 30  # Dark strokes across the whole gradient
+        binary = _sauvola_threshold(img)
+        assert binary.dtype == np.uint8
+        assert binary.shape == img.shape
+        assert set(np.unique(binary)) <= {0, 255}
+        assert (binary[25:35, 20:180:20] == 0).all()
+        assert (binary[:10] == 255).all()
+
+    def test_pack_bits(self):
+        """Test that rows are packed most significant bit first, white set."""
+        binary = np.array([[255, 0, 0, 0, 0, 0, 0, 255, 255],
+                           [0, 255, 0, 0, 0, 0, 0, 0, 0]], dtype=np.uint8)
+        packed = _pack_bits(binary)
+        assert packed == bytes([0b10000001, 0b10000000, 0b01000000, 0b00000000])
+
+    def test_pack_bits_matches_pil(self):
+        """Test that packed bits give the same 1-bit image as PIL's conversion."""
+        rng = np.random.default_rng(0)
+        binary = (rng.random((13, 21)) > 0.5).astype(np.uint8) * 255
+        image = Image.frombytes('1', (21, 13), _pack_bits(binary))
+        expected = Image.fromarray(binary).convert('1', dither=Image.Dither.NONE)
+        assert image.tobytes() == expected.tobytes()
+
+
+class TestRescale:
+    """Tests for the text-size rescaling in _preprocess_array."""
+
+    config = {'rescale': True, 'denoise': False, 'threshold': False, 'sharpen': False,
+              'contrast_factor': 1.0, 'target_text_height': 24}
+
+    def rescaled_size(self, text_height, size=(1200, 400)):
+        """Preprocess a blank image whose text is text_height pixels tall."""
+        image = Image.new('L', size, 255)
+        with patch.object(ocr_processor, '_estimate_text_height', return_value=text_height):
+            img_np = OCRProcessor()._preprocess_array(image, self.config)
+        return img_np.shape[1], img_np.shape[0]
+
+    def test_small_text_triples(self):
+        """Test that 8 px text scales a 1200x400 screenshot by the full 3x."""
+        assert self.rescaled_size(8) == (3600, 1200)
+
+    def test_upscale_clamped(self):
+        """Test that tiny text is not scaled past 3x."""
+        assert self.rescaled_size(2) == (3600, 1200)
+
+    def test_downscale_clamped(self):
+        """Test that large text is not shrunk past half size."""
+        assert self.rescaled_size(200) == (600, 200)
+
+    def test_close_enough_unchanged(self):
+        """Test that text within 10% of the target is left alone."""
+        assert self.rescaled_size(23) == (1200, 400)
+
+    def test_no_text_unchanged(self):
+        """Test that an image without text-like shapes is left alone."""
+        assert self.rescaled_size(None) == (1200, 400)
+
+
+class TestCache:
+    """Tests for the extract_text result cache."""
+
+    def setup_method(self):
+        """Stub out Tesseract."""
+        self.processor = OCRProcessor()
+        self.patches = [
+            patch.object(ocr_processor, 'TESSEROCR_AVAILABLE', False),
+            patch.object(ocr_processor.pytesseract, 'image_to_data',
+                         return_value=make_tsv((1, 1, 1, 90, 'cached'))),
+        ]
+        for p in self.patches:
+            p.start()
+        self.image_to_data = ocr_processor.pytesseract.image_to_data
+
+    def teardown_method(self):
+        """Restore Tesseract."""
+        for p in self.patches:
+            p.stop()
+
+    def image(self, value=0):
+        """Make a small test image."""
+        return Image.new('RGB', (40, 20), (value, value, value))
+
+    def test_hit(self):
+        """Test that the same image and config are recognised once."""
+        first = self.processor.extract_text(self.image())
+        second = self.processor.extract_text(self.image())
+        assert first == second
+        assert first[0] == 'cached'
+        assert self.image_to_data.call_count == 1
+
+    def test_hit_returns_copy(self):
+        """Test that changing a returned metadata dict does not change the cache."""
+        _, metadata = self.processor.extract_text(self.image())
+        metadata['confidence'] = -1
+        _, metadata = self.processor.extract_text(self.image())
+        assert metadata['confidence'] == 90.0
+
+    def test_no_cache(self):
+        """Test that no_cache recognises the image again."""
+        self.processor.extract_text(self.image())
+        self.processor.extract_text(self.image(), {'no_cache': True})
+        assert self.image_to_data.call_count == 2
+
+    def test_config_and_pixels_in_key(self):
+        """Test that a different config or different pixels miss the cache."""
+        self.processor.extract_text(self.image())
+        self.processor.extract_text(self.image(), {'lang': 'deu'})
+        self.processor.extract_text(self.image(1))
+        assert self.image_to_data.call_count == 3
+
+    def test_key(self):
+        """Test that the key is a 16-byte digest of the pixels and config."""
+        config = dict(self.processor.default_config)
+        key = OCRProcessor._cache_key(self.image(), config)
+        assert len(key) == 16
+        assert key == OCRProcessor._cache_key(self.image(), dict(config))
+        assert key != OCRProcessor._cache_key(self.image(1), config)
+        assert key != OCRProcessor._cache_key(self.image(), {**config, 'psm': 7})
+
+    def test_eviction(self):
+        """Test that the least recently used result is dropped when full."""
+        with patch.object(ocr_processor, '_OCR_CACHE_SIZE', 2):
+            self.processor.extract_text(self.image(0))
+            self.processor.extract_text(self.image(1))
+            self.processor.extract_text(self.image(0))  # Now most recently used
+            self.processor.extract_text(self.image(2))  # Evicts image 1
+            assert len(self.processor._ocr_cache) == 2
+            self.processor.extract_text(self.image(0))
+            assert self.image_to_data.call_count == 3
+            self.processor.extract_text(self.image(1))
+            assert self.image_to_data.call_count == 4
@@ -0,0 +1,72 @@
+"""Tests for the screen capture dialog."""
+import os
+import sys
+
+import pytest
+from PyQt6.QtCore import Qt, QPoint, QTimer
+from PyQt6.QtWidgets import QApplication, QDialog
+from PyQt6.QtTest import QTest
+
+# Add the modules directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.screen_capture_dialog import ScreenCaptureDialog
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+
+class TestScreenCaptureDialog:
+    """Tests for ScreenCaptureDialog."""
+
+    @pytest.fixture
+    def dialog(self):
+        """A shown capture dialog."""
+        dialog = ScreenCaptureDialog()
+        dialog.show()
+        app.processEvents()
+        yield dialog
+        dialog.close()
+
+    def drag(self, dialog, start, end):
+        """Drag a selection on the capture view, in view coordinates."""
+        viewport = dialog.graphics_view.viewport()
+        QTest.mousePress(viewport, Qt.MouseButton.LeftButton, pos=start)
+        QTest.mouseMove(viewport, end)
+        QTest.mouseRelease(viewport, Qt.MouseButton.LeftButton, pos=end)
+
+    def test_is_dialog(self, dialog):
+        """Test that the dialog can be accepted, rejected and run modally."""
+        assert isinstance(dialog, QDialog)
+        assert dialog.background_pixmap is not None
+
+    def test_selection_in_screen_coordinates(self, dialog):
+        """Test that the selection is where the mouse was over the screenshot, not offset by the toolbar."""
+        self.drag(dialog, QPoint(100, 100), QPoint(200, 150))
+        assert dialog.selection_rect.topLeft() == dialog.graphics_view.mapToScene(QPoint(100, 100)).toPoint()
+        assert dialog.selection_rect.width() == 101
+        assert dialog.selection_rect.height() == 51
+        assert dialog.ocr_btn.isEnabled()
+
+    def test_small_selection_ignored(self, dialog):
+        """Test that a click without a drag selects nothing."""
+        self.drag(dialog, QPoint(50, 50), QPoint(52, 52))
+        assert dialog.selection_rect.isNull()
+
+    def test_accept_emits_capture(self, dialog):
+        """Test that accepting emits the selected region and closes the dialog."""
+        captures = []
+        dialog.capture_completed.connect(lambda pixmap, metadata: captures.append((pixmap, metadata)))
+        self.drag(dialog, QPoint(10, 10), QPoint(110, 60))
+        QTimer.singleShot(0, lambda: QTest.keyClick(dialog, Qt.Key.Key_Return))
+        assert dialog.exec() == QDialog.DialogCode.Accepted
+        pixmap, metadata = captures[0]
+        assert (pixmap.width(), pixmap.height()) == (101, 51)
+        assert metadata['region']['width'] == 101
+
+    def test_escape_rejects(self, dialog):
+        """Test that Escape cancels the capture."""
+        captures = []
+        dialog.capture_completed.connect(lambda *args: captures.append(args))
+        QTimer.singleShot(0, lambda: QTest.keyClick(dialog, Qt.Key.Key_Escape))
+        assert dialog.exec() == QDialog.DialogCode.Rejected
+        assert not captures